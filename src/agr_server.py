@@ -11,12 +11,41 @@ JSON-RPC protocol directly while maintaining full MCP compliance.
 """
 
 import asyncio
+import functools
 import json
 import logging
+import os
+import stat
 import sys
-from typing import Any, Dict, List, Optional
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple, Union
 
-import httpx
+from cachetools import TTLCache
+
+try:
+    import orjson
+
+    _loads = orjson.loads
+
+    def _dumps(obj: Any, indent: bool = False) -> str:
+        """Serialize to a JSON string, optionally pretty-printed."""
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if indent else 0).decode()
+
+    def _dumpb(obj: Any) -> bytes:
+        """Serialize to compact UTF-8 JSON bytes."""
+        return orjson.dumps(obj)
+except ImportError:
+    _loads = json.loads
+
+    def _dumps(obj: Any, indent: bool = False) -> str:
+        """Serialize to a JSON string, optionally pretty-printed."""
+        return json.dumps(obj, indent=2 if indent else None)
+
+    def _dumpb(obj: Any) -> bytes:
+        """Serialize to compact UTF-8 JSON bytes."""
+        return json.dumps(obj).encode()
+
+if TYPE_CHECKING:
+    import httpx
 
 # Configure logging
 logging.basicConfig(
@@ -32,24 +61,99 @@ class AGRClient:
     def __init__(self):
         self.base_url = "https://www.alliancegenome.org/api"
         self.timeout = 30.0
+        self._client: Optional["httpx.AsyncClient"] = None
+        self._cache: TTLCache = TTLCache(maxsize=1024, ttl=600)
+        self._inflight: Dict[tuple, asyncio.Task] = {}
+        # Caps concurrent requests to AGR so batched calls don't trigger rate limiting
+        self._semaphore = asyncio.Semaphore(10)
+
+    async def _get_client(self) -> "httpx.AsyncClient":
+        """Return the shared HTTP client, creating it on first use."""
+        if self._client is None:
+            # Imported here so server startup doesn't pay for httpx until it's needed
+            import httpx
+
+            self._client = httpx.AsyncClient(
+                base_url=self.base_url,
+                timeout=httpx.Timeout(self.timeout),
+                http2=True,
+                limits=httpx.Limits(
+                    max_keepalive_connections=20,
+                    max_connections=100,
+                    keepalive_expiry=30.0
+                )
+            )
+        return self._client
+
+    async def aclose(self):
+        """Close the shared HTTP client and its pooled connections."""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
         
     async def _make_request(self, endpoint: str, params: Optional[Dict] = None) -> Dict[str, Any]:
+        """Make cached HTTP request, coalescing concurrent identical calls.
+
+        The fetch runs as its own task, so a cancelled caller only stops
+        waiting; the request carries on for everyone else sharing it.
+        """
+        key = (endpoint, tuple(sorted((params or {}).items())))
+        cached = self._cache.get(key)
+        if cached is not None:
+            return cached
+
+        task = self._inflight.get(key)
+        if task is None:
+            task = self._inflight[key] = asyncio.create_task(self._fetch_shared(key, endpoint, params))
+        return await asyncio.shield(task)
+
+    async def _fetch_shared(self, key: tuple, endpoint: str,
+                            params: Optional[Dict] = None) -> Dict[str, Any]:
+        """Fetch for every caller waiting on ``key``, caching a successful result."""
+        try:
+            data = await self._fetch(endpoint, params)
+        finally:
+            self._inflight.pop(key, None)
+        if "error" not in data:
+            self._cache[key] = data
+        return data
+
+    async def _stream_body(self, client: "httpx.AsyncClient", path: str,
+                           params: Optional[Dict] = None) -> Tuple[int, bytearray]:
+        """Read a response body incrementally instead of buffering it in httpx."""
+        async with client.stream("GET", path, params=params) as response:
+            body = bytearray()
+            async for chunk in response.aiter_bytes(65536):
+                body.extend(chunk)
+            return response.status_code, body
+
+    async def _fetch(self, endpoint: str, params: Optional[Dict] = None) -> Dict[str, Any]:
         """Make robust HTTP request with comprehensive error handling."""
-        url = f"{self.base_url}/{endpoint.lstrip('/')}"
+        import httpx
+
+        path = endpoint.lstrip("/")
         
         try:
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
-                logger.debug(f"Requesting: {url} with params: {params}")
-                response = await client.get(url, params=params or {})
-                
-                if response.status_code == 200:
-                    data = response.json()
-                    logger.debug(f"Successfully retrieved {len(str(data))} characters")
-                    return data
+            client = await self._get_client()
+            logger.debug("Requesting: %s with params: %s", path, params)
+            
+            body: Union[bytes, bytearray]
+            async with self._semaphore:
+                if path.startswith("gene/"):
+                    # Gene records can run to tens of KB; stream them in chunks
+                    status_code, body = await self._stream_body(client, path, params)
                 else:
-                    error_msg = f"HTTP {response.status_code}: {response.text[:200]}"
-                    logger.warning(error_msg)
-                    return {"error": error_msg}
+                    response = await client.get(path, params=params)
+                    status_code, body = response.status_code, response.content
+            
+            if status_code == 200:
+                data = _loads(body)
+                logger.debug("Successfully retrieved %d bytes", len(body))
+                return data
+            else:
+                error_msg = f"HTTP {status_code}: {body[:200].decode(errors='replace')}"
+                logger.warning(error_msg)
+                return {"error": error_msg}
                     
         except httpx.TimeoutException:
             error_msg = "Request timeout - AGR API may be slow"
@@ -82,14 +186,68 @@ class AGRClient:
         """Get detailed gene information by identifier."""
         return await self._make_request(f"/gene/{gene_id}")
 
+    async def get_genes_info(self, gene_ids: List[str], concurrency: int = 10) -> List[Dict[str, Any]]:
+        """Get gene information for several identifiers concurrently, in input order."""
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def fetch_one(gene_id: str) -> Dict[str, Any]:
+            async with semaphore:
+                return await self.get_gene_info(gene_id)
+
+        return await asyncio.gather(*(fetch_one(gene_id) for gene_id in gene_ids))
+
+
+def _is_pipe(fd: int) -> bool:
+    """Whether asyncio's pipe transports accept ``fd``: a pipe or socket, not a file or tty."""
+    mode = os.fstat(fd).st_mode
+    return stat.S_ISFIFO(mode) or stat.S_ISSOCK(mode)
+
+
+class _FileWriter:
+    """Blocking stand-in for StreamWriter when stdout is a regular file or tty."""
+
+    def __init__(self, stream):
+        self._stream = stream
+
+    def write(self, data: bytes) -> None:
+        self._stream.write(data)
+
+    async def drain(self) -> None:
+        self._stream.flush()
+
+    def close(self) -> None:
+        self._stream.flush()
+
 
 class MCPServer:
     """Elegant MCP server implementation with direct JSON-RPC handling."""
     
     def __init__(self):
         self.agr_client = AGRClient()
-        self.tools = self._define_tools()
+        # Tool schemas are built on first use; the tool list never changes,
+        # so every tools/list reply shares one result
+        self._tools: Optional[List[Dict[str, Any]]] = None
+        self._tools_list_result: Optional[Dict[str, Any]] = None
+        self._tool_handlers = {
+            "search_genes": self._handle_search_genes,
+            "search_diseases": self._handle_search_diseases,
+            "get_gene_info": self._handle_get_gene_info,
+            "get_genes_info_bulk": self._handle_get_genes_info_bulk,
+        }
+        self._method_handlers = {
+            "initialize": self._handle_initialize,
+            "tools/list": self._handle_tools_list,
+            "tools/call": self._handle_tools_call,
+            "notifications/initialized": self._handle_initialized,
+        }
         
+    @property
+    def tools(self) -> List[Dict[str, Any]]:
+        """Available tool definitions, built on first access."""
+        if self._tools is None:
+            self._tools = self._define_tools()
+        return self._tools
+
     def _define_tools(self) -> List[Dict[str, Any]]:
         """Define available tools with comprehensive schemas."""
         return [
@@ -148,27 +306,45 @@ class MCPServer:
                     },
                     "required": ["gene_id"]
                 }
+            },
+            {
+                "name": "get_genes_info_bulk",
+                "description": "Get information about several genes at once, fetched concurrently",
+                "inputSchema": {
+                    "type": "object",
+                    "properties": {
+                        "gene_ids": {
+                            "type": "array",
+                            "items": {"type": "string"},
+                            "description": "Gene identifiers (e.g., [\"HGNC:1100\", \"MGI:88276\"])",
+                            "minItems": 1,
+                            "maxItems": 50
+                        }
+                    },
+                    "required": ["gene_ids"]
+                }
             }
         ]
 
     def _format_gene_results(self, results: List[Dict], query: str, limit: int) -> str:
         """Format gene search results elegantly."""
-        if not results:
+        genes = results[:limit]
+        if not genes:
             return f"No genes found for '{query}'"
-            
-        formatted_genes = []
-        for gene in results[:limit]:
-            gene_info = {
+        
+        formatted_genes = [
+            {
                 "symbol": gene.get("symbol", "Unknown"),
                 "name": gene.get("name", ""),
-                "species": gene.get("species", {}).get("name", ""),
+                "species": (gene.get("species") or {}).get("name", ""),
                 "id": gene.get("id", ""),
                 "biotype": gene.get("soTermName", "")
             }
-            formatted_genes.append(gene_info)
+            for gene in genes
+        ]
         
         header = f"Found {len(formatted_genes)} genes for '{query}':\n\n"
-        return header + json.dumps(formatted_genes, indent=2)
+        return header + _dumps(formatted_genes, indent=True)
 
     def _format_disease_results(self, data: Dict, query: str) -> str:
         """Format disease search results elegantly."""
@@ -177,25 +353,51 @@ class MCPServer:
             formatted_diseases = []
             
             for disease in diseases:
+                definition = disease.get("definition") or ""
                 disease_info = {
                     "name": disease.get("name", "Unknown"),
                     "id": disease.get("id", ""),
-                    "definition": disease.get("definition", "")[:200] + "..." if disease.get("definition", "") else "",
+                    "definition": definition[:200] + "..." if len(definition) > 200 else definition,
                     "associated_genes": len(disease.get("associatedGenes", []))
                 }
                 formatted_diseases.append(disease_info)
             
             header = f"Found {len(formatted_diseases)} diseases for '{query}':\n\n"
-            return header + json.dumps(formatted_diseases, indent=2)
+            return header + _dumps(formatted_diseases, indent=True)
         else:
             return f"No diseases found for '{query}'"
 
+    def _summarize_gene(self, result: Dict[str, Any]) -> Dict[str, Any]:
+        """Extract the key fields of a gene record for display."""
+        description = result.get("description") or ""
+        return {
+            "symbol": result.get("symbol"),
+            "name": result.get("name"),
+            "species": result.get("species", {}).get("name"),
+            "biotype": result.get("soTermName"),
+            "description": description[:300] + "..." if len(description) > 300 else description,
+            "synonyms": result.get("synonyms", [])[:5],  # First 5 synonyms
+            "chromosome": result.get("genomeLocations", [{}])[0].get("chromosome") if result.get("genomeLocations") else None
+        }
+
+    @staticmethod
+    def _parse_query_args(arguments: Dict[str, Any], default_limit: int = 10,
+                          max_limit: int = 50) -> Tuple[str, int]:
+        """Extract a stripped search query and a capped result limit."""
+        query = (arguments.get("query") or "").strip()
+        if not query:
+            raise ValueError("query is required")
+        
+        limit = arguments.get("limit", default_limit)
+        if limit > max_limit:
+            limit = max_limit
+        return query, limit
+
     async def _handle_search_genes(self, arguments: Dict[str, Any]) -> str:
         """Handle gene search with elegant formatting."""
-        query = arguments.get("query", "").strip()
-        limit = min(arguments.get("limit", 10), 50)
-        
-        if not query:
+        try:
+            query, limit = self._parse_query_args(arguments)
+        except ValueError:
             return "Error: Gene query is required (e.g., 'BRCA1', 'insulin')"
         
         result = await self.agr_client.search_genes(query, limit)
@@ -210,10 +412,9 @@ class MCPServer:
 
     async def _handle_search_diseases(self, arguments: Dict[str, Any]) -> str:
         """Handle disease search with elegant formatting."""
-        query = arguments.get("query", "").strip()
-        limit = min(arguments.get("limit", 10), 50)
-        
-        if not query:
+        try:
+            query, limit = self._parse_query_args(arguments)
+        except ValueError:
             return "Error: Disease query is required (e.g., 'diabetes', 'cancer')"
         
         result = await self.agr_client.search_diseases(query, limit)
@@ -237,85 +438,116 @@ class MCPServer:
         
         # Format key gene information elegantly
         if "symbol" in result:
-            gene_summary = {
-                "symbol": result.get("symbol"),
-                "name": result.get("name"),
-                "species": result.get("species", {}).get("name"),
-                "biotype": result.get("soTermName"),
-                "description": result.get("description", "")[:300] + "..." if result.get("description") else "",
-                "synonyms": result.get("synonyms", [])[:5],  # First 5 synonyms
-                "chromosome": result.get("genomeLocations", [{}])[0].get("chromosome") if result.get("genomeLocations") else None
-            }
-            
             header = f"Gene Information for {gene_id}:\n\n"
-            return header + json.dumps(gene_summary, indent=2)
+            return header + _dumps(self._summarize_gene(result), indent=True)
         else:
-            return f"Gene information for {gene_id}:\n\n{json.dumps(result, indent=2)}"
+            return f"Gene information for {gene_id}:\n\n{_dumps(result, indent=True)}"
+
+    async def _handle_get_genes_info_bulk(self, arguments: Dict[str, Any]) -> str:
+        """Handle batched gene information retrieval with concurrent fetches."""
+        gene_ids = [
+            gene_id.strip() for gene_id in arguments.get("gene_ids") or []
+            if isinstance(gene_id, str) and gene_id.strip()
+        ][:50]
+        
+        if not gene_ids:
+            return "Error: At least one gene identifier is required (e.g., ['HGNC:1100', 'MGI:88276'])"
+        
+        results = await self.agr_client.get_genes_info(gene_ids)
+        
+        genes = {}
+        for gene_id, result in zip(gene_ids, results):
+            if "error" in result:
+                genes[gene_id] = {"error": result["error"]}
+            elif "symbol" in result:
+                genes[gene_id] = self._summarize_gene(result)
+            else:
+                genes[gene_id] = result
+        
+        header = f"Gene Information for {len(gene_ids)} genes:\n\n"
+        return header + _dumps(genes, indent=True)
+
+    async def _handle_initialize(self, request_id: Any, params: Dict[str, Any]) -> Dict[str, Any]:
+        """Answer the initialize handshake."""
+        return {
+            "jsonrpc": "2.0",
+            "id": request_id,
+            "result": {
+                "protocolVersion": "2024-11-05",
+                "capabilities": {},
+                "serverInfo": {
+                    "name": "agr-genomics",
+                    "version": "2.0.0"
+                }
+            }
+        }
+
+    async def _handle_tools_list(self, request_id: Any, params: Dict[str, Any]) -> Dict[str, Any]:
+        """List the available tools."""
+        if self._tools_list_result is None:
+            self._tools_list_result = {"tools": self.tools}
+        return {
+            "jsonrpc": "2.0",
+            "id": request_id,
+            "result": self._tools_list_result
+        }
+
+    async def _handle_tools_call(self, request_id: Any, params: Dict[str, Any]) -> Dict[str, Any]:
+        """Dispatch a tool call to its handler."""
+        tool_name = params.get("name")
+        arguments = params.get("arguments", {})
+        
+        logger.info(f"Tool call: {tool_name} with arguments: {arguments}")
+        
+        handler = self._tool_handlers.get(tool_name)
+        if handler is not None:
+            result_text = await handler(arguments)
+        else:
+            result_text = f"Unknown tool: {tool_name}"
+        
+        return {
+            "jsonrpc": "2.0",
+            "id": request_id,
+            "result": {
+                "content": [{"type": "text", "text": result_text}],
+                "isError": False
+            }
+        }
+
+    async def _handle_initialized(self, request_id: Any, params: Dict[str, Any]) -> None:
+        """Acknowledge the initialized notification."""
+        return None  # No response needed for notifications
 
     async def handle_request(self, request: Dict[str, Any]) -> Optional[Dict[str, Any]]:
         """Handle incoming JSON-RPC requests elegantly."""
+        if not isinstance(request, dict):
+            # Valid JSON but not a request object, e.g. a bare array or number
+            return {
+                "jsonrpc": "2.0",
+                "id": None,
+                "error": {
+                    "code": -32600,
+                    "message": "Invalid Request"
+                }
+            }
+
         method = request.get("method")
         request_id = request.get("id")
         params = request.get("params", {})
         
         try:
-            if method == "initialize":
-                return {
-                    "jsonrpc": "2.0",
-                    "id": request_id,
-                    "result": {
-                        "protocolVersion": "2024-11-05",
-                        "capabilities": {},
-                        "serverInfo": {
-                            "name": "agr-genomics",
-                            "version": "2.0.0"
-                        }
-                    }
-                }
-            
-            elif method == "tools/list":
-                return {
-                    "jsonrpc": "2.0",
-                    "id": request_id,
-                    "result": {"tools": self.tools}
-                }
-            
-            elif method == "tools/call":
-                tool_name = params.get("name")
-                arguments = params.get("arguments", {})
-                
-                logger.info(f"Tool call: {tool_name} with arguments: {arguments}")
-                
-                if tool_name == "search_genes":
-                    result_text = await self._handle_search_genes(arguments)
-                elif tool_name == "search_diseases":
-                    result_text = await self._handle_search_diseases(arguments)
-                elif tool_name == "get_gene_info":
-                    result_text = await self._handle_get_gene_info(arguments)
-                else:
-                    result_text = f"Unknown tool: {tool_name}"
-                
-                return {
-                    "jsonrpc": "2.0",
-                    "id": request_id,
-                    "result": {
-                        "content": [{"type": "text", "text": result_text}],
-                        "isError": False
-                    }
-                }
-            
-            elif method == "notifications/initialized":
-                return None  # No response needed for notifications
+            handler = self._method_handlers.get(method)
+            if handler is not None:
+                return await handler(request_id, params)
             
-            else:
-                return {
-                    "jsonrpc": "2.0",
-                    "id": request_id,
-                    "error": {
-                        "code": -32601,
-                        "message": "Method not found"
-                    }
+            return {
+                "jsonrpc": "2.0",
+                "id": request_id,
+                "error": {
+                    "code": -32601,
+                    "message": "Method not found"
                 }
+            }
         
         except Exception as e:
             logger.error(f"Error handling {method}: {e}")
@@ -328,16 +560,83 @@ class MCPServer:
                 }
             }
 
+    async def _process(self, line: bytes, out_queue: asyncio.Queue):
+        """Handle one JSON-RPC line and queue its serialized response."""
+        try:
+            request = _loads(line)
+        except json.JSONDecodeError as e:
+            logger.error(f"JSON decode error: {e}")
+            error_response = {
+                "jsonrpc": "2.0",
+                "id": None,
+                "error": {
+                    "code": -32700,
+                    "message": "Parse error"
+                }
+            }
+            await out_queue.put(_dumpb(error_response))
+            return
+
+        response = await self.handle_request(request)
+        if response is not None:
+            await out_queue.put(_dumpb(response))
+
+    async def _write_responses(self, out_queue: asyncio.Queue,
+                               writer: Union[asyncio.StreamWriter, _FileWriter]):
+        """Write queued responses to stdout, coalescing whatever is ready into one write."""
+        while True:
+            frames = [await out_queue.get()]
+            while not out_queue.empty():
+                frames.append(out_queue.get_nowait())
+            
+            # None marks shutdown and is always the last item queued
+            finished = frames[-1] is None
+            if finished:
+                frames.pop()
+            
+            if frames:
+                writer.write(b"\n".join(frames) + b"\n")
+                await writer.drain()
+                if logger.isEnabledFor(logging.DEBUG):
+                    for frame in frames:
+                        logger.debug("Sent response: %.100s...", frame[:100].decode(errors="replace"))
+            
+            if finished:
+                break
+
     async def run(self):
         """Run the MCP server with elegant error handling."""
         logger.info("Starting Alliance of Genome Resources MCP Server v2.0.0")
         logger.info("Supporting 8 model organisms with comprehensive genomic data")
         
+        # Requests are handled concurrently; clients correlate responses by id,
+        # so they may be written out of order.
+        # Pipe transports refuse regular files (e.g. `< requests.jsonl`), so
+        # those are read in a worker thread and written with blocking calls.
+        loop = asyncio.get_running_loop()
+        if _is_pipe(sys.stdin.fileno()):
+            reader = asyncio.StreamReader(limit=2 ** 20)
+            await loop.connect_read_pipe(
+                lambda: asyncio.StreamReaderProtocol(reader), sys.stdin
+            )
+            readline = reader.readline
+        else:
+            readline = functools.partial(loop.run_in_executor, None, sys.stdin.buffer.readline)
+        if _is_pipe(sys.stdout.fileno()):
+            transport, protocol = await loop.connect_write_pipe(
+                asyncio.streams.FlowControlMixin, sys.stdout
+            )
+            stdout = asyncio.StreamWriter(transport, protocol, None, loop)
+        else:
+            stdout = _FileWriter(sys.stdout.buffer)
+
+        out_queue: asyncio.Queue = asyncio.Queue()
+        writer = asyncio.create_task(self._write_responses(out_queue, stdout))
+        pending: set = set()
+
         try:
             while True:
-                line = await asyncio.get_event_loop().run_in_executor(
-                    None, sys.stdin.readline
-                )
+                line = await readline()
                 
                 if not line:
                     logger.info("EOF received, shutting down")
@@ -347,32 +646,22 @@ class MCPServer:
                 if not line:
                     continue
                 
-                try:
-                    request = json.loads(line)
-                    response = await self.handle_request(request)
-                    
-                    if response is not None:
-                        output = json.dumps(response)
-                        print(output, flush=True)
-                        logger.debug(f"Sent response: {output[:100]}...")
-                        
-                except json.JSONDecodeError as e:
-                    logger.error(f"JSON decode error: {e}")
-                    error_response = {
-                        "jsonrpc": "2.0",
-                        "id": None,
-                        "error": {
-                            "code": -32700,
-                            "message": "Parse error"
-                        }
-                    }
-                    print(json.dumps(error_response), flush=True)
+                task = asyncio.create_task(self._process(line, out_queue))
+                pending.add(task)
+                task.add_done_callback(pending.discard)
                 
         except KeyboardInterrupt:
             logger.info("Server stopped by user")
         except Exception as e:
             logger.error(f"Server error: {e}")
             sys.exit(1)
+        finally:
+            if pending:
+                await asyncio.gather(*pending, return_exceptions=True)
+            await out_queue.put(None)
+            await writer
+            stdout.close()
+            await self.agr_client.aclose()
 
 
 async def main():
@@ -382,4 +671,9 @@ async def main():
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
\ No newline at end of file
+    try:
+        import uvloop
+    except ImportError:
+        asyncio.run(main())
+    else:
+        uvloop.run(main())
\ No newline at end of file
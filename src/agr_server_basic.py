@@ -7,12 +7,15 @@ identifier lookups, and bioinformatics tools through the Model Context Protocol.
 """
 
 import asyncio
+import base64
 import json
 import logging
 import os
 import re
+import time
 import urllib.parse
-from typing import Any, Dict, List, Optional, Union
+from collections import OrderedDict
+from typing import Any, AsyncGenerator, Awaitable, Callable, Dict, List, Optional, Sequence, Union
 
 import httpx
 from mcp.server import Server
@@ -25,104 +28,312 @@ from mcp.types import (
     Tool,
 )
 
+try:
+    import orjson
+
+    _loads = orjson.loads
+
+    def _dump(obj: Any) -> str:
+        """Serialize a tool result as indented JSON text."""
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2).decode()
+except ImportError:
+    _loads = json.loads
+
+    def _dump(obj: Any) -> str:
+        """Serialize a tool result as indented JSON text."""
+        return json.dumps(obj, indent=2)
+
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
+try:
+    import msgpack
+except ImportError:
+    msgpack = None
+
+try:
+    import brotli  # noqa: F401  (lets httpx decode "br" responses)
+    _ACCEPT_ENCODING = "gzip, br"
+except ImportError:
+    _ACCEPT_ENCODING = "gzip"
+
+# Gene identifiers from the Alliance member databases, e.g. HGNC:1100
+_GENE_ID_RE = re.compile(r"(HGNC|MGI|ZFIN|FB|SGD|WB|RGD|XENBASE):[\w\-\.]+")
+
+# Every byte that is not an ASCII letter, stripped from BLAST queries
+_NON_RESIDUE_BYTES = bytes(c for c in range(256) if not (65 <= c <= 90 or 97 <= c <= 122))
+_MAX_SEQUENCE_LENGTH = 1_000_000
+
+_quote = urllib.parse.quote
+
+# Gene search hit fields kept for display by search_genes
+_GENE_HIT_FIELDS = ("id", "symbol", "name", "species", "automatedGeneSynopsis")
+
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+def _quote_gene_id(gene_id: str) -> str:
+    """URL-quote a gene identifier, rejecting malformed ones before any I/O."""
+    if not isinstance(gene_id, str) or not _GENE_ID_RE.fullmatch(gene_id):
+        raise ValueError(f"invalid gene_id: {gene_id!r}")
+    return _quote(gene_id, safe=":")
+
+def _clean_sequence(sequence: str) -> str:
+    """Strip FASTA headers, whitespace, digits and other non-residue characters."""
+    if ">" in sequence:
+        sequence = "\n".join(
+            line for line in sequence.splitlines() if not line.startswith(">")
+        )
+    cleaned = sequence.encode("ascii", "ignore").translate(None, _NON_RESIDUE_BYTES)
+    if not cleaned:
+        raise ValueError("sequence contains no residues")
+    if len(cleaned) > _MAX_SEQUENCE_LENGTH:
+        raise ValueError(
+            f"sequence too long: {len(cleaned)} residues (max {_MAX_SEQUENCE_LENGTH})"
+        )
+    return cleaned.decode("ascii")
+
 class AGRClient:
     """Client for interacting with Alliance of Genome Resources APIs."""
+
+    __slots__ = (
+        "base_url", "blast_url", "fms_url", "timeout",
+        "_client", "_cache", "_cache_max", "_cache_ttl", "_inflight",
+        "_urls", "_gene_prefix",
+    )
     
     def __init__(self):
         self.base_url = "https://www.alliancegenome.org/api"
         self.blast_url = "https://blast.alliancegenome.org"
         self.fms_url = "https://fms.alliancegenome.org/api"
         self.timeout = 30.0
-        
-    async def _make_request(self, endpoint: str, params: Optional[Dict] = None, base_url: Optional[str] = None) -> Dict[str, Any]:
-        """Make HTTP request to AGR API."""
-        url = f"{base_url or self.base_url}/{endpoint.lstrip('/')}"
-        
-        async with httpx.AsyncClient(timeout=self.timeout) as client:
-            try:
-                response = await client.get(url, params=params or {})
+        # Full URLs for the fixed endpoints, built once instead of per request.
+        self._urls = {
+            "search": f"{self.base_url}/search",
+            "species": f"{self.base_url}/species",
+            "blast": f"{self.blast_url}/blast",
+        }
+        self._gene_prefix = f"{self.base_url}/gene/"
+        # One pooled client for every AGR host; httpx keeps a pool per origin.
+        self._client = httpx.AsyncClient(
+            timeout=self.timeout,
+            limits=httpx.Limits(max_connections=100, max_keepalive_connections=20),
+            http2=True,
+            headers={"Accept-Encoding": _ACCEPT_ENCODING, "Accept": "application/json"},
+        )
+        # TTL LRU cache of parsed responses for the idempotent GET endpoints.
+        self._cache: "OrderedDict[tuple, tuple[float, Any]]" = OrderedDict()
+        self._cache_max = 1024
+        self._cache_ttl = 300.0
+        # Futures for requests currently on the wire, shared by identical callers.
+        self._inflight: Dict[tuple, asyncio.Task] = {}
+
+    async def aclose(self) -> None:
+        """Close the shared HTTP client and its pooled connections."""
+        await self._client.aclose()
+
+    async def _make_request(self, url: str, params: Optional[Dict] = None,
+                            use_cache: bool = True, raw: bool = False) -> Any:
+        """Make HTTP request to AGR API, coalescing concurrent identical calls.
+
+        With ``raw`` the response text is returned unparsed.
+        """
+        if not use_cache:
+            return await self._fetch(url, params, raw)
+
+        key = (url, tuple(sorted((params or {}).items())), raw)
+        return await self._cached(key, lambda: self._fetch(url, params, raw))
+
+    async def _cached(self, key: tuple, fetch: Callable[[], Awaitable[Any]]) -> Any:
+        """Serve ``key`` from the TTL cache, else run ``fetch`` once for all concurrent callers.
+
+        The fetch runs as its own task, so a cancelled caller only stops
+        waiting; the request carries on for everyone else sharing it.
+        """
+        entry = self._cache.get(key)
+        if entry is not None:
+            if time.monotonic() - entry[0] < self._cache_ttl:
+                self._cache.move_to_end(key)
+                return entry[1]
+            del self._cache[key]
+
+        task = self._inflight.get(key)
+        if task is None:
+            task = self._inflight[key] = asyncio.create_task(self._fill(key, fetch))
+            # Mark a failure retrieved even if every caller has given up on it
+            task.add_done_callback(lambda t: t.cancelled() or t.exception())
+        return await asyncio.shield(task)
+
+    async def _fill(self, key: tuple, fetch: Callable[[], Awaitable[Any]]) -> Any:
+        """Run ``fetch`` for every caller waiting on ``key`` and cache its result."""
+        try:
+            result = await fetch()
+        finally:
+            self._inflight.pop(key, None)
+        self._cache[key] = (time.monotonic(), result)
+        if len(self._cache) > self._cache_max:
+            self._cache.popitem(last=False)
+        return result
+
+    async def _fetch(self, url: str, params: Optional[Dict] = None, raw: bool = False) -> Any:
+        """Issue a GET and parse the JSON body, or return its text when ``raw``."""
+        try:
+            response = await self._client.get(url, params=params or {})
+            response.raise_for_status()
+            if raw:
+                return response.text
+            return _loads(response.content)
+        except httpx.HTTPError as e:
+            logger.error("API request failed: %s", e)
+            raise Exception(f"API request failed: {str(e)}")
+        except json.JSONDecodeError as e:
+            logger.error("Failed to parse JSON response: %s", e)
+            raise Exception(f"Invalid JSON response: {str(e)}")
+
+    async def _make_request_stream(self, url: str, params: Optional[Dict], item_path: str,
+                                   fields: Sequence[str]) -> AsyncGenerator[Dict[str, Any], None]:
+        """Stream items at ``item_path`` from a response, keeping only ``fields``.
+
+        The body is parsed incrementally with ijson so the full result list is
+        never materialized. Without ijson this falls back to a regular request.
+        """
+        if ijson is None:
+            result = await self._make_request(url, params)
+            items: Any = result
+            for part in item_path.split("."):
+                if part != "item":
+                    items = items.get(part) or []
+            for item in items:
+                yield {field: item[field] for field in fields if field in item}
+            return
+
+        events = ijson.sendable_list()
+        parser = ijson.items_coro(events, item_path, use_float=True)
+        try:
+            async with self._client.stream("GET", url, params=params or {}) as response:
                 response.raise_for_status()
-                return response.json()
-            except httpx.HTTPError as e:
-                logger.error(f"API request failed: {e}")
-                raise Exception(f"API request failed: {str(e)}")
-            except json.JSONDecodeError as e:
-                logger.error(f"Failed to parse JSON response: {e}")
-                raise Exception(f"Invalid JSON response: {str(e)}")
-
-    async def search_genes(self, query: str, category: str = "gene", 
-                          limit: int = 20, offset: int = 0) -> Dict[str, Any]:
-        """Search for genes using AGR search API."""
+                async for chunk in response.aiter_bytes():
+                    parser.send(chunk)
+                    for item in events:
+                        yield {field: item[field] for field in fields if field in item}
+                    del events[:]
+            parser.close()
+            for item in events:
+                yield {field: item[field] for field in fields if field in item}
+        except httpx.HTTPError as e:
+            logger.error("API request failed: %s", e)
+            raise Exception(f"API request failed: {str(e)}")
+        except ijson.JSONError as e:
+            logger.error("Failed to parse JSON response: %s", e)
+            raise Exception(f"Invalid JSON response: {str(e)}")
+
+    async def search_gene_hits(self, query: str, limit: int = 20,
+                               offset: int = 0) -> List[Dict[str, Any]]:
+        """Search for genes, keeping only the hit fields used for display.
+
+        Hits are streamed and projected as the body arrives; the trimmed list
+        is cached and shared between concurrent callers like any other GET.
+        """
+        url = self._urls["search"]
         params = {
             "q": query,
-            "category": category,
+            "category": "gene",
             "limit": limit,
             "offset": offset
         }
-        return await self._make_request("/search", params)
 
-    async def get_gene_info(self, gene_id: str) -> Dict[str, Any]:
+        async def fetch() -> List[Dict[str, Any]]:
+            hits = self._make_request_stream(url, params, "results.item", _GENE_HIT_FIELDS)
+            try:
+                return [hit async for hit in hits]
+            finally:
+                await hits.aclose()
+
+        return await self._cached((url, tuple(sorted(params.items())), "results.item"), fetch)
+
+    async def get_gene_info(self, gene_id: str, raw: bool = False) -> Union[Dict[str, Any], str]:
         """Get detailed gene information."""
-        return await self._make_request(f"/gene/{gene_id}")
+        return await self._make_request(self._gene_prefix + _quote_gene_id(gene_id), raw=raw)
 
-    async def get_gene_alleles(self, gene_id: str) -> Dict[str, Any]:
+    async def get_gene_alleles(self, gene_id: str, raw: bool = False) -> Union[Dict[str, Any], str]:
         """Get allele information for a gene."""
-        return await self._make_request(f"/gene/{gene_id}/alleles")
+        return await self._make_request(self._gene_prefix + _quote_gene_id(gene_id) + "/alleles", raw=raw)
 
-    async def get_gene_diseases(self, gene_id: str) -> Dict[str, Any]:
+    async def get_gene_diseases(self, gene_id: str, raw: bool = False) -> Union[Dict[str, Any], str]:
         """Get disease associations for a gene."""
-        return await self._make_request(f"/gene/{gene_id}/diseases")
+        return await self._make_request(self._gene_prefix + _quote_gene_id(gene_id) + "/diseases", raw=raw)
 
-    async def get_gene_interactions(self, gene_id: str) -> Dict[str, Any]:
+    async def get_gene_interactions(self, gene_id: str, raw: bool = False) -> Union[Dict[str, Any], str]:
         """Get interaction data for a gene."""
-        return await self._make_request(f"/gene/{gene_id}/interactions")
+        return await self._make_request(self._gene_prefix + _quote_gene_id(gene_id) + "/interactions", raw=raw)
 
-    async def get_gene_expression(self, gene_id: str) -> Dict[str, Any]:
+    async def get_gene_expression(self, gene_id: str, raw: bool = False) -> Union[Dict[str, Any], str]:
         """Get expression data for a gene."""
-        return await self._make_request(f"/gene/{gene_id}/expression")
+        return await self._make_request(self._gene_prefix + _quote_gene_id(gene_id) + "/expression", raw=raw)
 
-    async def find_orthologs(self, gene_id: str) -> Dict[str, Any]:
+    async def find_orthologs(self, gene_id: str, raw: bool = False) -> Union[Dict[str, Any], str]:
         """Find orthologous genes across species."""
-        return await self._make_request(f"/gene/{gene_id}/orthologs")
+        return await self._make_request(self._gene_prefix + _quote_gene_id(gene_id) + "/orthologs", raw=raw)
+
+    async def get_gene_bundle(self, gene_id: str) -> Dict[str, Any]:
+        """Fetch gene info and its sub-resources concurrently."""
+        _quote_gene_id(gene_id)  # fail once up front rather than in every sub-request
+        keys = ("info", "diseases", "interactions", "expression", "orthologs")
+        results = await asyncio.gather(
+            self.get_gene_info(gene_id),
+            self.get_gene_diseases(gene_id),
+            self.get_gene_interactions(gene_id),
+            self.get_gene_expression(gene_id),
+            self.find_orthologs(gene_id),
+            return_exceptions=True
+        )
+        return {
+            key: {"error": str(value)} if isinstance(value, BaseException) else value
+            for key, value in zip(keys, results)
+        }
 
-    async def search_diseases(self, query: str, limit: int = 20) -> Dict[str, Any]:
+    async def search_diseases(self, query: str, limit: int = 20,
+                              raw: bool = False) -> Union[Dict[str, Any], str]:
         """Search for diseases."""
         params = {
             "q": query,
             "category": "disease",
             "limit": limit
         }
-        return await self._make_request("/search", params)
+        return await self._make_request(self._urls["search"], params, raw=raw)
 
-    async def search_phenotypes(self, query: str, limit: int = 20) -> Dict[str, Any]:
+    async def search_phenotypes(self, query: str, limit: int = 20,
+                                raw: bool = False) -> Union[Dict[str, Any], str]:
         """Search for phenotypes."""
         params = {
             "q": query,
             "category": "phenotype", 
             "limit": limit
         }
-        return await self._make_request("/search", params)
+        return await self._make_request(self._urls["search"], params, raw=raw)
 
     async def blast_sequence(self, sequence: str, database: str = "all", 
-                           program: str = "blastn", max_target_seqs: int = 50) -> Dict[str, Any]:
+                           program: str = "blastn", max_target_seqs: int = 50,
+                           raw: bool = False) -> Union[Dict[str, Any], str]:
         """Perform BLAST sequence search."""
         # Note: This is a simplified implementation. The actual BLAST API may require
         # different endpoints and parameters. Check AGR BLAST documentation for details.
+        sequence = _clean_sequence(sequence)
         params = {
             "sequence": sequence,
             "database": database,
             "program": program,
             "max_target_seqs": max_target_seqs
         }
-        return await self._make_request("/blast", params, self.blast_url)
+        # BLAST submissions are not idempotent in practice, so never serve them from cache.
+        return await self._make_request(self._urls["blast"], params, use_cache=False, raw=raw)
 
-    async def get_species_list(self) -> Dict[str, Any]:
+    async def get_species_list(self, raw: bool = False) -> Union[Dict[str, Any], str]:
         """Get list of supported species."""
-        return await self._make_request("/species")
+        return await self._make_request(self._urls["species"], raw=raw)
 
 # Initialize the AGR client
 agr_client = AGRClient()
@@ -130,348 +341,375 @@ agr_client = AGRClient()
 # Create the MCP server
 server = Server("agr-genomics")
 
-@server.list_tools()
-async def list_tools() -> List[Tool]:
-    """List available tools for the AGR MCP server."""
-    return [
-        Tool(
-            name="search_genes",
-            description="Search for genes by symbol, name, or identifier across model organisms",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "query": {
-                        "type": "string",
-                        "description": "Gene symbol, name, or identifier to search for"
-                    },
-                    "limit": {
-                        "type": "integer",
-                        "description": "Maximum number of results to return (default: 20)",
-                        "default": 20
-                    },
-                    "offset": {
-                        "type": "integer", 
-                        "description": "Number of results to skip (default: 0)",
-                        "default": 0
-                    }
-                },
-                "required": ["query"]
-            }
-        ),
-        Tool(
-            name="get_gene_info",
-            description="Retrieve detailed information about a specific gene",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "gene_id": {
-                        "type": "string",
-                        "description": "Gene identifier (e.g., HGNC:5, MGI:95892, ZFIN:ZDB-GENE-030131-1)"
-                    }
+# Tool definitions are constant, so build them once at import time.
+_TOOLS: List[Tool] = [
+    Tool(
+        name="search_genes",
+        description="Search for genes by symbol, name, or identifier across model organisms",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "query": {
+                    "type": "string",
+                    "description": "Gene symbol, name, or identifier to search for"
                 },
-                "required": ["gene_id"]
-            }
-        ),
-        Tool(
-            name="get_gene_diseases",
-            description="Get disease associations for a gene",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "gene_id": {
-                        "type": "string",
-                        "description": "Gene identifier"
-                    }
+                "limit": {
+                    "type": "integer",
+                    "description": "Maximum number of results to return (default: 20)",
+                    "default": 20
                 },
-                "required": ["gene_id"]
-            }
-        ),
-        Tool(
-            name="find_orthologs",
-            description="Find orthologous genes across different species",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "gene_id": {
-                        "type": "string",
-                        "description": "Gene identifier to find orthologs for"
-                    }
-                },
-                "required": ["gene_id"]
-            }
-        ),
-        Tool(
-            name="get_gene_interactions",
-            description="Retrieve gene and protein interaction data",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "gene_id": {
-                        "type": "string",
-                        "description": "Gene identifier"
-                    }
+                "offset": {
+                    "type": "integer", 
+                    "description": "Number of results to skip (default: 0)",
+                    "default": 0
+                }
+            },
+            "required": ["query"]
+        }
+    ),
+    Tool(
+        name="get_gene_info",
+        description="Retrieve detailed information about a specific gene",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "gene_id": {
+                    "type": "string",
+                    "description": "Gene identifier (e.g., HGNC:5, MGI:95892, ZFIN:ZDB-GENE-030131-1)"
+                }
+            },
+            "required": ["gene_id"]
+        }
+    ),
+    Tool(
+        name="get_gene_diseases",
+        description="Get disease associations for a gene",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "gene_id": {
+                    "type": "string",
+                    "description": "Gene identifier"
+                }
+            },
+            "required": ["gene_id"]
+        }
+    ),
+    Tool(
+        name="find_orthologs",
+        description="Find orthologous genes across different species",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "gene_id": {
+                    "type": "string",
+                    "description": "Gene identifier to find orthologs for"
+                }
+            },
+            "required": ["gene_id"]
+        }
+    ),
+    Tool(
+        name="get_gene_interactions",
+        description="Retrieve gene and protein interaction data",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "gene_id": {
+                    "type": "string",
+                    "description": "Gene identifier"
+                }
+            },
+            "required": ["gene_id"]
+        }
+    ),
+    Tool(
+        name="get_gene_expression",
+        description="Get gene expression data and tissue-specific information",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "gene_id": {
+                    "type": "string",
+                    "description": "Gene identifier"
+                }
+            },
+            "required": ["gene_id"]
+        }
+    ),
+    Tool(
+        name="get_gene_bundle",
+        description="Get gene info, diseases, interactions, expression and orthologs in one call",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "gene_id": {
+                    "type": "string",
+                    "description": "Gene identifier"
+                }
+            },
+            "required": ["gene_id"]
+        }
+    ),
+    Tool(
+        name="search_diseases",
+        description="Search for diseases and conditions",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "query": {
+                    "type": "string",
+                    "description": "Disease name or term to search for"
                 },
-                "required": ["gene_id"]
-            }
-        ),
-        Tool(
-            name="get_gene_expression",
-            description="Get gene expression data and tissue-specific information",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "gene_id": {
-                        "type": "string",
-                        "description": "Gene identifier"
-                    }
+                "limit": {
+                    "type": "integer",
+                    "description": "Maximum number of results (default: 20)",
+                    "default": 20
+                }
+            },
+            "required": ["query"]
+        }
+    ),
+    Tool(
+        name="search_phenotypes",
+        description="Search for phenotypes and their associations",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "query": {
+                    "type": "string",
+                    "description": "Phenotype term to search for"
                 },
-                "required": ["gene_id"]
-            }
-        ),
-        Tool(
-            name="search_diseases",
-            description="Search for diseases and conditions",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "query": {
-                        "type": "string",
-                        "description": "Disease name or term to search for"
-                    },
-                    "limit": {
-                        "type": "integer",
-                        "description": "Maximum number of results (default: 20)",
-                        "default": 20
-                    }
+                "limit": {
+                    "type": "integer",
+                    "description": "Maximum number of results (default: 20)",
+                    "default": 20
+                }
+            },
+            "required": ["query"]
+        }
+    ),
+    Tool(
+        name="blast_sequence",
+        description="Perform BLAST sequence similarity search against AGR databases",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "sequence": {
+                    "type": "string",
+                    "description": "DNA, RNA, or protein sequence to search"
                 },
-                "required": ["query"]
-            }
-        ),
-        Tool(
-            name="search_phenotypes",
-            description="Search for phenotypes and their associations",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "query": {
-                        "type": "string",
-                        "description": "Phenotype term to search for"
-                    },
-                    "limit": {
-                        "type": "integer",
-                        "description": "Maximum number of results (default: 20)",
-                        "default": 20
-                    }
+                "database": {
+                    "type": "string",
+                    "description": "Target database (default: 'all')",
+                    "default": "all"
                 },
-                "required": ["query"]
-            }
-        ),
-        Tool(
-            name="blast_sequence",
-            description="Perform BLAST sequence similarity search against AGR databases",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "sequence": {
-                        "type": "string",
-                        "description": "DNA, RNA, or protein sequence to search"
-                    },
-                    "database": {
-                        "type": "string",
-                        "description": "Target database (default: 'all')",
-                        "default": "all"
-                    },
-                    "program": {
-                        "type": "string",
-                        "description": "BLAST program (blastn, blastp, blastx, etc.)",
-                        "default": "blastn"
-                    },
-                    "max_target_seqs": {
-                        "type": "integer",
-                        "description": "Maximum number of target sequences (default: 50)",
-                        "default": 50
-                    }
+                "program": {
+                    "type": "string",
+                    "description": "BLAST program (blastn, blastp, blastx, etc.)",
+                    "default": "blastn"
                 },
-                "required": ["sequence"]
-            }
-        ),
-        Tool(
-            name="get_species_list",
-            description="Get list of all supported model organisms",
-            inputSchema={
-                "type": "object",
-                "properties": {},
-                "required": []
-            }
+                "max_target_seqs": {
+                    "type": "integer",
+                    "description": "Maximum number of target sequences (default: 50)",
+                    "default": 50
+                }
+            },
+            "required": ["sequence"]
+        }
+    ),
+    Tool(
+        name="get_species_list",
+        description="Get list of all supported model organisms",
+        inputSchema={
+            "type": "object",
+            "properties": {},
+            "required": []
+        }
+    )
+]
+
+# Every tool can return MessagePack instead of JSON text for large payloads.
+_FORMAT_PROPERTY = {
+    "type": "string",
+    "enum": ["json", "msgpack"],
+    "description": "Output format: JSON text (default) or base64-encoded MessagePack",
+    "default": "json"
+}
+for _tool in _TOOLS:
+    _tool.inputSchema["properties"]["format"] = _FORMAT_PROPERTY
+
+@server.list_tools()
+async def list_tools() -> List[Tool]:
+    """List available tools for the AGR MCP server."""
+    return _TOOLS
+
+def _clamp_limit(value: Any) -> int:
+    """Coerce a requested result limit into the range the server will fetch."""
+    return max(1, min(int(value), 200))
+
+_EMPTY: Dict[str, Any] = {}
+
+def _wants_msgpack(arguments: Dict[str, Any]) -> bool:
+    """Whether the caller asked for MessagePack output."""
+    return arguments.get("format", "json") == "msgpack"
+
+def _passthrough(arguments: Dict[str, Any]) -> bool:
+    """Whether the raw response text can be returned as-is."""
+    return not _wants_msgpack(arguments)
+
+def _tool_result(header: str, result: Any, arguments: Dict[str, Any]) -> CallToolResult:
+    """Render a tool result as JSON text, or base64 MessagePack on request."""
+    if _wants_msgpack(arguments):
+        if msgpack is None:
+            raise ValueError("format 'msgpack' requires the msgpack package")
+        text = base64.b64encode(msgpack.packb(result, use_bin_type=True)).decode("ascii")
+    elif isinstance(result, str):
+        text = f"{header}:\n\n{result}"
+    else:
+        text = f"{header}:\n\n{_dump(result)}"
+    return CallToolResult(content=[TextContent(type="text", text=text)])
+
+def _format_gene(gene: Dict[str, Any]) -> Dict[str, Any]:
+    """Project a gene search hit to the fields shown to the client."""
+    get = gene.get
+    species = get("species") or _EMPTY
+    return {
+        "id": get("id", ""),
+        "symbol": get("symbol", ""),
+        "name": get("name", ""),
+        "species": species.get("name", ""),
+        "description": get("automatedGeneSynopsis", "")
+    }
+
+async def _handle_search_genes(arguments: Dict[str, Any]) -> CallToolResult:
+    query = arguments["query"]
+    limit = _clamp_limit(arguments.get("limit", 20))
+    offset = arguments.get("offset", 0)
+    
+    # The API already applies ``limit``, so every hit is kept.
+    hits = await agr_client.search_gene_hits(query, limit=limit, offset=offset)
+    formatted_results = [_format_gene(gene) for gene in hits]
+    
+    if _wants_msgpack(arguments):
+        return _tool_result("", formatted_results, arguments)
+    if formatted_results:
+        return CallToolResult(
+            content=[TextContent(
+                type="text",
+                text=f"Found {len(formatted_results)} genes matching '{query}':\n\n{_dump(formatted_results)}"
+            )]
+        )
+    else:
+        return CallToolResult(
+            content=[TextContent(
+                type="text", 
+                text=f"No genes found matching '{query}'"
+            )]
         )
-    ]
 
-@server.call_tool()
-async def call_tool(name: str, arguments: Dict[str, Any]) -> CallToolResult:
-    """Handle tool calls for the AGR MCP server."""
-    try:
-        if name == "search_genes":
-            query = arguments["query"]
-            limit = arguments.get("limit", 20)
-            offset = arguments.get("offset", 0)
-            
-            result = await agr_client.search_genes(query, limit=limit, offset=offset)
-            
-            # Format the response
-            if "results" in result:
-                genes = result["results"]
-                formatted_results = []
-                
-                for gene in genes[:limit]:
-                    gene_info = {
-                        "id": gene.get("id", ""),
-                        "symbol": gene.get("symbol", ""),
-                        "name": gene.get("name", ""),
-                        "species": gene.get("species", {}).get("name", ""),
-                        "description": gene.get("automatedGeneSynopsis", "")
-                    }
-                    formatted_results.append(gene_info)
-                
-                return CallToolResult(
-                    content=[TextContent(
-                        type="text",
-                        text=f"Found {len(formatted_results)} genes matching '{query}':\n\n" +
-                             json.dumps(formatted_results, indent=2)
-                    )]
-                )
-            else:
-                return CallToolResult(
-                    content=[TextContent(
-                        type="text", 
-                        text=f"No genes found matching '{query}'"
-                    )]
-                )
+# Handlers below that don't reshape the payload pass the AGR response text
+# through as-is instead of parsing and re-serializing it, unless the client
+# asked for MessagePack.
 
-        elif name == "get_gene_info":
-            gene_id = arguments["gene_id"]
-            result = await agr_client.get_gene_info(gene_id)
-            
-            return CallToolResult(
-                content=[TextContent(
-                    type="text",
-                    text=f"Gene Information for {gene_id}:\n\n" +
-                         json.dumps(result, indent=2)
-                )]
-            )
+async def _handle_get_gene_info(arguments: Dict[str, Any]) -> CallToolResult:
+    gene_id = arguments["gene_id"]
+    result = await agr_client.get_gene_info(gene_id, raw=_passthrough(arguments))
+    
+    return _tool_result(f"Gene Information for {gene_id}", result, arguments)
 
-        elif name == "get_gene_diseases":
-            gene_id = arguments["gene_id"]
-            result = await agr_client.get_gene_diseases(gene_id)
-            
-            return CallToolResult(
-                content=[TextContent(
-                    type="text",
-                    text=f"Disease associations for {gene_id}:\n\n" +
-                         json.dumps(result, indent=2)
-                )]
-            )
+async def _handle_get_gene_diseases(arguments: Dict[str, Any]) -> CallToolResult:
+    gene_id = arguments["gene_id"]
+    result = await agr_client.get_gene_diseases(gene_id, raw=_passthrough(arguments))
+    
+    return _tool_result(f"Disease associations for {gene_id}", result, arguments)
 
-        elif name == "find_orthologs":
-            gene_id = arguments["gene_id"]
-            result = await agr_client.find_orthologs(gene_id)
-            
-            return CallToolResult(
-                content=[TextContent(
-                    type="text",
-                    text=f"Orthologs for {gene_id}:\n\n" +
-                         json.dumps(result, indent=2)
-                )]
-            )
+async def _handle_find_orthologs(arguments: Dict[str, Any]) -> CallToolResult:
+    gene_id = arguments["gene_id"]
+    result = await agr_client.find_orthologs(gene_id, raw=_passthrough(arguments))
+    
+    return _tool_result(f"Orthologs for {gene_id}", result, arguments)
 
-        elif name == "get_gene_interactions":
-            gene_id = arguments["gene_id"]
-            result = await agr_client.get_gene_interactions(gene_id)
-            
-            return CallToolResult(
-                content=[TextContent(
-                    type="text",
-                    text=f"Interactions for {gene_id}:\n\n" +
-                         json.dumps(result, indent=2)
-                )]
-            )
+async def _handle_get_gene_interactions(arguments: Dict[str, Any]) -> CallToolResult:
+    gene_id = arguments["gene_id"]
+    result = await agr_client.get_gene_interactions(gene_id, raw=_passthrough(arguments))
+    
+    return _tool_result(f"Interactions for {gene_id}", result, arguments)
 
-        elif name == "get_gene_expression":
-            gene_id = arguments["gene_id"]
-            result = await agr_client.get_gene_expression(gene_id)
-            
-            return CallToolResult(
-                content=[TextContent(
-                    type="text",
-                    text=f"Expression data for {gene_id}:\n\n" +
-                         json.dumps(result, indent=2)
-                )]
-            )
+async def _handle_get_gene_expression(arguments: Dict[str, Any]) -> CallToolResult:
+    gene_id = arguments["gene_id"]
+    result = await agr_client.get_gene_expression(gene_id, raw=_passthrough(arguments))
+    
+    return _tool_result(f"Expression data for {gene_id}", result, arguments)
 
-        elif name == "search_diseases":
-            query = arguments["query"]
-            limit = arguments.get("limit", 20)
-            result = await agr_client.search_diseases(query, limit=limit)
-            
-            return CallToolResult(
-                content=[TextContent(
-                    type="text",
-                    text=f"Disease search results for '{query}':\n\n" +
-                         json.dumps(result, indent=2)
-                )]
-            )
+async def _handle_get_gene_bundle(arguments: Dict[str, Any]) -> CallToolResult:
+    gene_id = arguments["gene_id"]
+    result = await agr_client.get_gene_bundle(gene_id)
+    
+    return _tool_result(f"Gene bundle for {gene_id}", result, arguments)
 
-        elif name == "search_phenotypes":
-            query = arguments["query"]
-            limit = arguments.get("limit", 20)
-            result = await agr_client.search_phenotypes(query, limit=limit)
-            
-            return CallToolResult(
-                content=[TextContent(
-                    type="text",
-                    text=f"Phenotype search results for '{query}':\n\n" +
-                         json.dumps(result, indent=2)
-                )]
-            )
+async def _handle_search_diseases(arguments: Dict[str, Any]) -> CallToolResult:
+    query = arguments["query"]
+    limit = _clamp_limit(arguments.get("limit", 20))
+    result = await agr_client.search_diseases(query, limit=limit, raw=_passthrough(arguments))
+    
+    return _tool_result(f"Disease search results for '{query}'", result, arguments)
 
-        elif name == "blast_sequence":
-            sequence = arguments["sequence"]
-            database = arguments.get("database", "all")
-            program = arguments.get("program", "blastn")
-            max_target_seqs = arguments.get("max_target_seqs", 50)
-            
-            result = await agr_client.blast_sequence(
-                sequence, database, program, max_target_seqs
-            )
-            
-            return CallToolResult(
-                content=[TextContent(
-                    type="text",
-                    text=f"BLAST results for sequence (program: {program}, database: {database}):\n\n" +
-                         json.dumps(result, indent=2)
-                )]
-            )
+async def _handle_search_phenotypes(arguments: Dict[str, Any]) -> CallToolResult:
+    query = arguments["query"]
+    limit = _clamp_limit(arguments.get("limit", 20))
+    result = await agr_client.search_phenotypes(query, limit=limit, raw=_passthrough(arguments))
+    
+    return _tool_result(f"Phenotype search results for '{query}'", result, arguments)
 
-        elif name == "get_species_list":
-            result = await agr_client.get_species_list()
-            
-            return CallToolResult(
-                content=[TextContent(
-                    type="text",
-                    text="Supported model organisms:\n\n" +
-                         json.dumps(result, indent=2)
-                )]
-            )
+async def _handle_blast_sequence(arguments: Dict[str, Any]) -> CallToolResult:
+    sequence = arguments["sequence"]
+    database = arguments.get("database", "all")
+    program = arguments.get("program", "blastn")
+    max_target_seqs = arguments.get("max_target_seqs", 50)
+    
+    result = await agr_client.blast_sequence(
+        sequence, database, program, max_target_seqs, raw=_passthrough(arguments)
+    )
+    
+    return _tool_result(f"BLAST results for sequence (program: {program}, database: {database})", result, arguments)
 
-        else:
-            return CallToolResult(
-                content=[TextContent(
-                    type="text",
-                    text=f"Unknown tool: {name}"
-                )]
-            )
+async def _handle_get_species_list(arguments: Dict[str, Any]) -> CallToolResult:
+    result = await agr_client.get_species_list(raw=_passthrough(arguments))
+    
+    return _tool_result("Supported model organisms", result, arguments)
+
+# Tool name -> handler, so dispatch is a single dict lookup.
+_HANDLERS: Dict[str, Callable[[Dict[str, Any]], Awaitable[CallToolResult]]] = {
+    "search_genes": _handle_search_genes,
+    "get_gene_info": _handle_get_gene_info,
+    "get_gene_diseases": _handle_get_gene_diseases,
+    "find_orthologs": _handle_find_orthologs,
+    "get_gene_interactions": _handle_get_gene_interactions,
+    "get_gene_expression": _handle_get_gene_expression,
+    "get_gene_bundle": _handle_get_gene_bundle,
+    "search_diseases": _handle_search_diseases,
+    "search_phenotypes": _handle_search_phenotypes,
+    "blast_sequence": _handle_blast_sequence,
+    "get_species_list": _handle_get_species_list,
+}
 
+@server.call_tool()
+async def call_tool(name: str, arguments: Dict[str, Any]) -> CallToolResult:
+    """Handle tool calls for the AGR MCP server."""
+    handler = _HANDLERS.get(name)
+    if handler is None:
+        return CallToolResult(
+            content=[TextContent(
+                type="text",
+                text=f"Unknown tool: {name}"
+            )]
+        )
+
+    try:
+        return await handler(arguments)
     except Exception as e:
-        logger.error(f"Error calling tool {name}: {e}")
+        logger.error("Error calling tool %s: %s", name, e)
         return CallToolResult(
             content=[TextContent(
                 type="text",
@@ -484,16 +722,24 @@ async def main():
     # Import here to avoid issues with circular imports
     from mcp.server.stdio import stdio_server
     
-    async with stdio_server() as (read_stream, write_stream):
-        await server.run(
-            read_stream,
-            write_stream,
-            InitializationOptions(
-                server_name="agr-genomics",
-                server_version="1.0.0",
-                capabilities={}
+    try:
+        async with stdio_server() as (read_stream, write_stream):
+            await server.run(
+                read_stream,
+                write_stream,
+                InitializationOptions(
+                    server_name="agr-genomics",
+                    server_version="1.0.0",
+                    capabilities={}
+                )
             )
-        )
+    finally:
+        await agr_client.aclose()
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    try:
+        import uvloop
+    except ImportError:
+        asyncio.run(main())
+    else:
+        uvloop.run(main())
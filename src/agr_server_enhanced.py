@@ -19,14 +19,22 @@ Based on Alliance capabilities including:
 """
 
 import asyncio
+import contextvars
+import functools
 import json
 import logging
 import os
+import random
 import re
+import sys
+import time
 import urllib.parse
-from typing import Any, Dict, List, Optional, Union
+from collections import OrderedDict
+from types import MappingProxyType
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, List, Optional, Tuple, Union
 
 import httpx
+from cachetools import TTLCache
 from mcp.server import Server
 from mcp.server.models import InitializationOptions
 from mcp.types import (
@@ -37,10 +45,126 @@ from mcp.types import (
     Tool,
 )
 
+# Tool output is read by models, so it is compact unless AGR_MCP_PRETTY=1.
+_PRETTY = os.environ.get("AGR_MCP_PRETTY") == "1"
+
+try:
+    import orjson
+
+    _loads = orjson.loads
+    _dumpb = orjson.dumps
+
+    def _canonical(obj: Any) -> bytes:
+        """Key-sorted compact JSON, identical for equal argument dicts."""
+        return orjson.dumps(obj, option=orjson.OPT_SORT_KEYS)
+    # NON_STR_KEYS keeps stdlib json's tolerance of int keys
+    _DUMP_OPTION = orjson.OPT_NON_STR_KEYS | (orjson.OPT_INDENT_2 if _PRETTY else 0)
+
+    def _dump(obj: Any) -> str:
+        """Serialize a tool result as JSON text."""
+        return orjson.dumps(obj, option=_DUMP_OPTION).decode()
+except ImportError:
+    _loads = json.loads
+
+    def _dumpb(obj: Any) -> bytes:
+        """Serialize a request body as compact JSON bytes."""
+        return json.dumps(obj, separators=(",", ":")).encode()
+
+    def _canonical(obj: Any) -> bytes:
+        """Key-sorted compact JSON, identical for equal argument dicts."""
+        return json.dumps(obj, separators=(",", ":"), sort_keys=True).encode()
+
+    _DUMP_KWARGS: Dict[str, Any] = {"indent": 2} if _PRETTY else {"separators": (",", ":")}
+
+    def _dump(obj: Any) -> str:
+        """Serialize a tool result as JSON text."""
+        return json.dumps(obj, **_DUMP_KWARGS)
+
+try:
+    import brotli  # noqa: F401  (lets httpx decode "br" responses)
+    _ACCEPT_ENCODING = "gzip, br"
+except ImportError:
+    _ACCEPT_ENCODING = "gzip"
+
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
+try:
+    import msgspec
+except ImportError:
+    msgspec = None
+
+# Identifiers accepted by the per-entity endpoints, e.g. HGNC:1100 or DOID:162
+_ID_RE = re.compile(r"(HGNC|MGI|RGD|ZFIN|FB|WB|SGD|XENBASE|DOID|GO|WBPhenotype):[A-Za-z0-9_.:-]+")
+
+# Extra attempts for GETs that fail with a transient error
+_MAX_RETRIES = 3
+
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+@functools.lru_cache(maxsize=32)
+def _origin(base_url: str) -> str:
+    """scheme://host[:port] of a base URL."""
+    parts = urllib.parse.urlsplit(base_url)
+    return f"{parts.scheme}://{parts.netloc}"
+
+@functools.lru_cache(maxsize=32)
+def _url_prefix(base_url: str) -> str:
+    """Base URL with exactly one trailing slash, so endpoints join by concatenation."""
+    return base_url.rstrip("/") + "/"
+
+def _checked_id(identifier: str) -> str:
+    """Validate an AGR identifier and URL-quote it, before any network I/O."""
+    if not isinstance(identifier, str) or not _ID_RE.fullmatch(identifier):
+        raise ValueError(f"Invalid identifier: {identifier!r}")
+    return urllib.parse.quote(identifier, safe=":")
+
+def _is_transient(error: httpx.HTTPError) -> bool:
+    """Connection problems and 5xx responses are worth retrying."""
+    if isinstance(error, httpx.HTTPStatusError):
+        return 500 <= error.response.status_code < 600
+    return isinstance(error, httpx.TransportError)
+
+def _select(data: Any, item_path: str) -> List[Any]:
+    """The records at an ijson prefix such as ``results.item`` in parsed JSON."""
+    nodes = [data]
+    for part in item_path.split("."):
+        if part == "item":
+            nodes = [item for node in nodes if isinstance(node, list) for item in node]
+        else:
+            nodes = [node[part] for node in nodes if isinstance(node, dict) and part in node]
+    return nodes
+
+class _CallState:
+    """Whether every upstream response behind one tool call may be kept."""
+
+    __slots__ = ("cacheable",)
+
+    def __init__(self):
+        self.cacheable = True
+
+# Set by call_tool around a handler. A mutable holder, so lookups made in child
+# tasks (gather fan-outs) report back to the call that started them.
+_CALL_STATE: "contextvars.ContextVar[Optional[_CallState]]" = contextvars.ContextVar(
+    "agr_call_state", default=None)
+
+def _mark_uncacheable() -> None:
+    """Keep the current tool call's rendered text out of the response cache."""
+    state = _CALL_STATE.get()
+    if state is not None:
+        state.cacheable = False
+
+def _collect(keys, results) -> Dict[str, Any]:
+    """Pair gathered results with their keys, reporting failures inline."""
+    return {
+        key: {"error": str(value)} if isinstance(value, BaseException) else value
+        for key, value in zip(keys, results)
+    }
+
 class EnhancedAGRClient:
     """Enhanced client for interacting with Alliance of Genome Resources APIs and services."""
     
@@ -52,29 +176,209 @@ class EnhancedAGRClient:
         self.textpresso_url = "https://textpresso.alliancegenome.org"
         self.alliancemine_url = "https://www.alliancegenome.org/alliancemine"
         self.timeout = 30.0
+        # One HTTP/2 client per origin, so each host gets its own multiplexed connection
+        self._clients: Dict[str, httpx.AsyncClient] = {}
+        # Bound in-flight requests per origin so gather fan-outs don't trip rate
+        # limits, and a burst to one host (say BLAST) can't starve the others
+        self._max_concurrency = int(os.environ.get("AGR_MAX_CONCURRENCY", "16"))
+        self._sems: Dict[str, asyncio.Semaphore] = {}
+        # TTL LRU cache for idempotent GETs; AGR data only changes between releases
+        self._cache: "OrderedDict[tuple, Tuple[float, Any]]" = OrderedDict()
+        self._cache_max = 1024
+        self._cache_ttl = 3600.0
+        self._inflight: Dict[tuple, asyncio.Task] = {}
+
+    async def _get_client(self, base_url: str) -> httpx.AsyncClient:
+        """Return the HTTP client for ``base_url``'s origin, creating it on first use."""
+        origin = _origin(base_url)
+        client = self._clients.get(origin)
+        if client is None:
+            self._sems[origin] = asyncio.Semaphore(self._max_concurrency)
+            client = self._clients[origin] = httpx.AsyncClient(
+                base_url=origin,
+                timeout=self.timeout,
+                http2=True,
+                headers={"Accept-Encoding": _ACCEPT_ENCODING},
+                limits=httpx.Limits(
+                    max_connections=100,
+                    max_keepalive_connections=50,
+                    keepalive_expiry=30.0
+                )
+            )
+        return client
+
+    async def aclose(self) -> None:
+        """Close every per-origin HTTP client and its pooled connections."""
+        clients, self._clients = self._clients, {}
+        await asyncio.gather(*(client.aclose() for client in clients.values()))
         
     async def _make_request(self, endpoint: str, params: Optional[Dict] = None,
-                           base_url: Optional[str] = None, method: str = "GET") -> Dict[str, Any]:
-        """Make HTTP request to AGR API."""
-        url = f"{base_url or self.base_url}/{endpoint.lstrip('/')}"
+                           base_url: Optional[str] = None, method: str = "GET",
+                           raw: bool = False) -> Any:
+        """Make HTTP request to AGR API, serving repeated GETs from a TTL cache.
+
+        ``endpoint`` is relative to ``base_url``, without a leading slash. With
+        ``raw`` the response text is returned unparsed.
+        """
+        base_url = base_url or self.base_url
+        url = _url_prefix(base_url) + endpoint
+        if method.upper() != "GET":
+            # Never cached or retried, here or as rendered tool text
+            _mark_uncacheable()
+            data, _ = await self._fetch(base_url, url, params, method, raw)
+            return data
+
+        key = (url, tuple(sorted((params or {}).items())), raw)
+        cached = self._cache_get(key)
+        if cached is not None:
+            return cached
+
+        # One fetch per key, run as its own task so that cancelling any one
+        # caller only stops that caller waiting.
+        task = self._inflight.get(key)
+        if task is None:
+            task = self._inflight[key] = asyncio.create_task(
+                self._fetch_shared(key, base_url, url, params, raw))
+            # Mark a failure retrieved even if every caller has given up on it
+            task.add_done_callback(lambda t: t.cancelled() or t.exception())
+        data, cacheable = await asyncio.shield(task)
+        if not cacheable:
+            _mark_uncacheable()
+        return data
+
+    async def _fetch_shared(self, key: tuple, base_url: str, url: str,
+                            params: Optional[Dict], raw: bool) -> Tuple[Any, bool]:
+        """GET for every caller waiting on ``key``, caching the body when allowed.
+
+        Returns the body and whether it may be cached, for every waiter to see.
+        """
+        try:
+            data, cacheable = await self._fetch(base_url, url, params, "GET", raw)
+        finally:
+            self._inflight.pop(key, None)
+        if cacheable:
+            self._cache[key] = (time.monotonic(), data)
+            if len(self._cache) > self._cache_max:
+                self._cache.popitem(last=False)
+        return data, cacheable
+
+    def _cache_get(self, key: tuple) -> Any:
+        """Return a fresh cached response, dropping it once its TTL has passed."""
+        entry = self._cache.get(key)
+        if entry is None:
+            return None
+        if time.monotonic() - entry[0] >= self._cache_ttl:
+            del self._cache[key]
+            return None
+        self._cache.move_to_end(key)
+        return entry[1]
+
+    async def _fetch(self, base_url: str, url: str, params: Optional[Dict],
+                     method: str, raw: bool = False) -> Tuple[Any, bool]:
+        """Issue the HTTP request; returns the parsed body and whether it may be cached."""
+        client = await self._get_client(base_url)
         
-        async with httpx.AsyncClient(timeout=self.timeout) as client:
+        if method.upper() == "GET":
+            request = client.build_request("GET", url, params=params or {})
+        elif method.upper() == "POST":
+            # Pre-encoded so httpx's stdlib json encoder stays out of the path.
+            request = client.build_request("POST", url, content=_dumpb(params or {}),
+                                           headers={"content-type": "application/json"})
+        else:
+            raise ValueError(f"Unsupported HTTP method: {method}")
+
+        # Only idempotent GETs are retried; POSTs surface the first failure.
+        retries = _MAX_RETRIES if request.method == "GET" else 0
+        try:
+            for attempt in range(retries + 1):
+                try:
+                    response, body = await self._send(client, self._sems[_origin(base_url)],
+                                                      request)
+                    break
+                except (httpx.TransportError, httpx.HTTPStatusError) as e:
+                    if attempt == retries or not _is_transient(e):
+                        raise
+                    delay = min(2 ** attempt, 8) * (0.5 + random.random())
+                    logger.warning(f"Retrying {request.url} in {delay:.2f}s after: {e}")
+                    await asyncio.sleep(delay)
+            
+            cacheable = "no-store" not in response.headers.get("cache-control", "")
+            if raw:
+                return body.decode(), cacheable
+            return _loads(body), cacheable
+        except httpx.HTTPError as e:
+            logger.error(f"API request failed: {e}")
+            raise Exception(f"API request failed: {str(e)}")
+        except json.JSONDecodeError as e:
+            logger.error(f"Failed to parse JSON response: {e}")
+            raise Exception(f"Invalid JSON response: {str(e)}")
+
+    async def _send(self, client: httpx.AsyncClient, sem: asyncio.Semaphore,
+                    request: httpx.Request) -> Tuple[httpx.Response, bytearray]:
+        """Send one request under its origin's concurrency limit and read its body."""
+        async with sem:
+            # Stream the (decompressed) body into one buffer instead of
+            # letting httpx hold chunks and join them before parsing.
+            response = await client.send(request, stream=True)
             try:
-                if method.upper() == "GET":
-                    response = await client.get(url, params=params or {})
-                elif method.upper() == "POST":
-                    response = await client.post(url, json=params or {})
-                else:
-                    raise ValueError(f"Unsupported HTTP method: {method}")
-                
                 response.raise_for_status()
-                return response.json()
-            except httpx.HTTPError as e:
-                logger.error(f"API request failed: {e}")
-                raise Exception(f"API request failed: {str(e)}")
-            except json.JSONDecodeError as e:
-                logger.error(f"Failed to parse JSON response: {e}")
-                raise Exception(f"Invalid JSON response: {str(e)}")
+                body = bytearray()
+                async for chunk in response.aiter_bytes(65536):
+                    body.extend(chunk)
+            finally:
+                await response.aclose()
+        return response, body
+
+    async def _stream_items(self, endpoint: str, params: Optional[Dict] = None,
+                            base_url: Optional[str] = None,
+                            item_path: str = "results.item") -> AsyncIterator[Any]:
+        """Yield the records at ``item_path`` as the response body arrives.
+
+        The body is parsed incrementally with ijson, so the full list is never
+        materialized. If nothing in the body matches ``item_path``, the whole
+        body is yielded as a single record instead. Streams are neither cached
+        nor retried, since records may already have been handed on. Without
+        ijson this falls back to a regular request.
+        """
+        base_url = base_url or self.base_url
+        if ijson is None:
+            data = await self._make_request(endpoint, params, base_url)
+            for item in _select(data, item_path) or [data]:
+                yield item
+            return
+
+        client = await self._get_client(base_url)
+        url = _url_prefix(base_url) + endpoint
+        events = ijson.sendable_list()
+        parser = ijson.items_coro(events, item_path, use_float=True)
+        # Held only until the first record matches, for the whole-body fallback
+        body: Optional[bytearray] = bytearray()
+        try:
+            async with self._sems[_origin(base_url)]:
+                async with client.stream("GET", url, params=params or {}) as response:
+                    response.raise_for_status()
+                    async for chunk in response.aiter_bytes(65536):
+                        if body is not None:
+                            body.extend(chunk)
+                        parser.send(chunk)
+                        if events:
+                            body = None
+                        for item in events:
+                            yield item
+                        del events[:]
+            parser.close()
+            if events:
+                body = None
+            for item in events:
+                yield item
+        except httpx.HTTPError as e:
+            logger.error(f"API request failed: {e}")
+            raise Exception(f"API request failed: {str(e)}")
+        except ijson.JSONError as e:
+            logger.error(f"Failed to parse JSON response: {e}")
+            raise Exception(f"Invalid JSON response: {str(e)}")
+        if body is not None:
+            yield _loads(body)
 
     # Core Gene and Search Functions
     async def search_genes(self, query: str, category: str = "gene", 
@@ -86,41 +390,88 @@ class EnhancedAGRClient:
             "limit": limit,
             "offset": offset
         }
-        return await self._make_request("/search", params)
+        return await self._make_request("search", params)
 
     async def get_gene_info(self, gene_id: str) -> Dict[str, Any]:
         """Get detailed gene information."""
-        return await self._make_request(f"/gene/{gene_id}")
+        return await self._make_request(f"gene/{_checked_id(gene_id)}")
 
     async def get_gene_summary(self, gene_id: str) -> Dict[str, Any]:
         """Get gene summary information."""
-        return await self._make_request(f"/gene/{gene_id}/summary")
+        return await self._make_request(f"gene/{_checked_id(gene_id)}/summary")
+
+    async def get_gene_bundle(self, gene_id: str) -> Dict[str, Any]:
+        """Fetch gene info, diseases, expression, function and orthologs concurrently."""
+        _checked_id(gene_id)  # fail once up front rather than in every sub-request
+        keys = ("info", "diseases", "expression", "function", "orthologs")
+        results = await asyncio.gather(
+            self.get_gene_info(gene_id),
+            self.get_gene_diseases(gene_id),
+            self.get_gene_expression(gene_id),
+            self.get_gene_function(gene_id),
+            self.find_orthologs(gene_id),
+            return_exceptions=True
+        )
+        return _collect(keys, results)
+
+    async def get_gene_report(self, gene_id: str) -> Dict[str, Any]:
+        """Fetch gene info, disease/phenotype associations, orthologs and expression concurrently."""
+        _checked_id(gene_id)
+
+        async def associations() -> Dict[str, Any]:
+            results = await asyncio.gather(
+                self.get_gene_diseases(gene_id),
+                self.get_gene_phenotypes(gene_id),
+                return_exceptions=True
+            )
+            return _collect(("diseases", "phenotypes"), results)
+
+        keys = ("info", "associations", "orthologs", "expression")
+        results = await asyncio.gather(
+            self.get_gene_info(gene_id),
+            associations(),
+            self.find_orthologs(gene_id),
+            self.get_gene_expression(gene_id),
+            return_exceptions=True
+        )
+        return _collect(keys, results)
+
+    async def search_genes_with_summaries(self, query: str, limit: int = 10) -> Dict[str, Any]:
+        """Search for genes, then fetch every hit's summary concurrently."""
+        search = await self.search_genes(query, limit=limit)
+        hits = search.get("results") or []
+        ids = [hit["id"] for hit in hits if hit.get("id")]
+        summaries = await asyncio.gather(
+            *(self.get_gene_summary(gene_id) for gene_id in ids),
+            return_exceptions=True
+        )
+        return {"total": search.get("total"), "summaries": _collect(ids, summaries)}
 
     # Allele and Variant Functions
     async def get_gene_alleles(self, gene_id: str) -> Dict[str, Any]:
         """Get allele information for a gene."""
-        return await self._make_request(f"/gene/{gene_id}/alleles")
+        return await self._make_request(f"gene/{_checked_id(gene_id)}/alleles")
 
     async def get_allele_info(self, allele_id: str) -> Dict[str, Any]:
         """Get detailed allele information."""
-        return await self._make_request(f"/allele/{allele_id}")
+        return await self._make_request(f"allele/{_checked_id(allele_id)}")
 
     async def get_gene_variants(self, gene_id: str) -> Dict[str, Any]:
         """Get variant information for a gene."""
-        return await self._make_request(f"/gene/{gene_id}/variants")
+        return await self._make_request(f"gene/{_checked_id(gene_id)}/variants")
 
     # Disease and Phenotype Functions
     async def get_gene_diseases(self, gene_id: str) -> Dict[str, Any]:
         """Get disease associations for a gene."""
-        return await self._make_request(f"/gene/{gene_id}/diseases")
+        return await self._make_request(f"gene/{_checked_id(gene_id)}/diseases")
 
     async def get_disease_info(self, disease_id: str) -> Dict[str, Any]:
         """Get detailed disease information."""
-        return await self._make_request(f"/disease/{disease_id}")
+        return await self._make_request(f"disease/{_checked_id(disease_id)}")
 
     async def get_gene_phenotypes(self, gene_id: str) -> Dict[str, Any]:
         """Get phenotype associations for a gene."""
-        return await self._make_request(f"/gene/{gene_id}/phenotypes")
+        return await self._make_request(f"gene/{_checked_id(gene_id)}/phenotypes")
 
     async def search_diseases(self, query: str, limit: int = 20) -> Dict[str, Any]:
         """Search for diseases."""
@@ -129,7 +480,7 @@ class EnhancedAGRClient:
             "category": "disease",
             "limit": limit
         }
-        return await self._make_request("/search", params)
+        return await self._make_request("search", params)
 
     async def search_phenotypes(self, query: str, limit: int = 20) -> Dict[str, Any]:
         """Search for phenotypes."""
@@ -138,51 +489,51 @@ class EnhancedAGRClient:
             "category": "phenotype", 
             "limit": limit
         }
-        return await self._make_request("/search", params)
+        return await self._make_request("search", params)
 
     # Expression and Interaction Functions
     async def get_gene_expression(self, gene_id: str) -> Dict[str, Any]:
         """Get expression data for a gene."""
-        return await self._make_request(f"/gene/{gene_id}/expression")
+        return await self._make_request(f"gene/{_checked_id(gene_id)}/expression")
 
     async def get_expression_ribbon_summary(self, gene_id: str) -> Dict[str, Any]:
         """Get expression ribbon summary for a gene."""
-        return await self._make_request(f"/gene/{gene_id}/expression-ribbon-summary")
+        return await self._make_request(f"gene/{_checked_id(gene_id)}/expression-ribbon-summary")
 
     async def get_gene_interactions(self, gene_id: str) -> Dict[str, Any]:
         """Get interaction data for a gene."""
-        return await self._make_request(f"/gene/{gene_id}/interactions")
+        return await self._make_request(f"gene/{_checked_id(gene_id)}/interactions")
 
     async def get_molecular_interactions(self, gene_id: str) -> Dict[str, Any]:
         """Get molecular interaction data for a gene."""
-        return await self._make_request(f"/gene/{gene_id}/molecular-interactions")
+        return await self._make_request(f"gene/{_checked_id(gene_id)}/molecular-interactions")
 
     async def get_genetic_interactions(self, gene_id: str) -> Dict[str, Any]:
         """Get genetic interaction data for a gene."""
-        return await self._make_request(f"/gene/{gene_id}/genetic-interactions")
+        return await self._make_request(f"gene/{_checked_id(gene_id)}/genetic-interactions")
 
     # Orthology and Comparative Functions
     async def find_orthologs(self, gene_id: str) -> Dict[str, Any]:
         """Find orthologous genes across species."""
-        return await self._make_request(f"/gene/{gene_id}/orthologs")
+        return await self._make_request(f"gene/{_checked_id(gene_id)}/orthologs")
 
     async def get_homologs_by_species(self, gene_id: str, species: str) -> Dict[str, Any]:
         """Get homologs for a specific species."""
         params = {"species": species}
-        return await self._make_request(f"/gene/{gene_id}/orthologs", params)
+        return await self._make_request(f"gene/{_checked_id(gene_id)}/orthologs", params)
 
     async def get_paralogs(self, gene_id: str) -> Dict[str, Any]:
         """Get paralogous genes within the same species."""
-        return await self._make_request(f"/gene/{gene_id}/paralogs")
+        return await self._make_request(f"gene/{_checked_id(gene_id)}/paralogs")
 
     # Gene Ontology and Function
     async def get_gene_function(self, gene_id: str) -> Dict[str, Any]:
         """Get gene function annotations (GO terms)."""
-        return await self._make_request(f"/gene/{gene_id}/function")
+        return await self._make_request(f"gene/{_checked_id(gene_id)}/function")
 
     async def get_go_annotations(self, gene_id: str) -> Dict[str, Any]:
         """Get Gene Ontology annotations for a gene."""
-        return await self._make_request(f"/gene/{gene_id}/go-annotations")
+        return await self._make_request(f"gene/{_checked_id(gene_id)}/go-annotations")
 
     async def search_go_terms(self, query: str, limit: int = 20) -> Dict[str, Any]:
         """Search for Gene Ontology terms."""
@@ -191,12 +542,12 @@ class EnhancedAGRClient:
             "category": "go",
             "limit": limit
         }
-        return await self._make_request("/search", params)
+        return await self._make_request("search", params)
 
     # Pathway Functions
     async def get_gene_pathways(self, gene_id: str) -> Dict[str, Any]:
         """Get pathway associations for a gene."""
-        return await self._make_request(f"/gene/{gene_id}/pathways")
+        return await self._make_request(f"gene/{_checked_id(gene_id)}/pathways")
 
     async def search_pathways(self, query: str, limit: int = 20) -> Dict[str, Any]:
         """Search for biological pathways."""
@@ -205,12 +556,16 @@ class EnhancedAGRClient:
             "category": "pathway",
             "limit": limit
         }
-        return await self._make_request("/search", params)
+        return await self._make_request("search", params)
 
     # Literature and References
     async def get_gene_literature(self, gene_id: str) -> Dict[str, Any]:
         """Get literature references for a gene."""
-        return await self._make_request(f"/gene/{gene_id}/literature")
+        return await self._make_request(f"gene/{_checked_id(gene_id)}/literature")
+
+    def stream_gene_literature(self, gene_id: str) -> AsyncIterator[Any]:
+        """Stream a gene's literature references one record at a time."""
+        return self._stream_items(f"gene/{_checked_id(gene_id)}/literature")
 
     async def search_literature_textpresso(self, query: str, species: str = "all",
                                          category: str = "gene", limit: int = 20) -> Dict[str, Any]:
@@ -221,7 +576,7 @@ class EnhancedAGRClient:
             "category": category,
             "limit": limit
         }
-        return await self._make_request("/search", params, self.textpresso_url)
+        return await self._make_request("search", params, self.textpresso_url)
 
     # Sequence and BLAST Functions
     async def blast_sequence(self, sequence: str, database: str = "all", 
@@ -233,36 +588,49 @@ class EnhancedAGRClient:
             "program": program,
             "max_target_seqs": max_target_seqs
         }
-        return await self._make_request("/blast", params, self.blast_url)
+        return await self._make_request("blast", params, self.blast_url)
+
+    def stream_blast_hits(self, sequence: str, database: str = "all",
+                          program: str = "blastn", max_target_seqs: int = 50) -> AsyncIterator[Any]:
+        """Stream BLAST hits one record at a time."""
+        params = {
+            "sequence": sequence,
+            "database": database,
+            "program": program,
+            "max_target_seqs": max_target_seqs
+        }
+        # SequenceServer-style report: one entry per query, each with its hits
+        return self._stream_items("blast", params, self.blast_url, "queries.item.hits.item")
 
     async def get_gene_sequence(self, gene_id: str, sequence_type: str = "genomic") -> Dict[str, Any]:
         """Get gene sequence data."""
         params = {"type": sequence_type}
-        return await self._make_request(f"/gene/{gene_id}/sequence", params)
+        return await self._make_request(f"gene/{_checked_id(gene_id)}/sequence", params)
 
     # Species and Model Organism Functions
-    async def get_species_list(self) -> Dict[str, Any]:
+    async def get_species_list(self, raw: bool = False) -> Union[Dict[str, Any], str]:
         """Get list of supported species."""
-        return await self._make_request("/species")
+        return await self._make_request("species", raw=raw)
 
     async def get_species_info(self, species_id: str) -> Dict[str, Any]:
         """Get detailed species information."""
-        return await self._make_request(f"/species/{species_id}")
+        return await self._make_request(f"species/{urllib.parse.quote(species_id, safe=':')}")
 
     async def get_model_organisms(self) -> Dict[str, Any]:
         """Get list of model organisms."""
-        return await self._make_request("/model-organisms")
+        return await self._make_request("model-organisms")
 
     # Data Mining and Complex Queries
-    async def alliancemine_query(self, query_xml: str) -> Dict[str, Any]:
+    async def alliancemine_query(self, query_xml: str, raw: bool = False) -> Union[Dict[str, Any], str]:
         """Execute AllianceMine query."""
         params = {"query": query_xml}
-        return await self._make_request("/query", params, self.alliancemine_url, "POST")
+        return await self._make_request("query", params, self.alliancemine_url, "POST", raw=raw)
 
-    async def get_download_links(self, data_type: str = "all") -> Dict[str, Any]:
+    async def get_download_links(self, data_type: str = "all",
+                                 raw: bool = False) -> Union[Dict[str, Any], str]:
         """Get data download links."""
         params = {"type": data_type}
-        return await self._make_request("/downloads", params)
+        return await self._make_request("downloads", params, raw=raw)
 
     # JBrowse Integration
     async def get_jbrowse_data(self, species: str, chromosome: str, 
@@ -274,21 +642,32 @@ class EnhancedAGRClient:
             "start": start,
             "end": end
         }
-        return await self._make_request("/tracks", params, self.jbrowse_url)
+        return await self._make_request("tracks", params, self.jbrowse_url)
+
+    def stream_jbrowse_data(self, species: str, chromosome: str,
+                            start: int, end: int) -> AsyncIterator[Any]:
+        """Stream JBrowse track features one record at a time."""
+        params = {
+            "species": species,
+            "chr": chromosome,
+            "start": start,
+            "end": end
+        }
+        return self._stream_items("tracks", params, self.jbrowse_url, "features.item")
 
     # Experimental Conditions
     async def get_experimental_conditions(self, entity_id: str) -> Dict[str, Any]:
         """Get experimental conditions for phenotype/disease annotations."""
-        return await self._make_request(f"/experimental-conditions/{entity_id}")
+        return await self._make_request(f"experimental-conditions/{_checked_id(entity_id)}")
 
     # Transgenic and Construct Data
     async def get_transgenic_alleles(self, gene_id: str) -> Dict[str, Any]:
         """Get transgenic alleles for a gene."""
-        return await self._make_request(f"/gene/{gene_id}/transgenic-alleles")
+        return await self._make_request(f"gene/{_checked_id(gene_id)}/transgenic-alleles")
 
     async def get_construct_info(self, construct_id: str) -> Dict[str, Any]:
         """Get construct information."""
-        return await self._make_request(f"/construct/{construct_id}")
+        return await self._make_request(f"construct/{_checked_id(construct_id)}")
 
 # Initialize the enhanced AGR client
 agr_client = EnhancedAGRClient()
@@ -296,425 +675,368 @@ agr_client = EnhancedAGRClient()
 # Create the MCP server
 server = Server("agr-genomics-enhanced")
 
+# Tool definitions are static, so build them once at import time.
+# Schema pieces shared by many tools are read-only constants; the MCP Tool
+# model copies the top level, so only the outer mapping can be a proxy.
+_LIMIT_PROPERTY = {"type": "integer", "description": "Maximum results (default: 20)", "default": 20}
+_GENE_ID_SCHEMA = MappingProxyType({
+    "type": "object",
+    "properties": {
+        "gene_id": {"type": "string", "description": "Gene identifier"}
+    },
+    "required": ("gene_id",)
+})
+
+_TOOLS: List[Tool] = [
+    # Core Gene Search and Information
+    Tool(
+        name="search_genes",
+        description="Search for genes by symbol, name, or identifier across model organisms",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "query": {"type": "string", "description": "Gene symbol, name, or identifier"},
+                "limit": _LIMIT_PROPERTY,
+                "offset": {"type": "integer", "description": "Results to skip (default: 0)", "default": 0}
+            },
+            "required": ["query"]
+        }
+    ),
+    Tool(
+        name="get_gene_info",
+        description="Retrieve comprehensive gene information including summary, function, and annotations",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "gene_id": {"type": "string", "description": "Gene identifier (e.g., HGNC:5, MGI:95892)"}
+            },
+            "required": ["gene_id"]
+        }
+    ),
+    Tool(
+        name="get_gene_summary",
+        description="Get concise gene summary with key functional information",
+        inputSchema=_GENE_ID_SCHEMA
+    ),
+    Tool(
+        name="get_gene_bundle",
+        description="Get gene info, diseases, expression, function and orthologs in one concurrent call",
+        inputSchema=_GENE_ID_SCHEMA
+    ),
+    Tool(
+        name="batch_gene_report",
+        description="Get gene info, disease and phenotype associations, orthologs and expression in one concurrent call",
+        inputSchema=_GENE_ID_SCHEMA
+    ),
+    Tool(
+        name="search_genes_with_summaries",
+        description="Search for genes and fetch the summary of every hit concurrently",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "query": {"type": "string", "description": "Gene symbol, name, or identifier"},
+                "limit": {"type": "integer", "description": "Maximum results (default: 10)", "default": 10}
+            },
+            "required": ["query"]
+        }
+    ),
+
+    # Allele and Variant Tools
+    Tool(
+        name="get_gene_alleles",
+        description="Get all alleles associated with a gene including phenotypic effects",
+        inputSchema=_GENE_ID_SCHEMA
+    ),
+    Tool(
+        name="get_allele_info", 
+        description="Get detailed information about a specific allele",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "allele_id": {"type": "string", "description": "Allele identifier"}
+            },
+            "required": ["allele_id"]
+        }
+    ),
+    Tool(
+        name="get_gene_variants",
+        description="Get sequence variants for a gene",
+        inputSchema=_GENE_ID_SCHEMA
+    ),
+
+    # Disease and Phenotype Tools
+    Tool(
+        name="get_gene_diseases",
+        description="Get disease associations and models for a gene",
+        inputSchema=_GENE_ID_SCHEMA
+    ),
+    Tool(
+        name="get_disease_info",
+        description="Get comprehensive information about a disease",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "disease_id": {"type": "string", "description": "Disease identifier (DO term)"}
+            },
+            "required": ["disease_id"]
+        }
+    ),
+    Tool(
+        name="get_gene_phenotypes",
+        description="Get phenotype annotations and experimental conditions for a gene",
+        inputSchema=_GENE_ID_SCHEMA
+    ),
+    Tool(
+        name="search_diseases",
+        description="Search for diseases and conditions",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "query": {"type": "string", "description": "Disease name or term"},
+                "limit": _LIMIT_PROPERTY
+            },
+            "required": ["query"]
+        }
+    ),
+    Tool(
+        name="search_phenotypes",
+        description="Search for phenotypes and their associations",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "query": {"type": "string", "description": "Phenotype term"},
+                "limit": _LIMIT_PROPERTY
+            },
+            "required": ["query"]
+        }
+    ),
+
+    # Expression and Interaction Tools
+    Tool(
+        name="get_gene_expression",
+        description="Get comprehensive gene expression data across tissues and conditions",
+        inputSchema=_GENE_ID_SCHEMA
+    ),
+    Tool(
+        name="get_expression_ribbon_summary",
+        description="Get expression ribbon summary for visualization across anatomy and life stages",
+        inputSchema=_GENE_ID_SCHEMA
+    ),
+    Tool(
+        name="get_molecular_interactions",
+        description="Get protein-protein and molecular interactions for a gene",
+        inputSchema=_GENE_ID_SCHEMA
+    ),
+    Tool(
+        name="get_genetic_interactions",
+        description="Get genetic interactions and epistasis data for a gene",
+        inputSchema=_GENE_ID_SCHEMA
+    ),
+
+    # Orthology and Comparative Genomics
+    Tool(
+        name="find_orthologs",
+        description="Find orthologous genes across all species in the Alliance",
+        inputSchema=_GENE_ID_SCHEMA
+    ),
+    Tool(
+        name="get_homologs_by_species",
+        description="Get homologs for a specific target species",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "gene_id": {"type": "string", "description": "Gene identifier"},
+                "species": {"type": "string", "description": "Target species (e.g., 'Homo sapiens', 'Mus musculus')"}
+            },
+            "required": ["gene_id", "species"]
+        }
+    ),
+    Tool(
+        name="get_paralogs",
+        description="Get paralogous genes within the same species",
+        inputSchema=_GENE_ID_SCHEMA
+    ),
+
+    # Gene Ontology and Function
+    Tool(
+        name="get_gene_function",
+        description="Get functional annotations and Gene Ontology terms for a gene",
+        inputSchema=_GENE_ID_SCHEMA
+    ),
+    Tool(
+        name="get_go_annotations",
+        description="Get detailed Gene Ontology annotations with evidence codes",
+        inputSchema=_GENE_ID_SCHEMA
+    ),
+    Tool(
+        name="search_go_terms",
+        description="Search for Gene Ontology terms and definitions",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "query": {"type": "string", "description": "GO term name or ID"},
+                "limit": _LIMIT_PROPERTY
+            },
+            "required": ["query"]
+        }
+    ),
+
+    # Pathway Analysis
+    Tool(
+        name="get_gene_pathways",
+        description="Get biological pathways associated with a gene",
+        inputSchema=_GENE_ID_SCHEMA
+    ),
+    Tool(
+        name="search_pathways",
+        description="Search for biological pathways and networks",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "query": {"type": "string", "description": "Pathway name or description"},
+                "limit": _LIMIT_PROPERTY
+            },
+            "required": ["query"]
+        }
+    ),
+
+    # Literature and References
+    Tool(
+        name="get_gene_literature",
+        description="Get literature references and citations for a gene",
+        inputSchema=_GENE_ID_SCHEMA
+    ),
+    Tool(
+        name="search_literature_textpresso",
+        description="Search literature using Textpresso full-text search system",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "query": {"type": "string", "description": "Search terms for literature"},
+                "species": {"type": "string", "description": "Species filter (default: 'all')", "default": "all"},
+                "category": {"type": "string", "description": "Category filter (default: 'gene')", "default": "gene"},
+                "limit": _LIMIT_PROPERTY
+            },
+            "required": ["query"]
+        }
+    ),
+
+    # Sequence Analysis
+    Tool(
+        name="blast_sequence",
+        description="Perform BLAST sequence similarity search against Alliance databases",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "sequence": {"type": "string", "description": "DNA, RNA, or protein sequence"},
+                "database": {"type": "string", "description": "Target database (default: 'all')", "default": "all"},
+                "program": {"type": "string", "description": "BLAST program (default: 'blastn')", "default": "blastn"},
+                "max_target_seqs": {"type": "integer", "description": "Maximum targets (default: 50)", "default": 50}
+            },
+            "required": ["sequence"]
+        }
+    ),
+    Tool(
+        name="get_gene_sequence",
+        description="Get gene sequence data (genomic, transcript, protein)",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "gene_id": {"type": "string", "description": "Gene identifier"},
+                "sequence_type": {"type": "string", "description": "Sequence type (genomic, transcript, protein)", "default": "genomic"}
+            },
+            "required": ["gene_id"]
+        }
+    ),
+
+    # Species and Model Organisms
+    Tool(
+        name="get_species_list",
+        description="Get list of all supported model organisms and species",
+        inputSchema={
+            "type": "object",
+            "properties": {},
+            "required": []
+        }
+    ),
+    Tool(
+        name="get_species_info",
+        description="Get detailed information about a specific species",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "species_id": {"type": "string", "description": "Species identifier or name"}
+            },
+            "required": ["species_id"]
+        }
+    ),
+
+    # JBrowse Genome Browser Integration
+    Tool(
+        name="get_jbrowse_data",
+        description="Get genome browser data for visualization of genomic regions",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "species": {"type": "string", "description": "Species name"},
+                "chromosome": {"type": "string", "description": "Chromosome identifier"},
+                "start": {"type": "integer", "description": "Start position"},
+                "end": {"type": "integer", "description": "End position"}
+            },
+            "required": ["species", "chromosome", "start", "end"]
+        }
+    ),
+
+    # Transgenic and Construct Data
+    Tool(
+        name="get_transgenic_alleles",
+        description="Get transgenic alleles and model systems for a gene",
+        inputSchema=_GENE_ID_SCHEMA
+    ),
+    Tool(
+        name="get_construct_info",
+        description="Get information about transgenic constructs",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "construct_id": {"type": "string", "description": "Construct identifier"}
+            },
+            "required": ["construct_id"]
+        }
+    ),
+
+    # Data Downloads and Mining
+    Tool(
+        name="get_download_links",
+        description="Get links to download Alliance data files",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "data_type": {"type": "string", "description": "Data type to download (default: 'all')", "default": "all"}
+            },
+            "required": []
+        }
+    ),
+    Tool(
+        name="alliancemine_query",
+        description="Execute complex data mining queries using AllianceMine",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "query_xml": {"type": "string", "description": "AllianceMine XML query"}
+            },
+            "required": ["query_xml"]
+        }
+    )
+]
+
 @server.list_tools()
 async def list_tools() -> List[Tool]:
     """List available tools for the enhanced AGR MCP server."""
-    return [
-        # Core Gene Search and Information
-        Tool(
-            name="search_genes",
-            description="Search for genes by symbol, name, or identifier across model organisms",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "query": {"type": "string", "description": "Gene symbol, name, or identifier"},
-                    "limit": {"type": "integer", "description": "Maximum results (default: 20)", "default": 20},
-                    "offset": {"type": "integer", "description": "Results to skip (default: 0)", "default": 0}
-                },
-                "required": ["query"]
-            }
-        ),
-        Tool(
-            name="get_gene_info",
-            description="Retrieve comprehensive gene information including summary, function, and annotations",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "gene_id": {"type": "string", "description": "Gene identifier (e.g., HGNC:5, MGI:95892)"}
-                },
-                "required": ["gene_id"]
-            }
-        ),
-        Tool(
-            name="get_gene_summary",
-            description="Get concise gene summary with key functional information",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "gene_id": {"type": "string", "description": "Gene identifier"}
-                },
-                "required": ["gene_id"]
-            }
-        ),
-
-        # Allele and Variant Tools
-        Tool(
-            name="get_gene_alleles",
-            description="Get all alleles associated with a gene including phenotypic effects",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "gene_id": {"type": "string", "description": "Gene identifier"}
-                },
-                "required": ["gene_id"]
-            }
-        ),
-        Tool(
-            name="get_allele_info", 
-            description="Get detailed information about a specific allele",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "allele_id": {"type": "string", "description": "Allele identifier"}
-                },
-                "required": ["allele_id"]
-            }
-        ),
-        Tool(
-            name="get_gene_variants",
-            description="Get sequence variants for a gene",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "gene_id": {"type": "string", "description": "Gene identifier"}
-                },
-                "required": ["gene_id"]
-            }
-        ),
-
-        # Disease and Phenotype Tools
-        Tool(
-            name="get_gene_diseases",
-            description="Get disease associations and models for a gene",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "gene_id": {"type": "string", "description": "Gene identifier"}
-                },
-                "required": ["gene_id"]
-            }
-        ),
-        Tool(
-            name="get_disease_info",
-            description="Get comprehensive information about a disease",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "disease_id": {"type": "string", "description": "Disease identifier (DO term)"}
-                },
-                "required": ["disease_id"]
-            }
-        ),
-        Tool(
-            name="get_gene_phenotypes",
-            description="Get phenotype annotations and experimental conditions for a gene",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "gene_id": {"type": "string", "description": "Gene identifier"}
-                },
-                "required": ["gene_id"]
-            }
-        ),
-        Tool(
-            name="search_diseases",
-            description="Search for diseases and conditions",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "query": {"type": "string", "description": "Disease name or term"},
-                    "limit": {"type": "integer", "description": "Maximum results (default: 20)", "default": 20}
-                },
-                "required": ["query"]
-            }
-        ),
-        Tool(
-            name="search_phenotypes",
-            description="Search for phenotypes and their associations",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "query": {"type": "string", "description": "Phenotype term"},
-                    "limit": {"type": "integer", "description": "Maximum results (default: 20)", "default": 20}
-                },
-                "required": ["query"]
-            }
-        ),
-
-        # Expression and Interaction Tools
-        Tool(
-            name="get_gene_expression",
-            description="Get comprehensive gene expression data across tissues and conditions",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "gene_id": {"type": "string", "description": "Gene identifier"}
-                },
-                "required": ["gene_id"]
-            }
-        ),
-        Tool(
-            name="get_expression_ribbon_summary",
-            description="Get expression ribbon summary for visualization across anatomy and life stages",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "gene_id": {"type": "string", "description": "Gene identifier"}
-                },
-                "required": ["gene_id"]
-            }
-        ),
-        Tool(
-            name="get_molecular_interactions",
-            description="Get protein-protein and molecular interactions for a gene",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "gene_id": {"type": "string", "description": "Gene identifier"}
-                },
-                "required": ["gene_id"]
-            }
-        ),
-        Tool(
-            name="get_genetic_interactions",
-            description="Get genetic interactions and epistasis data for a gene",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "gene_id": {"type": "string", "description": "Gene identifier"}
-                },
-                "required": ["gene_id"]
-            }
-        ),
-
-        # Orthology and Comparative Genomics
-        Tool(
-            name="find_orthologs",
-            description="Find orthologous genes across all species in the Alliance",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "gene_id": {"type": "string", "description": "Gene identifier"}
-                },
-                "required": ["gene_id"]
-            }
-        ),
-        Tool(
-            name="get_homologs_by_species",
-            description="Get homologs for a specific target species",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "gene_id": {"type": "string", "description": "Gene identifier"},
-                    "species": {"type": "string", "description": "Target species (e.g., 'Homo sapiens', 'Mus musculus')"}
-                },
-                "required": ["gene_id", "species"]
-            }
-        ),
-        Tool(
-            name="get_paralogs",
-            description="Get paralogous genes within the same species",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "gene_id": {"type": "string", "description": "Gene identifier"}
-                },
-                "required": ["gene_id"]
-            }
-        ),
-
-        # Gene Ontology and Function
-        Tool(
-            name="get_gene_function",
-            description="Get functional annotations and Gene Ontology terms for a gene",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "gene_id": {"type": "string", "description": "Gene identifier"}
-                },
-                "required": ["gene_id"]
-            }
-        ),
-        Tool(
-            name="get_go_annotations",
-            description="Get detailed Gene Ontology annotations with evidence codes",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "gene_id": {"type": "string", "description": "Gene identifier"}
-                },
-                "required": ["gene_id"]
-            }
-        ),
-        Tool(
-            name="search_go_terms",
-            description="Search for Gene Ontology terms and definitions",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "query": {"type": "string", "description": "GO term name or ID"},
-                    "limit": {"type": "integer", "description": "Maximum results (default: 20)", "default": 20}
-                },
-                "required": ["query"]
-            }
-        ),
-
-        # Pathway Analysis
-        Tool(
-            name="get_gene_pathways",
-            description="Get biological pathways associated with a gene",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "gene_id": {"type": "string", "description": "Gene identifier"}
-                },
-                "required": ["gene_id"]
-            }
-        ),
-        Tool(
-            name="search_pathways",
-            description="Search for biological pathways and networks",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "query": {"type": "string", "description": "Pathway name or description"},
-                    "limit": {"type": "integer", "description": "Maximum results (default: 20)", "default": 20}
-                },
-                "required": ["query"]
-            }
-        ),
-
-        # Literature and References
-        Tool(
-            name="get_gene_literature",
-            description="Get literature references and citations for a gene",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "gene_id": {"type": "string", "description": "Gene identifier"}
-                },
-                "required": ["gene_id"]
-            }
-        ),
-        Tool(
-            name="search_literature_textpresso",
-            description="Search literature using Textpresso full-text search system",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "query": {"type": "string", "description": "Search terms for literature"},
-                    "species": {"type": "string", "description": "Species filter (default: 'all')", "default": "all"},
-                    "category": {"type": "string", "description": "Category filter (default: 'gene')", "default": "gene"},
-                    "limit": {"type": "integer", "description": "Maximum results (default: 20)", "default": 20}
-                },
-                "required": ["query"]
-            }
-        ),
-
-        # Sequence Analysis
-        Tool(
-            name="blast_sequence",
-            description="Perform BLAST sequence similarity search against Alliance databases",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "sequence": {"type": "string", "description": "DNA, RNA, or protein sequence"},
-                    "database": {"type": "string", "description": "Target database (default: 'all')", "default": "all"},
-                    "program": {"type": "string", "description": "BLAST program (default: 'blastn')", "default": "blastn"},
-                    "max_target_seqs": {"type": "integer", "description": "Maximum targets (default: 50)", "default": 50}
-                },
-                "required": ["sequence"]
-            }
-        ),
-        Tool(
-            name="get_gene_sequence",
-            description="Get gene sequence data (genomic, transcript, protein)",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "gene_id": {"type": "string", "description": "Gene identifier"},
-                    "sequence_type": {"type": "string", "description": "Sequence type (genomic, transcript, protein)", "default": "genomic"}
-                },
-                "required": ["gene_id"]
-            }
-        ),
-
-        # Species and Model Organisms
-        Tool(
-            name="get_species_list",
-            description="Get list of all supported model organisms and species",
-            inputSchema={
-                "type": "object",
-                "properties": {},
-                "required": []
-            }
-        ),
-        Tool(
-            name="get_species_info",
-            description="Get detailed information about a specific species",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "species_id": {"type": "string", "description": "Species identifier or name"}
-                },
-                "required": ["species_id"]
-            }
-        ),
-
-        # JBrowse Genome Browser Integration
-        Tool(
-            name="get_jbrowse_data",
-            description="Get genome browser data for visualization of genomic regions",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "species": {"type": "string", "description": "Species name"},
-                    "chromosome": {"type": "string", "description": "Chromosome identifier"},
-                    "start": {"type": "integer", "description": "Start position"},
-                    "end": {"type": "integer", "description": "End position"}
-                },
-                "required": ["species", "chromosome", "start", "end"]
-            }
-        ),
-
-        # Transgenic and Construct Data
-        Tool(
-            name="get_transgenic_alleles",
-            description="Get transgenic alleles and model systems for a gene",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "gene_id": {"type": "string", "description": "Gene identifier"}
-                },
-                "required": ["gene_id"]
-            }
-        ),
-        Tool(
-            name="get_construct_info",
-            description="Get information about transgenic constructs",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "construct_id": {"type": "string", "description": "Construct identifier"}
-                },
-                "required": ["construct_id"]
-            }
-        ),
-
-        # Data Downloads and Mining
-        Tool(
-            name="get_download_links",
-            description="Get links to download Alliance data files",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "data_type": {"type": "string", "description": "Data type to download (default: 'all')", "default": "all"}
-                },
-                "required": []
-            }
-        ),
-        Tool(
-            name="alliancemine_query",
-            description="Execute complex data mining queries using AllianceMine",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "query_xml": {"type": "string", "description": "AllianceMine XML query"}
-                },
-                "required": ["query_xml"]
-            }
-        )
-    ]
+    return _TOOLS
+
+# Longest tool response text sent back to the client
+_MAX_TEXT_LENGTH = 10000
 
 def create_text_response(text: str) -> CallToolResult:
     """Create a properly formatted CallToolResult with TextContent."""
@@ -724,8 +1046,8 @@ def create_text_response(text: str) -> CallToolResult:
             text = str(text)
         
         # Limit text length to prevent issues
-        if len(text) > 10000:
-            text = text[:10000] + "\n... (truncated)"
+        if len(text) > _MAX_TEXT_LENGTH:
+            text = text[:_MAX_TEXT_LENGTH] + "\n... (truncated)"
         
         # Create TextContent properly
         text_content = TextContent(type="text", text=text)
@@ -745,230 +1067,317 @@ def create_text_response(text: str) -> CallToolResult:
         error_content = TextContent(type="text", text=f"Error formatting response: {str(e)}")
         return CallToolResult(content=[error_content])
 
+# Results whose top-level containers hold more references than this (about
+# 4k items, i.e. multi-MB once serialized) are serialized off the event loop.
+_OFFLOAD_SIZE = 32 * 1024
+
+def _estimate_size(result: Any) -> int:
+    """Cheap size heuristic: the container plus its direct children, unrecursed."""
+    size = sys.getsizeof(result)
+    if isinstance(result, dict):
+        size += sum(sys.getsizeof(value) for value in result.values())
+    return size
+
+async def _render(result: Any) -> str:
+    """Serialize a tool result, in a worker thread when it is large."""
+    if isinstance(result, (dict, list)) and _estimate_size(result) > _OFFLOAD_SIZE:
+        return await asyncio.to_thread(_dump, result)
+    return _dump(result)
+
+def _passthrough(text: str) -> str:
+    """Upstream JSON text as tool output, re-encoded only when pretty output is on."""
+    return _dump(_loads(text)) if _PRETTY else text
+
+# Tools whose upstream JSON is forwarded verbatim: the client returns the raw
+# text, skipping a parse and a re-encode of the whole payload.
+_PASSTHROUGH_TOOLS = frozenset({"get_species_list", "alliancemine_query"})
+
+# Tools that pass one argument straight to the client and return the
+# payload under a fixed header: (client method, argument name, header template).
+_TEMPLATED_TOOLS: Dict[str, Tuple[Callable[..., Awaitable[Any]], Optional[str], str]] = {
+    "get_gene_info": (agr_client.get_gene_info, "gene_id", "Gene information for {gene_id}:\n\n"),
+    "get_gene_summary": (agr_client.get_gene_summary, "gene_id", "Gene summary for {gene_id}:\n\n"),
+    "get_gene_bundle": (agr_client.get_gene_bundle, "gene_id", "Gene bundle for {gene_id}:\n\n"),
+    "batch_gene_report": (agr_client.get_gene_report, "gene_id", "Gene report for {gene_id}:\n\n"),
+    "get_gene_alleles": (agr_client.get_gene_alleles, "gene_id", "Alleles for {gene_id}:\n\n"),
+    "get_allele_info": (agr_client.get_allele_info, "allele_id", "Allele information for {allele_id}:\n\n"),
+    "get_gene_variants": (agr_client.get_gene_variants, "gene_id", "Variants for {gene_id}:\n\n"),
+    "get_gene_diseases": (agr_client.get_gene_diseases, "gene_id", "Disease associations for {gene_id}:\n\n"),
+    "get_disease_info": (agr_client.get_disease_info, "disease_id", "Disease information for {disease_id}:\n\n"),
+    "get_gene_phenotypes": (agr_client.get_gene_phenotypes, "gene_id", "Phenotypes for {gene_id}:\n\n"),
+    "get_gene_expression": (agr_client.get_gene_expression, "gene_id", "Expression data for {gene_id}:\n\n"),
+    "get_expression_ribbon_summary": (agr_client.get_expression_ribbon_summary, "gene_id", "Expression ribbon summary for {gene_id}:\n\n"),
+    "get_molecular_interactions": (agr_client.get_molecular_interactions, "gene_id", "Molecular interactions for {gene_id}:\n\n"),
+    "get_genetic_interactions": (agr_client.get_genetic_interactions, "gene_id", "Genetic interactions for {gene_id}:\n\n"),
+    "find_orthologs": (agr_client.find_orthologs, "gene_id", "Orthologs for {gene_id}:\n\n"),
+    "get_paralogs": (agr_client.get_paralogs, "gene_id", "Paralogs for {gene_id}:\n\n"),
+    "get_gene_function": (agr_client.get_gene_function, "gene_id", "Functional annotations for {gene_id}:\n\n"),
+    "get_go_annotations": (agr_client.get_go_annotations, "gene_id", "GO annotations for {gene_id}:\n\n"),
+    "get_gene_pathways": (agr_client.get_gene_pathways, "gene_id", "Pathways for {gene_id}:\n\n"),
+    "get_species_info": (agr_client.get_species_info, "species_id", "Species information for {species_id}:\n\n"),
+    "get_transgenic_alleles": (agr_client.get_transgenic_alleles, "gene_id", "Transgenic alleles for {gene_id}:\n\n"),
+    "get_construct_info": (agr_client.get_construct_info, "construct_id", "Construct information for {construct_id}:\n\n"),
+    "alliancemine_query": (agr_client.alliancemine_query, "query_xml", "AllianceMine query results:\n\n"),
+    "get_species_list": (agr_client.get_species_list, None, "Supported species:\n\n"),
+}
+
+def _templated_handler(fn: Callable[..., Awaitable[Any]], arg: Optional[str], template: str,
+                       raw: bool = False) -> Callable[[Dict[str, Any]], Awaitable[str]]:
+    """Build a handler that calls ``fn`` and prefixes its JSON with ``template``."""
+    render = template.format
+    if raw:
+        # Argument-independent header: concatenate the constant, no format call.
+        prefix = template if "{" not in template else None
+
+        async def handler(arguments: Dict[str, Any]) -> str:
+            text = await (fn(arguments[arg], raw=True) if arg else fn(raw=True))
+            return (prefix if prefix is not None else render(**arguments)) + _passthrough(text)
+
+        return handler
+
+    async def handler(arguments: Dict[str, Any]) -> str:
+        result = await (fn(arguments[arg]) if arg else fn())
+        return render(**arguments) + await _render(result)
+
+    return handler
+
+# Core Gene Functions
+async def _h_search_genes(arguments: Dict[str, Any]) -> str:
+    query = arguments["query"]
+    limit = arguments.get("limit", 20)
+    offset = arguments.get("offset", 0)
+    result = await agr_client.search_genes(query, limit=limit, offset=offset)
+    return f"Gene search results for '{query}':\n\n{await _render(result)}"
+
+async def _h_search_genes_with_summaries(arguments: Dict[str, Any]) -> str:
+    query = arguments["query"]
+    limit = arguments.get("limit", 10)
+    result = await agr_client.search_genes_with_summaries(query, limit=limit)
+    return f"Gene summaries for '{query}':\n\n{await _render(result)}"
+
+# Disease and Phenotype Functions
+async def _h_search_diseases(arguments: Dict[str, Any]) -> str:
+    query = arguments["query"]
+    limit = arguments.get("limit", 20)
+    result = await agr_client.search_diseases(query, limit=limit)
+    return f"Disease search results for '{query}':\n\n{await _render(result)}"
+
+async def _h_search_phenotypes(arguments: Dict[str, Any]) -> str:
+    query = arguments["query"]
+    limit = arguments.get("limit", 20)
+    result = await agr_client.search_phenotypes(query, limit=limit)
+    return f"Phenotype search results for '{query}':\n\n{await _render(result)}"
+
+# Orthology Functions
+async def _h_get_homologs_by_species(arguments: Dict[str, Any]) -> str:
+    gene_id = arguments["gene_id"]
+    species = arguments["species"]
+    result = await agr_client.get_homologs_by_species(gene_id, species)
+    return f"Homologs in {species} for {gene_id}:\n\n{await _render(result)}"
+
+# Gene Ontology Functions
+async def _h_search_go_terms(arguments: Dict[str, Any]) -> str:
+    query = arguments["query"]
+    limit = arguments.get("limit", 20)
+    result = await agr_client.search_go_terms(query, limit=limit)
+    return f"GO term search results for '{query}':\n\n{await _render(result)}"
+
+# Pathway Functions
+async def _h_search_pathways(arguments: Dict[str, Any]) -> str:
+    query = arguments["query"]
+    limit = arguments.get("limit", 20)
+    result = await agr_client.search_pathways(query, limit=limit)
+    return f"Pathway search results for '{query}':\n\n{await _render(result)}"
+
+# Literature Functions
+async def _h_search_literature_textpresso(arguments: Dict[str, Any]) -> str:
+    query = arguments["query"]
+    species = arguments.get("species", "all")
+    category = arguments.get("category", "gene")
+    limit = arguments.get("limit", 20)
+    result = await agr_client.search_literature_textpresso(query, species, category, limit)
+    return f"Textpresso literature search for '{query}':\n\n{await _render(result)}"
+
+# Sequence Functions
+async def _h_get_gene_sequence(arguments: Dict[str, Any]) -> str:
+    gene_id = arguments["gene_id"]
+    sequence_type = arguments.get("sequence_type", "genomic")
+    result = await agr_client.get_gene_sequence(gene_id, sequence_type)
+    return f"Sequence data for {gene_id} ({sequence_type}):\n\n{await _render(result)}"
+
+# Data Mining Functions
+async def _h_get_download_links(arguments: Dict[str, Any]) -> str:
+    data_type = arguments.get("data_type", "all")
+    text = await agr_client.get_download_links(data_type, raw=True)
+    return f"Download links for {data_type}:\n\n{_passthrough(text)}"
+
+# Tool name -> handler returning the response text.
+_DISPATCH: Dict[str, Callable[[Dict[str, Any]], Awaitable[str]]] = {
+    name: _templated_handler(*spec, raw=name in _PASSTHROUGH_TOOLS)
+    for name, spec in _TEMPLATED_TOOLS.items()
+}
+_DISPATCH.update({
+    "search_genes": _h_search_genes,
+    "search_genes_with_summaries": _h_search_genes_with_summaries,
+    "search_diseases": _h_search_diseases,
+    "search_phenotypes": _h_search_phenotypes,
+    "get_homologs_by_species": _h_get_homologs_by_species,
+    "search_go_terms": _h_search_go_terms,
+    "search_pathways": _h_search_pathways,
+    "search_literature_textpresso": _h_search_literature_textpresso,
+    "get_gene_sequence": _h_get_gene_sequence,
+    "get_download_links": _h_get_download_links,
+})
+
+# List-shaped results that can run to megabytes are streamed as NDJSON
+# instead: tool name -> function returning (header, record iterator).
+_NDJSON_BATCH = 256
+
+def _s_get_gene_literature(arguments: Dict[str, Any]) -> Tuple[str, AsyncIterator[Any]]:
+    gene_id = arguments["gene_id"]
+    return f"Literature for {gene_id}:", agr_client.stream_gene_literature(gene_id)
+
+def _s_blast_sequence(arguments: Dict[str, Any]) -> Tuple[str, AsyncIterator[Any]]:
+    sequence = arguments["sequence"]
+    database = arguments.get("database", "all")
+    program = arguments.get("program", "blastn")
+    max_target_seqs = arguments.get("max_target_seqs", 50)
+    return "BLAST results:", agr_client.stream_blast_hits(sequence, database, program, max_target_seqs)
+
+def _s_get_jbrowse_data(arguments: Dict[str, Any]) -> Tuple[str, AsyncIterator[Any]]:
+    species = arguments["species"]
+    chromosome = arguments["chromosome"]
+    start = arguments["start"]
+    end = arguments["end"]
+    header = f"JBrowse data for {species} {chromosome}:{start}-{end}:"
+    return header, agr_client.stream_jbrowse_data(species, chromosome, start, end)
+
+_STREAMING: Dict[str, Callable[[Dict[str, Any]], Tuple[str, AsyncIterator[Any]]]] = {
+    "get_gene_literature": _s_get_gene_literature,
+    "blast_sequence": _s_blast_sequence,
+    "get_jbrowse_data": _s_get_jbrowse_data,
+}
+
+async def _stream_response(header: str, items: AsyncIterator[Any]) -> CallToolResult:
+    """Render streamed records as NDJSON, one TextContent per batch of records.
+
+    Reading stops, and the upstream response is closed, once the text reaches
+    the same length limit that create_text_response applies.
+    """
+    content = [TextContent(type="text", text=header)]
+    size = len(header)
+    # Lines stay as orjson bytes and each batch is decoded once, not per record
+    batch: List[bytes] = []
+    try:
+        async for item in items:
+            line = _dumpb(item)
+            batch.append(line)
+            size += len(line) + 1
+            if size > _MAX_TEXT_LENGTH:
+                batch.append(b"... (truncated)")
+                break
+            if len(batch) >= _NDJSON_BATCH:
+                content.append(TextContent(type="text", text=b"\n".join(batch).decode()))
+                batch.clear()
+    finally:
+        await items.aclose()
+    if batch:
+        content.append(TextContent(type="text", text=b"\n".join(batch).decode()))
+    return CallToolResult(content=content)
+
+# Argument shapes checked once at dispatch, so a missing or mistyped argument
+# is reported by name instead of surfacing as a bare KeyError from a handler.
+if msgspec is not None:
+    class GeneIdParams(msgspec.Struct):
+        gene_id: str
+
+    class SearchParams(msgspec.Struct):
+        query: str
+        # Left unset when omitted so each handler applies its own default.
+        # JSON Schema's "integer" admits integral floats such as 3.0 (not
+        # bools or strings), so those are accepted and normalized to int.
+        limit: Union[int, float, msgspec.UnsetType] = msgspec.UNSET
+
+        def __post_init__(self):
+            if isinstance(self.limit, float):
+                if not self.limit.is_integer():
+                    raise ValueError("Expected `int`, got `float` - at `$.limit`")
+                self.limit = int(self.limit)
+
+    _PARAM_TYPES: Dict[str, type] = {
+        name: GeneIdParams for name, (_, arg, _) in _TEMPLATED_TOOLS.items() if arg == "gene_id"
+    }
+    _PARAM_TYPES["get_gene_literature"] = GeneIdParams
+    _PARAM_TYPES.update(dict.fromkeys((name for name in _DISPATCH if name.startswith("search_")),
+                                      SearchParams))
+else:
+    _PARAM_TYPES = {}
+
+# Rendered response text for (tool, arguments), so a repeated call skips both
+# the upstream lookup and the JSON encode. Failed calls raise and are not kept,
+# nor is text built from a no-store response or a non-GET request.
+_RESPONSE_CACHE: TTLCache = TTLCache(maxsize=1024, ttl=600)
+
+# Tools that gather several lookups and report a failed part inline as
+# {"error": ...} instead of raising. Their text is not kept, so a transient
+# failure is retried on the next call; the parts that succeeded are served
+# from the client's cache.
+_GATHERED_TOOLS = frozenset({"get_gene_bundle", "batch_gene_report", "search_genes_with_summaries"})
+
 @server.call_tool()
 async def call_tool(name: str, arguments: Dict[str, Any]) -> CallToolResult:
     """Handle tool calls for the enhanced AGR MCP server."""
-    try:
-        # Core Gene Functions
-        if name == "search_genes":
-            query = arguments["query"]
-            limit = arguments.get("limit", 20)
-            offset = arguments.get("offset", 0)
-            result = await agr_client.search_genes(query, limit=limit, offset=offset)
-            return create_text_response(f"Gene search results for '{query}':\n\n{json.dumps(result, indent=2)}")
-
-        elif name == "get_gene_info":
-            gene_id = arguments["gene_id"]
-            result = await agr_client.get_gene_info(gene_id)
-            return create_text_response(f"Gene information for {gene_id}:\n\n{json.dumps(result, indent=2)}")
-
-        elif name == "get_gene_summary":
-            gene_id = arguments["gene_id"]
-            result = await agr_client.get_gene_summary(gene_id)
-            return create_text_response(f"Gene summary for {gene_id}:\n\n{json.dumps(result, indent=2)}")
-
-        # Allele and Variant Functions
-        elif name == "get_gene_alleles":
-            gene_id = arguments["gene_id"]
-            result = await agr_client.get_gene_alleles(gene_id)
-            return create_text_response(f"Alleles for {gene_id}:\n\n{json.dumps(result, indent=2)}")
-
-        elif name == "get_allele_info":
-            allele_id = arguments["allele_id"]
-            result = await agr_client.get_allele_info(allele_id)
-            return create_text_response(f"Allele information for {allele_id}:\n\n{json.dumps(result, indent=2)}")
-
-        elif name == "get_gene_variants":
-            gene_id = arguments["gene_id"]
-            result = await agr_client.get_gene_variants(gene_id)
-            return create_text_response(f"Variants for {gene_id}:\n\n{json.dumps(result, indent=2)}")
-
-        # Disease and Phenotype Functions
-        elif name == "get_gene_diseases":
-            gene_id = arguments["gene_id"]
-            result = await agr_client.get_gene_diseases(gene_id)
-            return create_text_response(f"Disease associations for {gene_id}:\n\n{json.dumps(result, indent=2)}")
-
-        elif name == "get_disease_info":
-            disease_id = arguments["disease_id"]
-            result = await agr_client.get_disease_info(disease_id)
-            return create_text_response(f"Disease information for {disease_id}:\n\n{json.dumps(result, indent=2)}")
-
-        elif name == "get_gene_phenotypes":
-            gene_id = arguments["gene_id"]
-            result = await agr_client.get_gene_phenotypes(gene_id)
-            return create_text_response(f"Phenotypes for {gene_id}:\n\n{json.dumps(result, indent=2)}")
-
-        elif name == "search_diseases":
-            query = arguments["query"]
-            limit = arguments.get("limit", 20)
-            result = await agr_client.search_diseases(query, limit=limit)
-            return create_text_response(f"Disease search results for '{query}':\n\n{json.dumps(result, indent=2)}")
-
-        elif name == "search_phenotypes":
-            query = arguments["query"]
-            limit = arguments.get("limit", 20)
-            result = await agr_client.search_phenotypes(query, limit=limit)
-            return create_text_response(f"Phenotype search results for '{query}':\n\n{json.dumps(result, indent=2)}")
-
-        # Expression and Interaction Functions
-        elif name == "get_gene_expression":
-            gene_id = arguments["gene_id"]
-            result = await agr_client.get_gene_expression(gene_id)
-            return create_text_response(f"Expression data for {gene_id}:\n\n{json.dumps(result, indent=2)}")
-
-        elif name == "get_expression_ribbon_summary":
-            gene_id = arguments["gene_id"]
-            result = await agr_client.get_expression_ribbon_summary(gene_id)
-            return create_text_response(f"Expression ribbon summary for {gene_id}:\n\n{json.dumps(result, indent=2)}")
-
-        elif name == "get_molecular_interactions":
-            gene_id = arguments["gene_id"]
-            result = await agr_client.get_molecular_interactions(gene_id)
-            return create_text_response(f"Molecular interactions for {gene_id}:\n\n{json.dumps(result, indent=2)}")
-
-        elif name == "get_genetic_interactions":
-            gene_id = arguments["gene_id"]
-            result = await agr_client.get_genetic_interactions(gene_id)
-            return create_text_response(f"Genetic interactions for {gene_id}:\n\n{json.dumps(result, indent=2)}")
-
-        # Orthology Functions
-        elif name == "find_orthologs":
-            gene_id = arguments["gene_id"]
-            result = await agr_client.find_orthologs(gene_id)
-            return create_text_response(f"Orthologs for {gene_id}:\n\n{json.dumps(result, indent=2)}")
-
-        elif name == "get_homologs_by_species":
-            gene_id = arguments["gene_id"]
-            species = arguments["species"]
-            result = await agr_client.get_homologs_by_species(gene_id, species)
-            return create_text_response(f"Homologs in {species} for {gene_id}:\n\n{json.dumps(result, indent=2)}")
-
-        elif name == "get_paralogs":
-            gene_id = arguments["gene_id"]
-            result = await agr_client.get_paralogs(gene_id)
-            return create_text_response(f"Paralogs for {gene_id}:\n\n{json.dumps(result, indent=2)}")
-
-        # Gene Ontology Functions
-        elif name == "get_gene_function":
-            gene_id = arguments["gene_id"]
-            result = await agr_client.get_gene_function(gene_id)
-            return create_text_response(f"Functional annotations for {gene_id}:\n\n{json.dumps(result, indent=2)}")
-
-        elif name == "get_go_annotations":
-            gene_id = arguments["gene_id"]
-            result = await agr_client.get_go_annotations(gene_id)
-            return create_text_response(f"GO annotations for {gene_id}:\n\n{json.dumps(result, indent=2)}")
-
-        elif name == "search_go_terms":
-            query = arguments["query"]
-            limit = arguments.get("limit", 20)
-            result = await agr_client.search_go_terms(query, limit=limit)
-            return create_text_response(f"GO term search results for '{query}':\n\n{json.dumps(result, indent=2)}")
-
-        # Pathway Functions
-        elif name == "get_gene_pathways":
-            gene_id = arguments["gene_id"]
-            result = await agr_client.get_gene_pathways(gene_id)
-            return create_text_response(f"Pathways for {gene_id}:\n\n{json.dumps(result, indent=2)}")
-
-        elif name == "search_pathways":
-            query = arguments["query"]
-            limit = arguments.get("limit", 20)
-            result = await agr_client.search_pathways(query, limit=limit)
-            return create_text_response(f"Pathway search results for '{query}':\n\n{json.dumps(result, indent=2)}")
-
-        # Literature Functions
-        elif name == "get_gene_literature":
-            gene_id = arguments["gene_id"]
-            result = await agr_client.get_gene_literature(gene_id)
-            return create_text_response(f"Literature for {gene_id}:\n\n{json.dumps(result, indent=2)}")
-
-        elif name == "search_literature_textpresso":
-            query = arguments["query"]
-            species = arguments.get("species", "all")
-            category = arguments.get("category", "gene")
-            limit = arguments.get("limit", 20)
-            result = await agr_client.search_literature_textpresso(query, species, category, limit)
-            return create_text_response(f"Textpresso literature search for '{query}':\n\n{json.dumps(result, indent=2)}")
-
-        # Sequence Functions
-        elif name == "blast_sequence":
-            sequence = arguments["sequence"]
-            database = arguments.get("database", "all")
-            program = arguments.get("program", "blastn")
-            max_target_seqs = arguments.get("max_target_seqs", 50)
-            result = await agr_client.blast_sequence(sequence, database, program, max_target_seqs)
-            return create_text_response(f"BLAST results:\n\n{json.dumps(result, indent=2)}")
-
-        elif name == "get_gene_sequence":
-            gene_id = arguments["gene_id"]
-            sequence_type = arguments.get("sequence_type", "genomic")
-            result = await agr_client.get_gene_sequence(gene_id, sequence_type)
-            return create_text_response(f"Sequence data for {gene_id} ({sequence_type}):\n\n{json.dumps(result, indent=2)}")
-
-        # Species Functions
-        elif name == "get_species_list":
-            result = await agr_client.get_species_list()
-            return create_text_response(f"Supported species:\n\n{json.dumps(result, indent=2)}")
-
-        elif name == "get_species_info":
-            species_id = arguments["species_id"]
-            result = await agr_client.get_species_info(species_id)
-            return create_text_response(f"Species information for {species_id}:\n\n{json.dumps(result, indent=2)}")
-
-        # JBrowse Functions
-        elif name == "get_jbrowse_data":
-            species = arguments["species"]
-            chromosome = arguments["chromosome"]
-            start = arguments["start"]
-            end = arguments["end"]
-            result = await agr_client.get_jbrowse_data(species, chromosome, start, end)
-            return create_text_response(f"JBrowse data for {species} {chromosome}:{start}-{end}:\n\n{json.dumps(result, indent=2)}")
-
-        # Transgenic Functions
-        elif name == "get_transgenic_alleles":
-            gene_id = arguments["gene_id"]
-            result = await agr_client.get_transgenic_alleles(gene_id)
-            return create_text_response(f"Transgenic alleles for {gene_id}:\n\n{json.dumps(result, indent=2)}")
-
-        elif name == "get_construct_info":
-            construct_id = arguments["construct_id"]
-            result = await agr_client.get_construct_info(construct_id)
-            return create_text_response(f"Construct information for {construct_id}:\n\n{json.dumps(result, indent=2)}")
-
-        # Data Mining Functions
-        elif name == "get_download_links":
-            data_type = arguments.get("data_type", "all")
-            result = await agr_client.get_download_links(data_type)
-            return create_text_response(f"Download links for {data_type}:\n\n{json.dumps(result, indent=2)}")
-
-        elif name == "alliancemine_query":
-            query_xml = arguments["query_xml"]
-            result = await agr_client.alliancemine_query(query_xml)
-            return create_text_response(f"AllianceMine query results:\n\n{json.dumps(result, indent=2)}")
-
-        else:
-            return create_text_response(f"Unknown tool: {name}")
+    streamer = _STREAMING.get(name)
+    handler = _DISPATCH.get(name)
+    if streamer is None and handler is None:
+        return create_text_response(f"Unknown tool: {name}")
 
+    try:
+        param_type = _PARAM_TYPES.get(name)
+        if param_type is not None:
+            # Arguments the Struct doesn't model (offset, species, ...) pass through as given
+            arguments = {**arguments, **msgspec.to_builtins(msgspec.convert(arguments, param_type))}
+        if streamer is not None:
+            return await _stream_response(*streamer(arguments))
+        if name in _GATHERED_TOOLS:
+            return create_text_response(await handler(arguments))
+        # The exact canonical bytes, so distinct arguments can never share an entry
+        key = (name, _canonical(arguments))
+        text = _RESPONSE_CACHE.get(key)
+        if text is None:
+            state = _CallState()
+            token = _CALL_STATE.set(state)
+            try:
+                text = await handler(arguments)
+            finally:
+                _CALL_STATE.reset(token)
+            if state.cacheable:
+                _RESPONSE_CACHE[key] = text
+        return create_text_response(text)
     except Exception as e:
         logger.error(f"Error calling tool {name}: {e}")
         return create_text_response(f"Error calling tool {name}: {str(e)}")
 
+INIT_OPTIONS = InitializationOptions(
+    server_name="agr-genomics-enhanced",
+    server_version="2.0.0",
+    capabilities={}
+)
+
 async def main():
     """Main function to run the enhanced AGR MCP server."""
     from mcp.server.stdio import stdio_server 
     
-    async with stdio_server() as (read_stream, write_stream):
-        await server.run(
-            read_stream,
-            write_stream,
-            InitializationOptions(
-                server_name="agr-genomics-enhanced",
-                server_version="2.0.0",
-                capabilities={}
-            )
-        )
+    try:
+        async with stdio_server() as (read_stream, write_stream):
+            await server.run(read_stream, write_stream, INIT_OPTIONS)
+    finally:
+        await agr_client.aclose()
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    try:
+        import uvloop
+    except ImportError:
+        asyncio.run(main())
+    else:
+        uvloop.run(main())
@@ -7,13 +7,91 @@ We return plain dictionaries instead of Pydantic models.
 """
 
 import asyncio
+import functools
+import hashlib
 import json
 import logging
+import os
+import stat
 import sys
 import traceback
-from typing import Any, Dict, List, Optional
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Union
 
 import httpx
+from cachetools import TTLCache
+
+try:
+    import orjson
+
+    _loads = orjson.loads
+
+    def _dumps(obj: Any, indent: bool = False) -> str:
+        """Serialize to a JSON string, optionally pretty-printed."""
+        option = orjson.OPT_NON_STR_KEYS | (orjson.OPT_INDENT_2 if indent else 0)
+        return orjson.dumps(obj, option=option).decode()
+
+    def _dumpb(obj: Any) -> bytes:
+        """Serialize to compact UTF-8 JSON bytes."""
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS)
+
+    def _canonical(obj: Any) -> bytes:
+        """Key-sorted compact JSON, identical for equal dicts."""
+        return orjson.dumps(obj, option=orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS)
+except ImportError:
+    _loads = json.loads
+
+    def _dumps(obj: Any, indent: bool = False) -> str:
+        """Serialize to a JSON string, optionally pretty-printed."""
+        return json.dumps(obj, indent=2 if indent else None)
+
+    def _dumpb(obj: Any) -> bytes:
+        """Serialize to compact UTF-8 JSON bytes."""
+        return json.dumps(obj, separators=(",", ":")).encode()
+
+    def _canonical(obj: Any) -> bytes:
+        """Key-sorted compact JSON, identical for equal dicts."""
+        return json.dumps(obj, separators=(",", ":"), sort_keys=True).encode()
+
+try:
+    import msgpack
+
+    def _pack(obj: Any) -> bytes:
+        """Encode a cached payload for Redis."""
+        return msgpack.packb(obj, use_bin_type=True)
+
+    def _unpack(raw: bytes) -> Any:
+        """Decode a cached payload read from Redis."""
+        return msgpack.unpackb(raw, raw=False)
+except ImportError:
+    def _pack(obj: Any) -> bytes:
+        """Encode a cached payload for Redis."""
+        return json.dumps(obj).encode()
+
+    def _unpack(raw: bytes) -> Any:
+        """Decode a cached payload read from Redis."""
+        return _loads(raw)
+
+try:
+    import xxhash
+
+    def _digest(data: bytes) -> str:
+        """Short non-cryptographic hash for cache keys."""
+        return xxhash.xxh3_64_hexdigest(data)
+except ImportError:
+    def _digest(data: bytes) -> str:
+        """Short non-cryptographic hash for cache keys."""
+        return hashlib.blake2b(data, digest_size=16).hexdigest()
+
+try:
+    import h2  # noqa: F401  (httpx needs it for http2=True)
+    _HTTP2 = True
+except ImportError:
+    _HTTP2 = False
+
+try:
+    import redis.asyncio as aioredis
+except ImportError:
+    aioredis = None
 
 # Configure logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
@@ -25,20 +103,48 @@ class AGRClient:
     def __init__(self):
         self.base_url = "https://www.alliancegenome.org/api"
         self.timeout = 15.0
+        self._client: Optional[httpx.AsyncClient] = None
+        # Bound in-flight AGR requests so concurrent tool calls don't trip rate limits
+        self._sem = asyncio.Semaphore(int(os.environ.get("AGR_MAX_CONCURRENCY", "16")))
+
+    async def startup(self):
+        """Create the shared, pooled HTTP client used by every request."""
+        if self._client is None:
+            self._client = httpx.AsyncClient(
+                base_url=self.base_url,
+                timeout=self.timeout,
+                # Multiplex gather fan-outs over one connection when h2 is available
+                http2=_HTTP2,
+                limits=httpx.Limits(
+                    max_connections=100,
+                    max_keepalive_connections=50,
+                    keepalive_expiry=30.0
+                )
+            )
+
+    async def aclose(self):
+        """Close the shared HTTP client and its pooled connections."""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
         
     async def _make_request(self, endpoint: str, params: Optional[Dict] = None) -> Dict[str, Any]:
         """Make HTTP request to AGR API."""
-        url = f"{self.base_url}/{endpoint.lstrip('/')}"
+        if self._client is None:
+            await self.startup()
+        
+        path = endpoint.lstrip('/')
         
         try:
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
-                logger.info(f"Making request to: {url}")
-                response = await client.get(url, params=params or {})
-                
-                if response.status_code == 200:
-                    return response.json()
-                else:
-                    return {"error": f"HTTP {response.status_code}: {response.text[:200]}"}
+            logger.info(f"Making request to: {self.base_url}/{path}")
+            async with self._sem:
+                response = await self._client.get(path, params=params or {})
+            logger.debug(f"Response over {response.http_version}")
+            
+            if response.status_code == 200:
+                return _loads(response.content)
+            else:
+                return {"error": f"HTTP {response.status_code}: {response.text[:200]}"}
                     
         except Exception as e:
             return {"error": f"Request failed: {str(e)}"}
@@ -57,8 +163,213 @@ class AGRClient:
         """Get gene information."""
         return await self._make_request(f"/gene/{gene_id}")
 
-# Global client
-agr_client = AGRClient()
+class CachedAGRClient(AGRClient):
+    """AGRClient with an in-process TTL cache in front of an optional shared Redis cache.
+
+    AGR lookups are read-only reference data, so successful responses are
+    memoized for ``ttl`` seconds. Redis (enabled by passing ``redis_url``)
+    lets several server processes share one cache; entries are stored as
+    msgpack when it is installed. Redis calls time out after ``redis_timeout``
+    seconds, and any Redis failure just falls through to the API.
+    """
+
+    def __init__(self, redis_url: Optional[str] = None, ttl: int = 3600,
+                 redis_timeout: float = 0.2):
+        super().__init__()
+        self.ttl = ttl
+        self._local: TTLCache = TTLCache(maxsize=1024, ttl=ttl)
+        self._redis = None
+        if redis_url:
+            if aioredis is None:
+                logger.warning("redis is not installed; using the in-process cache only")
+            else:
+                # Every local miss waits on Redis, so a hung server must not stall calls
+                self._redis = aioredis.from_url(redis_url, socket_timeout=redis_timeout,
+                                                socket_connect_timeout=redis_timeout)
+
+    async def aclose(self):
+        """Close the HTTP client and the Redis connection pool."""
+        await super().aclose()
+        if self._redis is not None:
+            await self._redis.aclose()
+            self._redis = None
+
+    @staticmethod
+    def _cache_key(endpoint: str, params: Optional[Dict]) -> str:
+        return f"agr:{endpoint}:{_digest(_canonical(params or {}))}"
+
+    async def _make_request(self, endpoint: str, params: Optional[Dict] = None) -> Dict[str, Any]:
+        """Serve from the local cache, then Redis, then the AGR API."""
+        key = self._cache_key(endpoint, params)
+        data = self._local.get(key)
+        if data is not None:
+            return data
+
+        if self._redis is not None:
+            try:
+                raw = await self._redis.get(key)
+                # Timeouts and undecodable entries (e.g. written in another format) count as misses
+                data = _unpack(raw) if raw is not None else None
+            except Exception as e:
+                logger.warning(f"Redis get failed: {e}")
+            if data is not None:
+                self._local[key] = data
+                return data
+
+        data = await super()._make_request(endpoint, params)
+        if "error" not in data:
+            self._local[key] = data
+            if self._redis is not None:
+                try:
+                    await self._redis.set(key, _pack(data), ex=self.ttl)
+                except Exception as e:
+                    logger.warning(f"Redis set failed: {e}")
+        return data
+
+# Global client; set AGR_REDIS_URL to share cached lookups between processes
+agr_client = CachedAGRClient(os.environ.get("AGR_REDIS_URL"))
+
+# Results whose top-level containers hold more references than this (about
+# 4k items) are serialized in a worker thread, so concurrent requests keep moving.
+_OFFLOAD_SIZE = 32 * 1024
+
+def _estimate_size(result: Any) -> int:
+    """Cheap size heuristic: the container plus its direct children, unrecursed."""
+    size = sys.getsizeof(result)
+    if isinstance(result, dict):
+        size += sum(sys.getsizeof(value) for value in result.values())
+    return size
+
+async def _render(result: Any) -> str:
+    """Serialize a tool result as indented JSON, off the event loop when large."""
+    if isinstance(result, (dict, list)) and _estimate_size(result) > _OFFLOAD_SIZE:
+        return await asyncio.to_thread(_dumps, result, True)
+    return _dumps(result, indent=True)
+
+async def _tool_search_genes(arguments: Dict[str, Any]) -> str:
+    """Search genes and list the matching symbols, names and species."""
+    query = arguments.get("query", "")
+    limit = arguments.get("limit", 10)
+    
+    if not query:
+        return "Error: query parameter is required"
+    
+    result = await agr_client.search_genes(query, limit)
+    
+    if "error" in result:
+        return f"Error searching genes: {result['error']}"
+    
+    if "results" in result and isinstance(result["results"], list):
+        genes = result["results"][:limit]
+        if not genes:
+            return f"No genes found for '{query}'"
+        
+        formatted_genes = [
+            {
+                "symbol": gene.get("symbol", "Unknown"),
+                "name": gene.get("name", ""),
+                "species": (gene.get("species") or {}).get("name", ""),
+                "id": gene.get("id", "")
+            }
+            for gene in genes
+        ]
+        
+        return f"Found {len(formatted_genes)} genes for '{query}':\n\n{await _render(formatted_genes)}"
+    
+    return f"Gene search results for '{query}':\n\n{await _render(result)}"
+
+async def _tool_search_diseases(arguments: Dict[str, Any]) -> str:
+    """Search diseases and return the raw results."""
+    query = arguments.get("query", "")
+    limit = arguments.get("limit", 10)
+    
+    if not query:
+        return "Error: query parameter is required"
+    
+    result = await agr_client.search_diseases(query, limit)
+    
+    if "error" in result:
+        return f"Error searching diseases: {result['error']}"
+    return f"Disease search results for '{query}':\n\n{await _render(result)}"
+
+async def _tool_get_gene_info(arguments: Dict[str, Any]) -> str:
+    """Return the full record for one gene."""
+    gene_id = arguments.get("gene_id", "")
+    
+    if not gene_id:
+        return "Error: gene_id parameter is required"
+    
+    result = await agr_client.get_gene_info(gene_id)
+    
+    if "error" in result:
+        return f"Error getting gene info: {result['error']}"
+    return f"Gene information for {gene_id}:\n\n{await _render(result)}"
+
+# Static protocol payloads, built once at import rather than per request
+INITIALIZE_RESULT: Dict[str, Any] = {
+    "protocolVersion": "2024-11-05",
+    "capabilities": {},
+    "serverInfo": {
+        "name": "agr-genomics-minimal",
+        "version": "1.0.0"
+    }
+}
+
+TOOLS_LIST_RESPONSE_RESULT: Dict[str, Any] = {
+    "tools": [
+        {
+            "name": "search_genes",
+            "description": "Search for genes by symbol, name, or identifier",
+            "inputSchema": {
+                "type": "object",
+                "properties": {
+                    "query": {"type": "string", "description": "Gene symbol or name"},
+                    "limit": {"type": "integer", "description": "Max results (default: 10)", "default": 10}
+                },
+                "required": ["query"]
+            }
+        },
+        {
+            "name": "search_diseases",
+            "description": "Search for diseases and conditions",
+            "inputSchema": {
+                "type": "object",
+                "properties": {
+                    "query": {"type": "string", "description": "Disease name or term"},
+                    "limit": {"type": "integer", "description": "Max results (default: 10)", "default": 10}
+                },
+                "required": ["query"]
+            }
+        },
+        {
+            "name": "get_gene_info",
+            "description": "Get detailed information about a gene",
+            "inputSchema": {
+                "type": "object",
+                "properties": {
+                    "gene_id": {"type": "string", "description": "Gene identifier"}
+                },
+                "required": ["gene_id"]
+            }
+        }
+    ]
+}
+
+# The tools/list response never changes, so it is encoded once; only the id
+# is spliced in per request (it directly follows "jsonrpc", so the first match
+# is always the top-level id).
+_TOOLS_LIST_BYTES = _dumpb({"jsonrpc": "2.0", "id": 0, "result": TOOLS_LIST_RESPONSE_RESULT})
+
+def _tools_list_frame(request_id: int) -> bytes:
+    """Encoded tools/list response for ``request_id``."""
+    return _TOOLS_LIST_BYTES.replace(b'"id":0', b'"id":' + str(request_id).encode(), 1)
+
+# Tool name -> handler returning the response text, built once at import
+_TOOL_HANDLERS: Dict[str, Callable[[Dict[str, Any]], Awaitable[str]]] = {
+    "search_genes": _tool_search_genes,
+    "search_diseases": _tool_search_diseases,
+    "get_gene_info": _tool_get_gene_info,
+}
 
 async def handle_jsonrpc_request(request: Dict[str, Any]) -> Dict[str, Any]:
     """Handle JSON-RPC requests directly."""
@@ -73,59 +384,14 @@ async def handle_jsonrpc_request(request: Dict[str, Any]) -> Dict[str, Any]:
             return {
                 "jsonrpc": "2.0",
                 "id": request_id,
-                "result": {
-                    "protocolVersion": "2024-11-05",
-                    "capabilities": {},
-                    "serverInfo": {
-                        "name": "agr-genomics-minimal",
-                        "version": "1.0.0"
-                    }
-                }
+                "result": INITIALIZE_RESULT
             }
             
         elif method == "tools/list":
             return {
                 "jsonrpc": "2.0",
                 "id": request_id,
-                "result": {
-                    "tools": [
-                        {
-                            "name": "search_genes",
-                            "description": "Search for genes by symbol, name, or identifier",
-                            "inputSchema": {
-                                "type": "object",
-                                "properties": {
-                                    "query": {"type": "string", "description": "Gene symbol or name"},
-                                    "limit": {"type": "integer", "description": "Max results (default: 10)", "default": 10}
-                                },
-                                "required": ["query"]
-                            }
-                        },
-                        {
-                            "name": "search_diseases",
-                            "description": "Search for diseases and conditions",
-                            "inputSchema": {
-                                "type": "object",
-                                "properties": {
-                                    "query": {"type": "string", "description": "Disease name or term"},
-                                    "limit": {"type": "integer", "description": "Max results (default: 10)", "default": 10}
-                                },
-                                "required": ["query"]
-                            }
-                        },
-                        {
-                            "name": "get_gene_info",
-                            "description": "Get detailed information about a gene",
-                            "inputSchema": {
-                                "type": "object",
-                                "properties": {
-                                    "gene_id": {"type": "string", "description": "Gene identifier"}
-                                },
-                                "required": ["gene_id"]
-                            }
-                        }
-                    ]
-                }
+                "result": TOOLS_LIST_RESPONSE_RESULT
             }
             
         elif method == "tools/call":
@@ -134,66 +400,9 @@ async def handle_jsonrpc_request(request: Dict[str, Any]) -> Dict[str, Any]:
             
             logger.info(f"Tool call: {tool_name} with args: {arguments}")
             
-            result_text = ""
-            
-            if tool_name == "search_genes":
-                query = arguments.get("query", "")
-                limit = arguments.get("limit", 10)
-                
-                if not query:
-                    result_text = "Error: query parameter is required"
-                else:
-                    result = await agr_client.search_genes(query, limit)
-                    
-                    if "error" in result:
-                        result_text = f"Error searching genes: {result['error']}"
-                    else:
-                        if "results" in result and isinstance(result["results"], list):
-                            genes = result["results"][:limit]
-                            if genes:
-                                formatted_genes = []
-                                for gene in genes:
-                                    gene_info = {
-                                        "symbol": gene.get("symbol", "Unknown"),
-                                        "name": gene.get("name", ""),
-                                        "species": gene.get("species", {}).get("name", ""),
-                                        "id": gene.get("id", "")
-                                    }
-                                    formatted_genes.append(gene_info)
-                                
-                                result_text = f"Found {len(formatted_genes)} genes for '{query}':\n\n"
-                                result_text += json.dumps(formatted_genes, indent=2)
-                            else:
-                                result_text = f"No genes found for '{query}'"
-                        else:
-                            result_text = f"Gene search results for '{query}':\n\n{json.dumps(result, indent=2)}"
-                            
-            elif tool_name == "search_diseases":
-                query = arguments.get("query", "")
-                limit = arguments.get("limit", 10)
-                
-                if not query:
-                    result_text = "Error: query parameter is required"
-                else:
-                    result = await agr_client.search_diseases(query, limit)
-                    
-                    if "error" in result:
-                        result_text = f"Error searching diseases: {result['error']}"
-                    else:
-                        result_text = f"Disease search results for '{query}':\n\n{json.dumps(result, indent=2)}"
-                        
-            elif tool_name == "get_gene_info":
-                gene_id = arguments.get("gene_id", "")
-                
-                if not gene_id:
-                    result_text = "Error: gene_id parameter is required"
-                else:
-                    result = await agr_client.get_gene_info(gene_id)
-                    
-                    if "error" in result:
-                        result_text = f"Error getting gene info: {result['error']}"
-                    else:
-                        result_text = f"Gene information for {gene_id}:\n\n{json.dumps(result, indent=2)}"
+            handler = _TOOL_HANDLERS.get(tool_name)
+            if handler is not None:
+                result_text = await handler(arguments)
             else:
                 result_text = f"Unknown tool: {tool_name}"
             
@@ -238,51 +447,102 @@ async def handle_jsonrpc_request(request: Dict[str, Any]) -> Dict[str, Any]:
             }
         }
 
+def _is_pipe(fd: int) -> bool:
+    """Whether asyncio's pipe transports accept ``fd``: a pipe or socket, not a file or tty."""
+    mode = os.fstat(fd).st_mode
+    return stat.S_ISFIFO(mode) or stat.S_ISSOCK(mode)
+
+class _FileWriter:
+    """Blocking stand-in for StreamWriter when stdout is a regular file or tty."""
+
+    def __init__(self, stream):
+        self._stream = stream
+
+    def write(self, data: bytes) -> None:
+        self._stream.write(data)
+
+    async def drain(self) -> None:
+        self._stream.flush()
+
+async def process_line(line: bytes, stdout: Union[asyncio.StreamWriter, _FileWriter],
+                       write_lock: asyncio.Lock):
+    """Handle one JSON-RPC line and write its response as a single frame."""
+    try:
+        logger.info(f"Received: {line.decode(errors='replace')}")
+        
+        # Parse JSON-RPC request
+        try:
+            request = _loads(line)
+        except json.JSONDecodeError as e:
+            logger.error(f"JSON decode error: {e}")
+            response = {
+                "jsonrpc": "2.0",
+                "id": None,
+                "error": {
+                    "code": -32700,
+                    "message": "Parse error"
+                }
+            }
+        else:
+            request_id = request.get("id") if isinstance(request, dict) else None
+            # Integer ids (the common case) get the pre-encoded tools/list frame
+            if type(request_id) is int and request.get("method") == "tools/list":
+                response = _tools_list_frame(request_id)
+            else:
+                # Handle the request
+                response = await handle_jsonrpc_request(request)
+        
+        # Send response if not None; the lock keeps concurrent frames whole
+        if response is not None:
+            frame = response if isinstance(response, bytes) else _dumpb(response)
+            async with write_lock:
+                stdout.write(frame + b"\n")
+                await stdout.drain()
+            logger.info(f"Sent: {frame.decode()}")
+            
+    except Exception as e:
+        logger.error(f"Error processing request: {e}")
+        logger.error(f"Traceback: {traceback.format_exc()}")
+
 async def main():
     """Main function - handle stdio JSON-RPC directly."""
+    pending: set = set()
     try:
         logger.info("Starting AGR MCP Server (Minimal Version)...")
+        await agr_client.startup()
+        
+        # Non-blocking stdio; each request runs as its own task, so pipelined
+        # requests are handled concurrently and may be answered out of order.
+        # Pipe transports refuse regular files, which are read in a worker
+        # thread and written with blocking calls instead.
+        loop = asyncio.get_running_loop()
+        if _is_pipe(sys.stdin.fileno()):
+            reader = asyncio.StreamReader(limit=2 ** 20)
+            await loop.connect_read_pipe(lambda: asyncio.StreamReaderProtocol(reader), sys.stdin)
+            readline = reader.readline
+        else:
+            readline = functools.partial(loop.run_in_executor, None, sys.stdin.buffer.readline)
+        if _is_pipe(sys.stdout.fileno()):
+            transport, protocol = await loop.connect_write_pipe(
+                asyncio.streams.FlowControlMixin, sys.stdout
+            )
+            stdout = asyncio.StreamWriter(transport, protocol, None, loop)
+        else:
+            stdout = _FileWriter(sys.stdout.buffer)
+        write_lock = asyncio.Lock()
         
         while True:
-            try:
-                # Read from stdin
-                line = await asyncio.get_event_loop().run_in_executor(None, sys.stdin.readline)
-                if not line:
-                    break
-                    
-                line = line.strip()
-                if not line:
-                    continue
-                
-                logger.info(f"Received: {line}")
-                
-                # Parse JSON-RPC request
-                request = json.loads(line)
-                
-                # Handle the request
-                response = await handle_jsonrpc_request(request)
+            line = await readline()
+            if not line:
+                break
                 
-                # Send response if not None
-                if response is not None:
-                    response_line = json.dumps(response)
-                    print(response_line, flush=True)
-                    logger.info(f"Sent: {response_line}")
-                    
-            except json.JSONDecodeError as e:
-                logger.error(f"JSON decode error: {e}")
-                error_response = {
-                    "jsonrpc": "2.0",
-                    "id": None,
-                    "error": {
-                        "code": -32700,
-                        "message": "Parse error"
-                    }
-                }
-                print(json.dumps(error_response), flush=True)
-                
-            except Exception as e:
-                logger.error(f"Error in main loop: {e}")
-                logger.error(f"Traceback: {traceback.format_exc()}")
+            line = line.strip()
+            if not line:
+                continue
+            
+            task = asyncio.create_task(process_line(line, stdout, write_lock))
+            pending.add(task)
+            task.add_done_callback(pending.discard)
                 
     except KeyboardInterrupt:
         logger.info("Server stopped")
@@ -290,6 +550,10 @@ async def main():
         logger.error(f"Server error: {e}")
         logger.error(f"Traceback: {traceback.format_exc()}")
         sys.exit(1)
+    finally:
+        if pending:
+            await asyncio.gather(*pending, return_exceptions=True)
+        await agr_client.aclose()
 
 if __name__ == "__main__":
     asyncio.run(main())
\ No newline at end of file
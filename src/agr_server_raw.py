@@ -6,12 +6,67 @@ This completely bypasses the MCP Python library to avoid all Pydantic issues.
 """
 
 import asyncio
+import functools
 import json
 import logging
+import os
+import stat
 import sys
-from typing import Any, Dict, Optional
+import time
+from collections import OrderedDict
+from typing import TYPE_CHECKING, Any, Awaitable, Callable, Dict, Optional, Tuple, Union
 
-import httpx
+if TYPE_CHECKING:
+    import httpx
+
+# Upstream JSON is forwarded as-is unless AGR_MCP_PRETTY=1 asks for indentation.
+_PRETTY = os.environ.get("AGR_MCP_PRETTY") == "1"
+
+try:
+    import orjson
+
+    _loads = orjson.loads
+
+    def _dumpb(obj: Any) -> bytes:
+        """Serialize to compact UTF-8 JSON bytes."""
+        return orjson.dumps(obj)
+
+    def _dumpb_line(obj: Any) -> bytes:
+        """Compact JSON bytes with the newline frame terminator appended."""
+        return orjson.dumps(obj, option=orjson.OPT_APPEND_NEWLINE)
+
+    def _pretty(obj: Any) -> str:
+        """Indented JSON text for embedding in tool results."""
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2).decode()
+except ImportError:
+    _loads = json.loads
+
+    def _dumpb(obj: Any) -> bytes:
+        """Serialize to compact UTF-8 JSON bytes."""
+        return json.dumps(obj, separators=(",", ":")).encode()
+
+    def _dumpb_line(obj: Any) -> bytes:
+        """Compact JSON bytes with the newline frame terminator appended."""
+        return (json.dumps(obj, separators=(",", ":")) + "\n").encode()
+
+    def _pretty(obj: Any) -> str:
+        """Indented JSON text for embedding in tool results."""
+        return json.dumps(obj, indent=2)
+
+def _passthrough(text: str) -> str:
+    """Upstream JSON text as tool output, re-encoded only when pretty output is on."""
+    return _pretty(_loads(text)) if _PRETTY else text
+
+try:
+    import msgspec
+except ImportError:
+    msgspec = None
+
+try:
+    import h2  # noqa: F401  (httpx needs it for http2=True)
+    _HTTP2 = True
+except ImportError:
+    _HTTP2 = False
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
@@ -21,165 +76,323 @@ class AGRClient:
     def __init__(self):
         self.base_url = "https://www.alliancegenome.org/api"
         self.timeout = 15.0
+        self._client: Optional["httpx.AsyncClient"] = None
+        # Small TTL LRU of successful responses keyed on (endpoint, sorted params)
+        self._cache: "OrderedDict[tuple, Tuple[float, Union[Dict[str, Any], str]]]" = OrderedDict()
+        self._cache_max = 1024
+        self._cache_ttl = 300.0
+
+    async def startup(self):
+        """Create the shared, pooled HTTP client used by every request."""
+        if self._client is None:
+            # httpx is imported on first use: initialize and tools/list never
+            # need it, and it is the bulk of this script's import time.
+            import httpx
+            
+            self._client = httpx.AsyncClient(
+                base_url=self.base_url,
+                timeout=self.timeout,
+                http2=_HTTP2,
+                limits=httpx.Limits(max_connections=100, max_keepalive_connections=20)
+            )
+
+    async def aclose(self):
+        """Close the shared HTTP client and its pooled connections."""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
+    def _cache_get(self, key: tuple) -> Optional[Union[Dict[str, Any], str]]:
+        """Return a fresh cached response, dropping it once its TTL has passed."""
+        entry = self._cache.get(key)
+        if entry is None:
+            return None
+        if time.monotonic() - entry[0] >= self._cache_ttl:
+            del self._cache[key]
+            return None
+        self._cache.move_to_end(key)
+        return entry[1]
+
+    def _cache_put(self, key: tuple, result: Union[Dict[str, Any], str]):
+        self._cache[key] = (time.monotonic(), result)
+        if len(self._cache) > self._cache_max:
+            self._cache.popitem(last=False)
+
+    async def _make_request(self, endpoint: str, params: Optional[Dict] = None,
+                            raw: bool = False) -> Union[Dict[str, Any], str]:
+        # With raw, a successful body is returned as text without parsing it;
+        # failures are still error dicts.
+        key = (endpoint, tuple(sorted((params or {}).items())), raw)
+        cached = self._cache_get(key)
+        if cached is not None:
+            return cached
         
-    async def _make_request(self, endpoint: str, params: Optional[Dict] = None) -> Dict[str, Any]:
-        url = f"{self.base_url}/{endpoint.lstrip('/')}"
+        if self._client is None:
+            await self.startup()
         try:
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
-                response = await client.get(url, params=params or {})
-                if response.status_code == 200:
-                    return response.json()
-                else:
-                    return {"error": f"HTTP {response.status_code}"}
+            response = await self._client.get(endpoint.lstrip('/'), params=params or {})
+            if response.status_code == 200:
+                result = response.content.decode() if raw else response.json()
+                self._cache_put(key, result)
+                return result
+            else:
+                return {"error": f"HTTP {response.status_code}"}
         except Exception as e:
             return {"error": str(e)}
 
-    async def search_genes(self, query: str, limit: int = 10) -> Dict[str, Any]:
+    async def search_genes(self, query: str, limit: int = 10,
+                           raw: bool = False) -> Union[Dict[str, Any], str]:
         params = {"q": query, "category": "gene", "limit": limit}
-        return await self._make_request("/search", params)
+        return await self._make_request("/search", params, raw)
 
-    async def search_diseases(self, query: str, limit: int = 10) -> Dict[str, Any]:
+    async def search_diseases(self, query: str, limit: int = 10,
+                              raw: bool = False) -> Union[Dict[str, Any], str]:
         params = {"q": query, "category": "disease", "limit": limit}
-        return await self._make_request("/search", params)
+        return await self._make_request("/search", params, raw)
 
-    async def get_gene_info(self, gene_id: str) -> Dict[str, Any]:
-        return await self._make_request(f"/gene/{gene_id}")
+    async def get_gene_info(self, gene_id: str, raw: bool = False) -> Union[Dict[str, Any], str]:
+        return await self._make_request(f"/gene/{gene_id}", raw=raw)
 
 agr_client = AGRClient()
 
-async def handle_request(request: Dict[str, Any]) -> Optional[Dict[str, Any]]:
-    method = request.get("method")
-    request_id = request.get("id")
-    params = request.get("params", {})
-    
-    if method == "initialize":
-        return {
-            "jsonrpc": "2.0",
-            "id": request_id,
-            "result": {
-                "protocolVersion": "2024-11-05",
-                "capabilities": {},
-                "serverInfo": {"name": "agr-genomics-raw", "version": "1.0.0"}
+INITIALIZE_RESULT = {
+    "protocolVersion": "2024-11-05",
+    "capabilities": {},
+    "serverInfo": {"name": "agr-genomics-raw", "version": "1.0.0"}
+}
+
+TOOLS_LIST_RESULT = {
+    "tools": [
+        {
+            "name": "search_genes",
+            "description": "Search for genes",
+            "inputSchema": {
+                "type": "object",
+                "properties": {
+                    "query": {"type": "string"},
+                    "limit": {"type": "integer", "default": 10}
+                },
+                "required": ["query"]
             }
-        }
-    
-    elif method == "tools/list":
-        return {
-            "jsonrpc": "2.0",
-            "id": request_id,
-            "result": {
-                "tools": [
-                    {
-                        "name": "search_genes",
-                        "description": "Search for genes",
-                        "inputSchema": {
-                            "type": "object",
-                            "properties": {
-                                "query": {"type": "string"},
-                                "limit": {"type": "integer", "default": 10}
-                            },
-                            "required": ["query"]
-                        }
-                    },
-                    {
-                        "name": "search_diseases", 
-                        "description": "Search for diseases",
-                        "inputSchema": {
-                            "type": "object",
-                            "properties": {
-                                "query": {"type": "string"},
-                                "limit": {"type": "integer", "default": 10}
-                            },
-                            "required": ["query"]
-                        }
-                    },
-                    {
-                        "name": "get_gene_info",
-                        "description": "Get gene information",
-                        "inputSchema": {
-                            "type": "object", 
-                            "properties": {
-                                "gene_id": {"type": "string"}
-                            },
-                            "required": ["gene_id"]
-                        }
-                    }
-                ]
+        },
+        {
+            "name": "search_diseases", 
+            "description": "Search for diseases",
+            "inputSchema": {
+                "type": "object",
+                "properties": {
+                    "query": {"type": "string"},
+                    "limit": {"type": "integer", "default": 10}
+                },
+                "required": ["query"]
             }
-        }
-    
-    elif method == "tools/call":
-        tool_name = params.get("name")
-        arguments = params.get("arguments", {})
-        
-        result_text = ""
-        
-        if tool_name == "search_genes":
-            query = arguments.get("query", "")
-            limit = arguments.get("limit", 10)
-            
-            if not query:
-                result_text = "Error: query required"
-            else:
-                result = await agr_client.search_genes(query, limit)
-                if "error" in result:
-                    result_text = f"Error: {result['error']}"
-                else:
-                    result_text = f"Gene search results:\n{json.dumps(result, indent=2)}"
-        
-        elif tool_name == "search_diseases":
-            query = arguments.get("query", "")
-            limit = arguments.get("limit", 10)
-            
-            if not query:
-                result_text = "Error: query required"
-            else:
-                result = await agr_client.search_diseases(query, limit)
-                if "error" in result:
-                    result_text = f"Error: {result['error']}"
-                else:
-                    result_text = f"Disease search results:\n{json.dumps(result, indent=2)}"
-        
-        elif tool_name == "get_gene_info":
-            gene_id = arguments.get("gene_id", "")
-            
-            if not gene_id:
-                result_text = "Error: gene_id required"
-            else:
-                result = await agr_client.get_gene_info(gene_id)
-                if "error" in result:
-                    result_text = f"Error: {result['error']}"
-                else:
-                    result_text = f"Gene info:\n{json.dumps(result, indent=2)}"
-        
-        else:
-            result_text = f"Unknown tool: {tool_name}"
-        
-        return {
-            "jsonrpc": "2.0",
-            "id": request_id,
-            "result": {
-                "content": [{"type": "text", "text": result_text}],
-                "isError": False
+        },
+        {
+            "name": "get_gene_info",
+            "description": "Get gene information",
+            "inputSchema": {
+                "type": "object", 
+                "properties": {
+                    "gene_id": {"type": "string"}
+                },
+                "required": ["gene_id"]
             }
         }
+    ]
+}
+
+# Static results are encoded once at import; only the id is spliced in per request
+_INITIALIZE_BYTES = _dumpb(INITIALIZE_RESULT)
+_TOOLS_LIST_BYTES = _dumpb(TOOLS_LIST_RESULT)
+
+def _static_frame(request_id: Any, result: bytes) -> bytes:
+    """Newline-terminated JSON-RPC frame wrapping a pre-encoded ``result``."""
+    return b'{"jsonrpc":"2.0","id":' + _dumpb(request_id) + b',"result":' + result + b'}\n'
+
+async def _tool_search_genes(arguments: Dict[str, Any]) -> str:
+    query = arguments.get("query", "")
+    limit = arguments.get("limit", 10)
     
-    elif method == "notifications/initialized":
-        return None
+    if not query:
+        return "Error: query required"
+    result = await agr_client.search_genes(query, limit, raw=True)
+    if isinstance(result, dict):
+        return f"Error: {result['error']}"
+    return f"Gene search results:\n{_passthrough(result)}"
+
+async def _tool_search_diseases(arguments: Dict[str, Any]) -> str:
+    query = arguments.get("query", "")
+    limit = arguments.get("limit", 10)
+    
+    if not query:
+        return "Error: query required"
+    result = await agr_client.search_diseases(query, limit, raw=True)
+    if isinstance(result, dict):
+        return f"Error: {result['error']}"
+    return f"Disease search results:\n{_passthrough(result)}"
+
+async def _tool_get_gene_info(arguments: Dict[str, Any]) -> str:
+    gene_id = arguments.get("gene_id", "")
+    
+    if not gene_id:
+        return "Error: gene_id required"
+    result = await agr_client.get_gene_info(gene_id, raw=True)
+    if isinstance(result, dict):
+        return f"Error: {result['error']}"
+    return f"Gene info:\n{_passthrough(result)}"
+
+# Tool name -> handler returning the response text
+_TOOL_HANDLERS: Dict[str, Callable[[Dict[str, Any]], Awaitable[str]]] = {
+    "search_genes": _tool_search_genes,
+    "search_diseases": _tool_search_diseases,
+    "get_gene_info": _tool_get_gene_info,
+}
+
+# Argument shapes compiled once at import and checked before dispatch, so a
+# missing or mistyped argument is reported by name.
+if msgspec is not None:
+    class GeneIdParams(msgspec.Struct):
+        gene_id: str
+
+    class SearchParams(msgspec.Struct):
+        query: str
+        # JSON Schema's "integer" admits integral floats such as 3.0 (not bools
+        # or strings), so those are accepted here and normalized to int
+        limit: Union[int, float] = 10
+
+        def __post_init__(self):
+            if isinstance(self.limit, float):
+                if not self.limit.is_integer():
+                    raise ValueError("Expected `int`, got `float` - at `$.limit`")
+                self.limit = int(self.limit)
+
+    _PARAM_TYPES: Dict[str, type] = {
+        "search_genes": SearchParams,
+        "search_diseases": SearchParams,
+        "get_gene_info": GeneIdParams,
+    }
+else:
+    _PARAM_TYPES = {}
+
+def _checked_arguments(arguments: Any, param_type: Optional[type]) -> Tuple[Any, Optional[str]]:
+    """``arguments`` normalized to ``param_type``, plus why they don't fit it (None when they do)."""
+    if param_type is None:
+        return arguments, None
+    try:
+        params = msgspec.convert(arguments, param_type)
+    except msgspec.ValidationError as e:
+        return arguments, str(e)
+    return msgspec.structs.asdict(params), None
+
+async def _handle_initialize(request_id: Any, params: Dict[str, Any]) -> bytes:
+    return _static_frame(request_id, _INITIALIZE_BYTES)
+
+async def _handle_list_tools(request_id: Any, params: Dict[str, Any]) -> bytes:
+    return _static_frame(request_id, _TOOLS_LIST_BYTES)
+
+async def _handle_call_tool(request_id: Any, params: Dict[str, Any]) -> Dict[str, Any]:
+    tool_name = params.get("name")
+    arguments = params.get("arguments", {})
     
+    handler = _TOOL_HANDLERS.get(tool_name)
+    if handler is None:
+        result_text = f"Unknown tool: {tool_name}"
     else:
+        arguments, error = _checked_arguments(arguments, _PARAM_TYPES.get(tool_name))
+        result_text = f"Error: {error}" if error else await handler(arguments)
+    
+    return {
+        "jsonrpc": "2.0",
+        "id": request_id,
+        "result": {
+            "content": [{"type": "text", "text": result_text}],
+            "isError": False
+        }
+    }
+
+async def _handle_notification(request_id: Any, params: Dict[str, Any]) -> None:
+    return None
+
+# JSON-RPC method -> handler; one dict lookup instead of an if/elif chain
+_METHODS: Dict[str, Callable[[Any, Dict[str, Any]], Awaitable[Optional[Union[Dict[str, Any], bytes]]]]] = {
+    "initialize": _handle_initialize,
+    "tools/list": _handle_list_tools,
+    "tools/call": _handle_call_tool,
+    "notifications/initialized": _handle_notification,
+}
+
+async def handle_request(request: Dict[str, Any]) -> Optional[Union[Dict[str, Any], bytes]]:
+    """Return the response as a dict, or as a ready newline-terminated frame."""
+    handler = _METHODS.get(request.get("method"))
+    if handler is None:
         return {
             "jsonrpc": "2.0", 
-            "id": request_id,
+            "id": request.get("id"),
             "error": {"code": -32601, "message": "Method not found"}
         }
+    return await handler(request.get("id"), request.get("params", {}))
+
+# Frames finished in the same event-loop pass are appended to one reused
+# buffer, then written and flushed once; each frame is appended whole, so
+# concurrent tasks never interleave.
+_out = bytearray()
+
+def _is_pipe(fd: int) -> bool:
+    """Whether asyncio's pipe transports accept ``fd``: a pipe or socket, not a file or tty."""
+    mode = os.fstat(fd).st_mode
+    return stat.S_ISFIFO(mode) or stat.S_ISSOCK(mode)
+
+def _flush_frames():
+    if _out:
+        sys.stdout.buffer.write(_out)
+        sys.stdout.buffer.flush()
+        _out.clear()
+
+def _write_frame(response: Union[Dict[str, Any], bytes]):
+    if not _out:
+        asyncio.get_running_loop().call_soon(_flush_frames)
+    _out.extend(response if isinstance(response, bytes) else _dumpb_line(response))
+
+async def _process(line: bytes):
+    try:
+        request = _loads(line)
+    except json.JSONDecodeError:
+        _write_frame({
+            "jsonrpc": "2.0",
+            "id": None,
+            "error": {"code": -32700, "message": "Parse error"}
+        })
+        return
+    try:
+        response = await handle_request(request)
+        if response:
+            _write_frame(response)
+    except Exception as e:
+        logger.error(f"Error: {e}")
 
 async def main():
     logger.info("Starting AGR Raw MCP Server...")
     
-    while True:
-        try:
-            line = await asyncio.get_event_loop().run_in_executor(None, sys.stdin.readline)
+    # Read stdin through the event loop rather than a thread-pool readline,
+    # except for regular files, which pipe transports refuse
+    loop = asyncio.get_running_loop()
+    if _is_pipe(sys.stdin.fileno()):
+        reader = asyncio.StreamReader(limit=2 ** 20)
+        await loop.connect_read_pipe(lambda: asyncio.StreamReaderProtocol(reader), sys.stdin)
+        readline = reader.readline
+    else:
+        readline = functools.partial(loop.run_in_executor, None, sys.stdin.buffer.readline)
+    
+    # Each line runs as its own task so slow AGR calls don't block later requests;
+    # responses carry their id and may be written out of order.
+    pending: set = set()
+    try:
+        while True:
+            try:
+                line = await readline()
+            except Exception as e:
+                logger.error(f"Error: {e}")
+                break
             if not line:
                 break
             
@@ -187,21 +400,14 @@ async def main():
             if not line:
                 continue
             
-            request = json.loads(line)
-            response = await handle_request(request)
-            
-            if response:
-                print(json.dumps(response), flush=True)
-                
-        except json.JSONDecodeError:
-            error_response = {
-                "jsonrpc": "2.0",
-                "id": None,
-                "error": {"code": -32700, "message": "Parse error"}
-            }
-            print(json.dumps(error_response), flush=True)
-        except Exception as e:
-            logger.error(f"Error: {e}")
+            task = asyncio.create_task(_process(line))
+            pending.add(task)
+            task.add_done_callback(pending.discard)
+    finally:
+        if pending:
+            await asyncio.gather(*pending, return_exceptions=True)
+        _flush_frames()
+        await agr_client.aclose()
 
 if __name__ == "__main__":
     asyncio.run(main())
\ No newline at end of file
@@ -7,11 +7,15 @@ instead of relying on MCP model objects that get incorrectly serialized as tuple
 """
 
 import asyncio
+import inspect
 import json
 import logging
+import os
 import sys
+import time
 import traceback
-from typing import Any, Dict, List, Optional
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple, Union
 
 import httpx
 from mcp.server import Server
@@ -24,40 +28,123 @@ from mcp.types import (
     Tool,
 )
 
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
+try:
+    import msgspec
+except ImportError:
+    msgspec = None
+
+try:
+    import h2  # noqa: F401  (httpx needs it for http2=True)
+    _HTTP2 = True
+except ImportError:
+    _HTTP2 = False
+
+# Upstream JSON is forwarded as-is unless AGR_MCP_PRETTY=1 asks for indentation.
+_PRETTY = os.environ.get("AGR_MCP_PRETTY") == "1"
+
+def _passthrough(text: str) -> str:
+    """Upstream JSON text as tool output, re-encoded only when pretty output is on."""
+    return json.dumps(json.loads(text), indent=2) if _PRETTY else text
+
 # Configure logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
+def _search_hits(body: Any, limit: int) -> Any:
+    """The first ``limit`` records of a search body's results list, else the body itself."""
+    if isinstance(body, dict) and "error" not in body and isinstance(body.get("results"), list):
+        return body["results"][:limit]
+    return body
+
 class AGRClient:
     """Simplified and robust client for Alliance of Genome Resources APIs."""
     
     def __init__(self):
         self.base_url = "https://www.alliancegenome.org/api"
         self.timeout = 15.0
+        self._client: Optional[httpx.AsyncClient] = None
+        # Small TTL LRU of successful responses keyed on (endpoint, sorted params)
+        self._cache: "OrderedDict[tuple, Tuple[float, Union[Dict[str, Any], List[Dict[str, Any]], str]]]" = OrderedDict()
+        self._cache_max = 1024
+        self._cache_ttl = 300.0
+
+    async def startup(self):
+        """Create the shared, pooled HTTP client used by every request."""
+        if self._client is None:
+            self._client = httpx.AsyncClient(
+                base_url=self.base_url,
+                timeout=self.timeout,
+                http2=_HTTP2,
+                limits=httpx.Limits(max_connections=100, max_keepalive_connections=20)
+            )
+
+    async def aclose(self):
+        """Close the shared HTTP client and its pooled connections."""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
+    def _cache_get(self, key: tuple) -> Optional[Union[Dict[str, Any], List[Dict[str, Any]], str]]:
+        """Return a fresh cached response, dropping it once its TTL has passed."""
+        entry = self._cache.get(key)
+        if entry is None:
+            return None
+        if time.monotonic() - entry[0] >= self._cache_ttl:
+            del self._cache[key]
+            return None
+        self._cache.move_to_end(key)
+        return entry[1]
+
+    def _cache_put(self, key: tuple, result: Union[Dict[str, Any], List[Dict[str, Any]], str]):
+        self._cache[key] = (time.monotonic(), result)
+        if len(self._cache) > self._cache_max:
+            self._cache.popitem(last=False)
+
+    async def _make_request(self, endpoint: str, params: Optional[Dict] = None,
+                            raw: bool = False) -> Union[Dict[str, Any], str]:
+        """Make HTTP request to AGR API with proper error handling.
+
+        With ``raw`` a successful body is returned as unparsed text; failures
+        are always error dicts.
+        """
+        key = (endpoint, tuple(sorted((params or {}).items())), raw)
+        cached = self._cache_get(key)
+        if cached is not None:
+            return cached
+        
+        if self._client is None:
+            await self.startup()
         
-    async def _make_request(self, endpoint: str, params: Optional[Dict] = None) -> Dict[str, Any]:
-        """Make HTTP request to AGR API with proper error handling."""
-        url = f"{self.base_url}/{endpoint.lstrip('/')}"
+        path = endpoint.lstrip('/')
         
         try:
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
-                logger.info(f"Making request to: {url} with params: {params}")
-                response = await client.get(url, params=params or {})
-                
-                logger.info(f"Response status: {response.status_code}")
+            logger.info(f"Making request to: {self.base_url}/{path} with params: {params}")
+            response = await self._client.get(path, params=params or {})
+            
+            logger.info(f"Response status: {response.status_code}")
+            
+            if response.status_code == 200:
+                if raw:
+                    result = response.content.decode()
+                    self._cache_put(key, result)
+                    return result
+                try:
+                    result = response.json()
+                    logger.info(f"Successfully parsed JSON response")
+                    self._cache_put(key, result)
+                    return result
+                except json.JSONDecodeError as e:
+                    logger.error(f"JSON decode error: {e}")
+                    return {"error": f"Invalid JSON response: {str(e)}"}
+            else:
+                logger.error(f"HTTP error: {response.status_code}")
+                return {"error": f"HTTP {response.status_code}: {response.text[:200]}"}
                 
-                if response.status_code == 200:
-                    try:
-                        result = response.json()
-                        logger.info(f"Successfully parsed JSON response")
-                        return result
-                    except json.JSONDecodeError as e:
-                        logger.error(f"JSON decode error: {e}")
-                        return {"error": f"Invalid JSON response: {str(e)}"}
-                else:
-                    logger.error(f"HTTP error: {response.status_code}")
-                    return {"error": f"HTTP {response.status_code}: {response.text[:200]}"}
-                    
         except httpx.TimeoutException:
             logger.error("Request timeout")
             return {"error": "Request timeout"}
@@ -73,14 +160,90 @@ class AGRClient:
         params = {"q": query, "category": "gene", "limit": limit}
         return await self._make_request("/search", params)
 
-    async def search_diseases(self, query: str, limit: int = 10) -> Dict[str, Any]:
+    async def search_gene_results(self, query: str, limit: int = 10) -> Any:
+        """First ``limit`` gene search records, or the parsed body when it has no results list.
+
+        Error dicts come back as the body. The body is parsed incrementally with
+        ijson and the stream is closed as soon as ``limit`` records have arrived.
+        Without ijson this falls back to a regular request.
+        """
+        params = {"q": query, "category": "gene", "limit": limit}
+        key = ("/search", tuple(sorted(params.items())), "results.item")
+        cached = self._cache_get(key)
+        if cached is not None:
+            return cached
+        
+        if ijson is None:
+            return _search_hits(await self._make_request("/search", params), limit)
+        
+        if self._client is None:
+            await self.startup()
+        
+        items: List[Dict[str, Any]] = []
+        events = ijson.sendable_list()
+        # use_float keeps numbers json.dumps-able instead of Decimal
+        parser = ijson.items_coro(events, "results.item", use_float=True)
+        # Held until the first record arrives, for a body without results.item
+        body: Optional[bytearray] = bytearray()
+        
+        try:
+            logger.info(f"Streaming request to: {self.base_url}/search with params: {params}")
+            async with self._client.stream("GET", "search", params=params) as response:
+                logger.info(f"Response status: {response.status_code}")
+                
+                if response.status_code != 200:
+                    await response.aread()
+                    logger.error(f"HTTP error: {response.status_code}")
+                    return {"error": f"HTTP {response.status_code}: {response.text[:200]}"}
+                
+                async for chunk in response.aiter_bytes(65536):
+                    if body is not None:
+                        body.extend(chunk)
+                    parser.send(chunk)
+                    if events:
+                        body = None
+                    items.extend(events)
+                    del events[:]
+                    if 0 < limit <= len(items):
+                        # Leaving the block closes the stream; the rest is never read
+                        break
+                else:
+                    parser.close()
+                    items.extend(events)
+                    # Only a body read to the end is parsed as a whole
+                    if not items and body is not None:
+                        result = _search_hits(json.loads(body), limit)
+                        if isinstance(result, dict) and "error" in result:
+                            return result
+                        self._cache_put(key, result)
+                        return result
+                    
+        except httpx.TimeoutException:
+            logger.error("Request timeout")
+            return {"error": "Request timeout"}
+        except httpx.RequestError as e:
+            logger.error(f"Request error: {e}")
+            return {"error": f"Request error: {str(e)}"}
+        except (ijson.JSONError, json.JSONDecodeError) as e:
+            logger.error(f"JSON decode error: {e}")
+            return {"error": f"Invalid JSON response: {str(e)}"}
+        except Exception as e:
+            logger.error(f"Unexpected error: {e}")
+            return {"error": f"Unexpected error: {str(e)}"}
+        
+        items = items[:limit]
+        self._cache_put(key, items)
+        return items
+
+    async def search_diseases(self, query: str, limit: int = 10,
+                              raw: bool = False) -> Union[Dict[str, Any], str]:
         """Search for diseases."""
         params = {"q": query, "category": "disease", "limit": limit}
-        return await self._make_request("/search", params)
+        return await self._make_request("/search", params, raw)
 
-    async def get_gene_info(self, gene_id: str) -> Dict[str, Any]:
+    async def get_gene_info(self, gene_id: str, raw: bool = False) -> Union[Dict[str, Any], str]:
         """Get gene information."""
-        return await self._make_request(f"/gene/{gene_id}")
+        return await self._make_request(f"/gene/{gene_id}", raw=raw)
 
 # Initialize client
 agr_client = AGRClient()
@@ -179,80 +342,120 @@ def create_safe_response(text: str) -> CallToolResult:
                 isError=True
             )
 
-@server.call_tool()
+async def _tool_search_genes(arguments: Dict[str, Any]) -> str:
+    query = arguments.get("query", "")
+    limit = arguments.get("limit", 10)
+    
+    if not query:
+        return "Error: query parameter is required"
+    
+    genes = await agr_client.search_gene_results(query, limit)
+    
+    if not isinstance(genes, list):
+        if "error" in genes:
+            return f"Error searching genes: {genes['error']}"
+        return f"Gene search results for '{query}':\n\n{json.dumps(genes, indent=2)}"
+    if not genes:
+        return f"No genes found for '{query}'"
+    
+    # Format the response nicely
+    formatted_genes = [
+        {
+            "symbol": gene.get("symbol", "Unknown"),
+            "name": gene.get("name", ""),
+            "species": gene.get("species", {}).get("name", ""),
+            "id": gene.get("id", "")
+        }
+        for gene in genes
+    ]
+    
+    response_text = f"Found {len(formatted_genes)} genes for '{query}':\n\n"
+    return response_text + json.dumps(formatted_genes, indent=2)
+
+async def _tool_search_diseases(arguments: Dict[str, Any]) -> str:
+    query = arguments.get("query", "")
+    limit = arguments.get("limit", 10)
+    
+    if not query:
+        return "Error: query parameter is required"
+    
+    result = await agr_client.search_diseases(query, limit, raw=True)
+    
+    if isinstance(result, dict):
+        return f"Error searching diseases: {result['error']}"
+    return f"Disease search results for '{query}':\n\n{_passthrough(result)}"
+
+async def _tool_get_gene_info(arguments: Dict[str, Any]) -> str:
+    gene_id = arguments.get("gene_id", "")
+    
+    if not gene_id:
+        return "Error: gene_id parameter is required"
+    
+    result = await agr_client.get_gene_info(gene_id, raw=True)
+    
+    if isinstance(result, dict):
+        return f"Error getting gene info: {result['error']}"
+    return f"Gene information for {gene_id}:\n\n{_passthrough(result)}"
+
+# Tool name -> handler returning the response text; one dict lookup per call
+_TOOL_HANDLERS: Dict[str, Callable[[Dict[str, Any]], Awaitable[str]]] = {
+    "search_genes": _tool_search_genes,
+    "search_diseases": _tool_search_diseases,
+    "get_gene_info": _tool_get_gene_info,
+}
+
+# Argument shapes compiled once at import. When msgspec is available they
+# replace the library's per-call jsonschema walk over each inputSchema.
+if msgspec is not None:
+    class GeneIdParams(msgspec.Struct):
+        gene_id: str
+
+    class SearchParams(msgspec.Struct):
+        query: str
+        # JSON Schema's "integer" admits integral floats such as 3.0 (not bools
+        # or strings), so those are accepted here and normalized to int
+        limit: Union[int, float] = 10
+
+        def __post_init__(self):
+            if isinstance(self.limit, float):
+                if not self.limit.is_integer():
+                    raise ValueError("Expected `int`, got `float` - at `$.limit`")
+                self.limit = int(self.limit)
+
+    _PARAM_TYPES: Dict[str, type] = {
+        "search_genes": SearchParams,
+        "search_diseases": SearchParams,
+        "get_gene_info": GeneIdParams,
+    }
+else:
+    _PARAM_TYPES = {}
+
+# Older mcp releases validate nothing and have no validate_input keyword
+if "validate_input" in inspect.signature(Server.call_tool).parameters:
+    _CALL_TOOL_OPTIONS: Dict[str, Any] = {"validate_input": msgspec is None}
+else:
+    _CALL_TOOL_OPTIONS = {}
+
+@server.call_tool(**_CALL_TOOL_OPTIONS)
 async def call_tool(name: str, arguments: Dict[str, Any]) -> CallToolResult:
     """Handle tool calls."""
     try:
         logger.info(f"Tool called: {name} with arguments: {arguments}")
         
-        if name == "search_genes":
-            query = arguments.get("query", "")
-            limit = arguments.get("limit", 10)
-            
-            if not query:
-                return create_safe_response("Error: query parameter is required")
-            
-            result = await agr_client.search_genes(query, limit)
-            
-            if "error" in result:
-                response_text = f"Error searching genes: {result['error']}"
-            else:
-                # Format the response nicely
-                if "results" in result and isinstance(result["results"], list):
-                    genes = result["results"][:limit]
-                    if genes:
-                        formatted_genes = []
-                        for gene in genes:
-                            gene_info = {
-                                "symbol": gene.get("symbol", "Unknown"),
-                                "name": gene.get("name", ""),
-                                "species": gene.get("species", {}).get("name", ""),
-                                "id": gene.get("id", "")
-                            }
-                            formatted_genes.append(gene_info)
-                        
-                        response_text = f"Found {len(formatted_genes)} genes for '{query}':\n\n"
-                        response_text += json.dumps(formatted_genes, indent=2)
-                    else:
-                        response_text = f"No genes found for '{query}'"
-                else:
-                    response_text = f"Gene search results for '{query}':\n\n{json.dumps(result, indent=2)}"
-            
-            return create_safe_response(response_text)
-            
-        elif name == "search_diseases":
-            query = arguments.get("query", "")
-            limit = arguments.get("limit", 10)
-            
-            if not query:
-                return create_safe_response("Error: query parameter is required")
-            
-            result = await agr_client.search_diseases(query, limit)
-            
-            if "error" in result:
-                response_text = f"Error searching diseases: {result['error']}"
-            else:
-                response_text = f"Disease search results for '{query}':\n\n{json.dumps(result, indent=2)}"
-            
-            return create_safe_response(response_text)
-            
-        elif name == "get_gene_info":
-            gene_id = arguments.get("gene_id", "")
-            
-            if not gene_id:
-                return create_safe_response("Error: gene_id parameter is required")
-            
-            result = await agr_client.get_gene_info(gene_id)
-            
-            if "error" in result:
-                response_text = f"Error getting gene info: {result['error']}"
-            else:
-                response_text = f"Gene information for {gene_id}:\n\n{json.dumps(result, indent=2)}"
-            
-            return create_safe_response(response_text)
-            
-        else:
+        handler = _TOOL_HANDLERS.get(name)
+        if handler is None:
             return create_safe_response(f"Unknown tool: {name}")
+        param_type = _PARAM_TYPES.get(name)
+        if param_type is not None:
+            try:
+                arguments = msgspec.structs.asdict(msgspec.convert(arguments, param_type))
+            except msgspec.ValidationError as e:
+                # Same shape the library returns when it validates the input itself
+                return CallToolResult(
+                    content=[TextContent(type="text", text=f"Input validation error: {e}")],
+                    isError=True
+                )
+        return create_safe_response(await handler(arguments))
             
     except Exception as e:
         logger.error(f"Error in call_tool: {e}")
@@ -282,6 +485,8 @@ async def main():
         logger.error(f"Server startup error: {e}")
         logger.error(f"Traceback: {traceback.format_exc()}")
         sys.exit(1)
+    finally:
+        await agr_client.aclose()
 
 if __name__ == "__main__":
     asyncio.run(main())
\ No newline at end of file
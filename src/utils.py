@@ -1,13 +1,24 @@
 # utils.py
 """Utility functions and enhanced configuration management for AGR MCP Server."""
 
+import atexit
+import functools
 import os
-import yaml
+import queue
 import logging
-from typing import Dict, Any, Optional
+import logging.handlers
+from typing import Dict, Any, List, Optional
 from dataclasses import dataclass
 from pathlib import Path
 
+@functools.lru_cache(maxsize=8)
+def _load_yaml(path: str, mtime: float) -> Dict[str, Any]:
+    """Parse a YAML file once per (path, mtime); an edit to the file invalidates it."""
+    import yaml  # only needed when a config file is actually present
+    
+    with open(path, 'r') as f:
+        return yaml.safe_load(f)
+
 @dataclass
 class AGRConfig:
     """Configuration class for AGR MCP Server."""
@@ -39,8 +50,7 @@ class AGRConfig:
         if not config_file.exists():
             return cls.from_env()
         
-        with open(config_file, 'r') as f:
-            config_data = yaml.safe_load(f)
+        config_data = _load_yaml(str(config_file.resolve()), config_file.stat().st_mtime)
         
         agr_config = config_data.get("agr", {})
         return cls(
@@ -53,38 +63,63 @@ class AGRConfig:
             log_level=config_data.get("logging", {}).get("level", cls.log_level)
         )
 
-def setup_logging(config: AGRConfig):
-    """Setup logging configuration."""
+def setup_logging(config: AGRConfig) -> logging.handlers.QueueListener:
+    """Setup logging configuration.
+
+    Records are queued by the root logger and written by a background
+    listener thread, so logging calls never block on console or file I/O.
+    """
+    formatter = logging.Formatter("%(asctime)s - %(name)s - %(levelname)s - %(message)s")
+    handlers = [
+        logging.StreamHandler(),
+        logging.FileHandler("agr_mcp_server.log")
+    ]
+    for handler in handlers:
+        handler.setFormatter(formatter)
+    
+    log_queue: "queue.SimpleQueue[logging.LogRecord]" = queue.SimpleQueue()
+    queue_handler = logging.handlers.QueueHandler(log_queue)
+    # The listener's handlers do the real formatting; keep the queued message bare
+    queue_handler.setFormatter(logging.Formatter("%(message)s"))
+    listener = logging.handlers.QueueListener(log_queue, *handlers, respect_handler_level=True)
+    listener.start()
+    atexit.register(listener.stop)
+    
     logging.basicConfig(
         level=getattr(logging, config.log_level.upper()),
-        format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
-        handlers=[
-            logging.StreamHandler(),
-            logging.FileHandler("agr_mcp_server.log")
-        ]
+        handlers=[queue_handler]
     )
+    return listener
+
+_GENE_ID_PREFIXES = frozenset({
+    "HGNC", "MGI", "ZFIN", "FB", "WB", "SGD", "RGD",
+    "ENSEMBL", "RefSeq", "UniProt"
+})
 
 def validate_gene_id(gene_id: str) -> bool:
     """Validate gene identifier format."""
-    valid_prefixes = [
-        "HGNC:", "MGI:", "ZFIN:", "FB:", "WB:", "SGD:", "RGD:",
-        "ENSEMBL:", "RefSeq:", "UniProt:"
-    ]
-    return any(gene_id.startswith(prefix) for prefix in valid_prefixes)
+    # One partition and a set lookup instead of a startswith per prefix
+    prefix, sep, _ = gene_id.partition(":")
+    return bool(sep) and prefix in _GENE_ID_PREFIXES
+
+_NUCLEOTIDES = b"ATCGUN"
+_AMINO_ACIDS = b"ACDEFGHIKLMNPQRSTVWY"
 
 def validate_sequence(sequence: str) -> bool:
     """Validate DNA/RNA/protein sequence."""
     # Remove whitespace and convert to uppercase
     clean_seq = sequence.replace(" ", "").replace("\n", "").upper()
+    try:
+        data = clean_seq.encode("ascii")
+    except UnicodeEncodeError:
+        return False
     
-    # Check for valid nucleotide sequence
-    nucleotides = set("ATCGUN")
-    if all(c in nucleotides for c in clean_seq):
+    # Deleting every allowed residue leaves nothing iff the sequence is valid;
+    # bytes.translate does the scan in C rather than a per-character loop.
+    if not data.translate(None, _NUCLEOTIDES):
         return True
     
-    # Check for valid amino acid sequence
-    amino_acids = set("ACDEFGHIKLMNPQRSTVWY")
-    if all(c in amino_acids for c in clean_seq):
+    if not data.translate(None, _AMINO_ACIDS):
         return True
     
     return False
@@ -102,6 +137,22 @@ def format_gene_result(gene_data: Dict[str, Any]) -> Dict[str, Any]:
         "chromosome": gene_data.get("genomeLocations", [{}])[0].get("chromosome", "") if gene_data.get("genomeLocations") else "",
     }
 
+def format_gene_results(genes: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """Format a page of gene search results; same shape as format_gene_result."""
+    return [
+        {
+            "id": g.get("id", ""),
+            "symbol": g.get("symbol", ""),
+            "name": g.get("name", ""),
+            "species": g.get("species", {}).get("name", ""),
+            "description": g.get("automatedGeneSynopsis", ""),
+            "synonyms": g.get("synonyms", []),
+            "gene_type": g.get("soTermName", ""),
+            "chromosome": (g.get("genomeLocations") or ({},))[0].get("chromosome", ""),
+        }
+        for g in genes
+    ]
+
 def format_disease_result(disease_data: Dict[str, Any]) -> Dict[str, Any]:
     """Format disease association result."""
     return {
@@ -112,3 +163,17 @@ def format_disease_result(disease_data: Dict[str, Any]) -> Dict[str, Any]:
         "publications": [pub.get("pubMedId") for pub in disease_data.get("publications", [])],
         "source": disease_data.get("source", {}).get("name", "")
     }
+
+def format_disease_results(diseases: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """Format a page of disease associations; same shape as format_disease_result."""
+    return [
+        {
+            "disease_id": d.get("diseaseId", ""),
+            "disease_name": d.get("diseaseName", ""),
+            "association_type": d.get("associationType", ""),
+            "evidence_codes": d.get("evidenceCodes", []),
+            "publications": [pub.get("pubMedId") for pub in d.get("publications", [])],
+            "source": d.get("source", {}).get("name", "")
+        }
+        for d in diseases
+    ]
@@ -0,0 +1,349 @@
+#!/usr/bin/env python3
+"""
+Behaviour tests for the caching, streaming and stdio paths of the servers
+
+HTTP is served by httpx.MockTransport, so no test touches the network; the
+stdio tests run each raw JSON-RPC server as a subprocess.
+"""
+
+import asyncio
+import json
+import os
+import subprocess
+import sys
+
+import httpx
+
+SRC = os.path.join(os.path.dirname(os.path.abspath(__file__)), "src")
+sys.path.insert(0, SRC)
+
+import agr_server
+import agr_server_basic
+import agr_server_enhanced
+import agr_server_minimal
+import agr_server_working
+
+GENE = {"id": "HGNC:1100", "symbol": "BRCA1", "name": "BRCA1 DNA repair",
+        "species": {"name": "Homo sapiens"}, "soTermName": "protein_coding_gene"}
+
+
+def mock_client(handler, requests, **kwargs):
+    """AsyncClient whose requests are answered by ``handler`` and recorded in ``requests``."""
+    async def record(request):
+        requests.append(request)
+        response = handler(request)
+        return await response if asyncio.iscoroutine(response) else response
+    return httpx.AsyncClient(transport=httpx.MockTransport(record), **kwargs)
+
+
+def test_agr_client_caches_only_successful_responses():
+    """Repeated lookups are served from the cache; error responses are fetched again."""
+    def handler(request):
+        if request.url.path.endswith("/HGNC:404"):
+            return httpx.Response(404, text="not found")
+        return httpx.Response(200, json=GENE)
+
+    async def run():
+        requests = []
+        client = agr_server.AGRClient()
+        client._client = mock_client(handler, requests, base_url=client.base_url)
+        first = await client.get_gene_info("HGNC:1100")
+        second = await client.get_gene_info("HGNC:1100")
+        assert first == second == GENE
+        assert "error" in await client.get_gene_info("HGNC:404")
+        assert "error" in await client.get_gene_info("HGNC:404")
+        await client.aclose()
+        return [request.url.path for request in requests]
+
+    assert asyncio.run(run()) == ["/api/gene/HGNC:1100", "/api/gene/HGNC:404", "/api/gene/HGNC:404"]
+
+
+def test_agr_client_cancelled_caller_does_not_cancel_waiters():
+    """Cancelling the caller that started a coalesced fetch leaves the others their result."""
+    async def handler(request):
+        await asyncio.sleep(0.1)
+        return httpx.Response(200, json=GENE)
+
+    async def run():
+        requests = []
+        client = agr_server.AGRClient()
+        client._client = mock_client(handler, requests, base_url=client.base_url)
+        leader = asyncio.create_task(client.get_gene_info("HGNC:1100"))
+        await asyncio.sleep(0.01)
+        waiter = asyncio.create_task(client.get_gene_info("HGNC:1100"))
+        await asyncio.sleep(0.01)
+        leader.cancel()
+        assert await waiter == GENE
+        assert leader.cancelled()
+        await client.aclose()
+        return len(requests)
+
+    assert asyncio.run(run()) == 1
+
+
+def test_basic_gene_search_is_projected_and_cached():
+    """Streamed search hits keep only the display fields and share the GET cache."""
+    def handler(request):
+        return httpx.Response(200, json={"results": [dict(GENE, extra="x" * 100)], "total": 1})
+
+    async def run():
+        requests = []
+        client = agr_server_basic.AGRClient()
+        await client._client.aclose()
+        client._client = mock_client(handler, requests)
+        hits = await client.search_gene_hits("BRCA1", limit=5)
+        again = await client.search_gene_hits("BRCA1", limit=5)
+        await client.aclose()
+        return hits, again, len(requests)
+
+    hits, again, fetched = asyncio.run(run())
+    assert hits == again == [{"id": "HGNC:1100", "symbol": "BRCA1", "name": "BRCA1 DNA repair",
+                              "species": {"name": "Homo sapiens"}}]
+    assert fetched == 1
+
+
+def test_identifiers_with_trailing_newline_are_rejected():
+    """Gene and entity identifiers must match in full, not just up to a newline."""
+    for check in (agr_server_basic._quote_gene_id, agr_server_enhanced._checked_id):
+        assert check("HGNC:1100") == "HGNC:1100"
+        try:
+            check("HGNC:1100\n")
+        except ValueError:
+            pass
+        else:
+            raise AssertionError(f"{check.__name__} accepted a trailing newline")
+
+
+def test_documented_xenbase_id_is_accepted():
+    """Xenopus genes use the XENBASE: prefix documented in USAGE.md."""
+    for check in (agr_server_basic._quote_gene_id, agr_server_enhanced._checked_id):
+        assert check("XENBASE:XB-GENE-865049") == "XENBASE:XB-GENE-865049"
+
+
+def use_enhanced_transport(client, handler, requests):
+    """Route every origin the enhanced client talks to through ``handler``."""
+    for base_url in (client.base_url, client.jbrowse_url):
+        origin = agr_server_enhanced._origin(base_url)
+        client._clients[origin] = mock_client(handler, requests, base_url=origin)
+        client._sems[origin] = asyncio.Semaphore(4)
+
+
+def test_enhanced_stream_falls_back_to_the_whole_body():
+    """Streams yield the records at their item path, or the whole body when none match."""
+    bodies = {"/tracks": {"features": [{"start": 1}, {"start": 2}]}}
+
+    def handler(request):
+        return httpx.Response(200, json=bodies.get(request.url.path, {"tracks": []}))
+
+    async def collect(stream):
+        return [item async for item in stream]
+
+    async def run():
+        client = agr_server_enhanced.EnhancedAGRClient()
+        use_enhanced_transport(client, handler, [])
+        features = await collect(client.stream_jbrowse_data("human", "1", 1, 5))
+        literature = await collect(client.stream_gene_literature("HGNC:1100"))
+        await client.aclose()
+        return features, literature
+
+    features, literature = asyncio.run(run())
+    assert features == [{"start": 1}, {"start": 2}]
+    assert literature == [{"tracks": []}]
+
+
+def test_enhanced_partial_bundle_is_not_cached():
+    """A bundle with a failed part is rendered but kept out of the response cache."""
+    def handler(request):
+        if request.url.path.endswith("/diseases"):
+            return httpx.Response(404, text="not found")
+        return httpx.Response(200, json=GENE)
+
+    async def run():
+        requests = []
+        client = agr_server_enhanced.agr_client
+        use_enhanced_transport(client, handler, requests)
+        try:
+            for _ in range(2):
+                result = await agr_server_enhanced.call_tool("get_gene_bundle", {"gene_id": "HGNC:1100"})
+            cached = len(agr_server_enhanced._RESPONSE_CACHE)
+        finally:
+            await client.aclose()
+            client._cache.clear()
+            agr_server_enhanced._RESPONSE_CACHE.clear()
+        return result.content[0].text, cached, [r.url.path for r in requests]
+
+    text, cached, paths = asyncio.run(run())
+    assert '"error"' in text
+    assert cached == 0
+    # The failed part is retried; the parts that succeeded come from the client cache
+    assert paths.count("/api/gene/HGNC:1100/diseases") == 2
+    assert paths.count("/api/gene/HGNC:1100") == 1
+
+
+def test_enhanced_uncacheable_responses_skip_the_response_cache():
+    """Text built from a no-store reply or a POST query is fetched again on every call."""
+    def handler(request):
+        if request.method == "POST":
+            return httpx.Response(200, json={"rows": []})
+        return httpx.Response(200, json=GENE, headers={"Cache-Control": "no-store"})
+
+    async def run():
+        requests = []
+        client = agr_server_enhanced.agr_client
+        use_enhanced_transport(client, handler, requests)
+        try:
+            for _ in range(2):
+                await agr_server_enhanced.call_tool("get_gene_info", {"gene_id": "HGNC:1100"})
+                await agr_server_enhanced.call_tool("alliancemine_query", {"query_xml": "<query/>"})
+            cached = len(agr_server_enhanced._RESPONSE_CACHE)
+        finally:
+            await client.aclose()
+            client._cache.clear()
+            agr_server_enhanced._RESPONSE_CACHE.clear()
+        return cached, [request.method for request in requests]
+
+    cached, methods = asyncio.run(run())
+    assert cached == 0
+    assert methods == ["GET", "POST", "GET", "POST"]
+
+
+def test_working_search_without_results_list_dumps_the_body():
+    """A search body with no results list is shown as-is rather than as no hits."""
+    body = {"total": 0, "hits": []}
+
+    async def run():
+        client = agr_server_working.agr_client
+        client._client = mock_client(lambda request: httpx.Response(200, json=body), [],
+                                     base_url=client.base_url)
+        try:
+            result = await agr_server_working.call_tool("search_genes", {"query": "BRCA1"})
+        finally:
+            await client.aclose()
+            client._cache.clear()
+        return result.content[0].text
+
+    assert asyncio.run(run()) == f"Gene search results for 'BRCA1':\n\n{json.dumps(body, indent=2)}"
+
+
+def test_working_limit_follows_json_schema_integer():
+    """An integral float limit is accepted and sent as an int; a string limit is refused."""
+    def handler(request):
+        return httpx.Response(200, json={"results": [GENE]})
+
+    async def run():
+        requests = []
+        client = agr_server_working.agr_client
+        client._client = mock_client(handler, requests, base_url=client.base_url)
+        try:
+            accepted = await agr_server_working.call_tool("search_genes", {"query": "x", "limit": 3.0})
+            refused = await agr_server_working.call_tool("search_genes", {"query": "x", "limit": "5"})
+        finally:
+            await client.aclose()
+            client._cache.clear()
+        return accepted, refused, requests
+
+    accepted, refused, requests = asyncio.run(run())
+    assert accepted.content[0].text.startswith("Found 1 genes for 'x'")
+    assert requests[0].url.params["limit"] == "3"
+    assert refused.isError
+    assert len(requests) == 1
+
+
+def test_working_zero_limit_reads_the_whole_search_body():
+    """A zero limit finds no genes instead of parsing the body cut off after one chunk."""
+    # The first chunk holds no record, so stopping there would leave a partial body
+    body = {"aggregations": "x" * 100000, "results": [GENE]}
+
+    async def run():
+        client = agr_server_working.agr_client
+        client._client = mock_client(lambda request: httpx.Response(200, json=body), [],
+                                     base_url=client.base_url)
+        try:
+            result = await agr_server_working.call_tool("search_genes", {"query": "BRCA1", "limit": 0})
+        finally:
+            await client.aclose()
+            client._cache.clear()
+        return result.content[0].text
+
+    assert asyncio.run(run()) == "No genes found for 'BRCA1'"
+
+
+class FakeRedis:
+    """In-memory stand-in for redis.asyncio; keys in ``broken`` raise on get."""
+
+    def __init__(self, url, **kwargs):
+        self.options = kwargs
+        self.store = {}
+        self.broken = set()
+
+    async def get(self, key):
+        if key in self.broken:
+            raise TimeoutError("Timeout reading from socket")
+        return self.store.get(key)
+
+    async def set(self, key, value, ex=None):
+        self.store[key] = value
+
+    async def aclose(self):
+        pass
+
+
+def test_minimal_redis_cache_falls_through_on_misses_and_errors(monkeypatch):
+    """Redis hits skip the API; misses, undecodable entries and errors fetch from it."""
+    monkeypatch.setattr(agr_server_minimal, "aioredis", type("aioredis", (), {"from_url": FakeRedis}))
+    pack = agr_server_minimal._pack
+
+    async def run():
+        requests = []
+        client = agr_server_minimal.CachedAGRClient("redis://fake")
+        client._client = mock_client(lambda request: httpx.Response(200, json=GENE), requests,
+                                     base_url=client.base_url)
+        redis = client._redis
+        hit = {"id": "HGNC:1", "symbol": "CACHED"}
+        redis.store[client._cache_key("/gene/HGNC:1", None)] = pack(hit)
+        redis.store[client._cache_key("/gene/HGNC:2", None)] = b"\xc1"
+        redis.broken.add(client._cache_key("/gene/HGNC:3", None))
+        results = [await client.get_gene_info(f"HGNC:{n}") for n in (1, 2, 3, 4)]
+        await client.aclose()
+        return redis, results, [request.url.path for request in requests]
+
+    redis, results, paths = asyncio.run(run())
+    assert redis.options == {"socket_timeout": 0.2, "socket_connect_timeout": 0.2}
+    assert results == [{"id": "HGNC:1", "symbol": "CACHED"}, GENE, GENE, GENE]
+    assert paths == ["/api/gene/HGNC:2", "/api/gene/HGNC:3", "/api/gene/HGNC:4"]
+    # Fetched entries are written back, replacing the undecodable one
+    assert agr_server_minimal._unpack(redis.store[agr_server_minimal.CachedAGRClient._cache_key("/gene/HGNC:2", None)]) == GENE
+
+
+def run_stdio(script, lines, tmp_path):
+    """Run ``script`` with stdin and stdout redirected to regular files."""
+    stdin_path = tmp_path / "requests.jsonl"
+    stdout_path = tmp_path / "responses.jsonl"
+    stdin_path.write_text("".join(json.dumps(line) + "\n" for line in lines))
+    with open(stdin_path) as stdin, open(stdout_path, "w") as stdout:
+        proc = subprocess.run([sys.executable, os.path.join(SRC, script)], stdin=stdin,
+                              stdout=stdout, stderr=subprocess.DEVNULL, timeout=60)
+    return proc.returncode, [json.loads(line) for line in stdout_path.read_text().splitlines()]
+
+
+def test_stdio_servers_accept_regular_files(tmp_path):
+    """The raw JSON-RPC servers read from and write to regular files, not just pipes."""
+    initialize = {"jsonrpc": "2.0", "id": 1, "method": "initialize", "params": {}}
+    for script in ("agr_server.py", "agr_server_raw.py", "agr_server_minimal.py"):
+        returncode, responses = run_stdio(script, [initialize], tmp_path)
+        assert returncode == 0, script
+        assert [response["id"] for response in responses] == [1], script
+        assert "serverInfo" in responses[0]["result"], script
+
+
+def test_stdio_non_object_request_is_invalid(tmp_path):
+    """A JSON line that is not an object gets -32600 Invalid Request."""
+    returncode, responses = run_stdio("agr_server.py", [[1]], tmp_path)
+    assert returncode == 0
+    assert responses == [{"jsonrpc": "2.0", "id": None,
+                          "error": {"code": -32600, "message": "Invalid Request"}}]
+
+
+if __name__ == "__main__":
+    import pytest
+    sys.exit(pytest.main([__file__, "-q"]))